@@ -0,0 +1,441 @@
+# 분석 엔진: Streamlit 없이도 동작하는 pandas/numpy 계산 모음
+# (streamlit_app.py 의 페이지 함수들은 이 모듈의 결과를 화면에 그리기만 합니다)
+import bisect
+import heapq
+import warnings
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+from scipy.cluster import hierarchy
+from scipy.spatial.distance import squareform
+
+
+# 1. 학술 데이터 성장 지표
+# 모든 키워드 열을 (연도 x 키워드) 행렬 하나로 묶어 한 번에 계산합니다.
+SCHOLAR_METRIC_COLUMNS = ["latest", "yoy", "yoy_pct", "acceleration", "growth_pct", "cagr_pct", "mean", "peak_year", "share_pct"]
+
+def scholar_growth_metrics(df_research, year_col="Year"):
+    df = df_research.sort_values(year_col)
+    keywords = [col for col in df.columns if col != year_col]
+    years = df[year_col].to_numpy()
+    counts = df[keywords].to_numpy(dtype=float)
+
+    if len(years) == 0 or not keywords:
+        return pd.DataFrame(columns=SCHOLAR_METRIC_COLUMNS, index=pd.Index(keywords, name="keyword"))
+
+    first, last = counts[0], counts[-1]
+    n_periods = years[-1] - years[0]
+    # 직전 두 해의 증감 (연도가 부족하면 NaN)
+    prev = counts[-2] if len(counts) >= 2 else np.full_like(last, np.nan)
+    prev2 = counts[-3] if len(counts) >= 3 else np.full_like(last, np.nan)
+    yoy = last - prev
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        yoy_pct = np.where(prev > 0, yoy / prev * 100, np.nan)
+        growth_pct = np.where(first > 0, (last - first) / first * 100, np.nan)
+        if n_periods > 0:
+            cagr_pct = np.where((first > 0) & (last >= 0), ((last / first) ** (1 / n_periods) - 1) * 100, np.nan)
+        else:
+            cagr_pct = np.full_like(last, np.nan)
+        total = last.sum()
+        share_pct = last / total * 100 if total > 0 else np.full_like(last, np.nan)
+
+    metrics = pd.DataFrame({
+        "latest": last,
+        "yoy": yoy,
+        "yoy_pct": yoy_pct,
+        # 가속도: 올해 증가분 - 작년 증가분 (2차 차분)
+        "acceleration": yoy - (prev - prev2),
+        "growth_pct": growth_pct,
+        "cagr_pct": cagr_pct,
+        "mean": counts.mean(axis=0),
+        "peak_year": years[np.argmax(counts, axis=0)],
+        "share_pct": share_pct,
+    }, index=pd.Index(keywords, name="keyword"))
+    return metrics
+
+
+# 2. 구글 트렌드 데이터 정리
+# 'Date' 열을 인덱스로, '<1' 같은 문자열 값을 숫자로 바꿉니다.
+def clean_trend_frame(df):
+    df = df.copy()
+    if 'Date' in df.columns:
+        df['Date'] = pd.to_datetime(df['Date'])
+        df = df.set_index('Date')
+    else:
+        df.index = pd.to_datetime(df.index)
+
+    df.columns = [col.replace(' (South Korea)', '') for col in df.columns]
+
+    for col in df.columns:
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col].astype(str).str.replace('<1', '0').str.replace(',', ''), errors='coerce').fillna(0)
+    return df
+
+
+# 트렌드 점수 검증 (구글 트렌드 관심도는 0~100)
+def validate_trend_frame(df):
+    values = df.to_numpy(dtype=float)
+    bad = (values < 0) | (values > 100)
+    if bad.any():
+        row, col = np.argwhere(bad)[0]
+        raise ValueError(f"트렌드 점수는 0~100 범위여야 합니다: {df.index[row]} / {df.columns[col]} = {values[row, col]}")
+
+
+# 3. 선행-후행(Lead-Lag) 분석
+# 연 단위 논문 수와 주 단위 트렌드를 공통 시간 격자에 맞춘 뒤,
+# 모든 (연구 주제, 트렌드 키워드) 쌍의 시차별 상관계수를 FFT 와 누적합으로 구합니다. (트렌드 열은 블록 단위)
+def align_on_grid(df_research, df_trend, freq="YS", year_col="Year"):
+    research = df_research.set_index(pd.to_datetime(df_research[year_col].astype(str), format="%Y"))
+    research = research.drop(columns=year_col).astype(float).sort_index()
+
+    # 일부 주만 포함된 구간(예: 12월에 시작한 첫 해)은 평균이 왜곡되므로 제외
+    trend = df_trend.astype(float).resample(freq).mean()
+    weeks = df_trend.iloc[:, 0].resample(freq).count()
+    trend = trend[weeks >= weeks.median() * 0.5]
+
+    grid = trend.index[(trend.index >= research.index.min()) & (trend.index <= research.index.max())]
+    research = research.reindex(research.index.union(grid)).interpolate("time").reindex(grid)
+    return research, trend.reindex(grid)
+
+
+MIN_OVERLAP_FRACTION = 0.5   # 시차를 둔 두 구간이 전체 길이의 절반 이상 겹칠 때만 비교
+MIN_OVERLAP_POINTS = 4       # 3개 점의 상관계수는 거의 항상 ±1 에 가까우므로 최소 4개
+LEAD_LAG_BLOCK = 1 << 22     # 한 번에 만드는 (주파수 x 연구 x 트렌드) 복소 배열 원소 수 상한
+
+
+def _lag_range(n, max_lag=None, min_overlap=MIN_OVERLAP_FRACTION):
+    if max_lag is None:
+        max_lag = max(1, n // 2)
+    # 최소 MIN_OVERLAP_POINTS 개, 그리고 전체의 min_overlap 이상 구간이 겹치는 시차까지만 비교
+    min_len = max(MIN_OVERLAP_POINTS, int(np.ceil(min_overlap * n)))
+    max_lag = max(0, min(max_lag, n - min_len))
+    return np.arange(-max_lag, max_lag + 1)
+
+
+# 시차별 겹치는 구간의 합 / 제곱합 (누적합으로 모든 시차를 한 번에)
+def _window_sums(values, starts, ends):
+    csum = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+    csq = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values ** 2, axis=0)])
+    return csum[ends] - csum[starts], csq[ends] - csq[starts]
+
+
+def _nonzero_var(var, sq_sum):
+    return np.where(var > 1e-10 * sq_sum, var, np.nan)
+
+
+# 트렌드 열을 나눠 (시차 x 연구 x 트렌드 블록) 상관계수를 차례로 내보냄
+def _cross_correlation_blocks(x, y, lags):
+    n = x.shape[0]
+    # 전체 평균을 빼 두면 합의 차가 작아져 수치 오차가 줄어듦 (피어슨 상관계수는 변하지 않음)
+    x = x - x.mean(axis=0)
+    y = y - y.mean(axis=0)
+    n_fft = 1 << (2 * n - 1).bit_length()
+    fx = np.conj(np.fft.rfft(x, n=n_fft, axis=0))
+
+    m = (n - np.abs(lags)).astype(float)[:, None]
+    sx, sxx = _window_sums(x, np.maximum(-lags, 0), n - np.maximum(lags, 0))
+    sy_all, syy_all = _window_sums(y, np.maximum(lags, 0), n + np.minimum(lags, 0))
+    # 겹치는 구간에서 값이 변하지 않는 계열은 상관계수를 0 으로 둠
+    var_x = _nonzero_var(sxx - sx ** 2 / m, sxx)
+
+    step = max(1, LEAD_LAG_BLOCK // max(1, (n_fft // 2 + 1) * x.shape[1]))
+    for start in range(0, y.shape[1], step):
+        cols = slice(start, start + step)
+        fy = np.fft.rfft(y[:, cols], n=n_fft, axis=0)
+        sxy = np.fft.irfft(fx[:, :, None] * fy[:, None, :], n=n_fft, axis=0)[lags % n_fft]
+        sy = sy_all[:, cols]
+        var_y = _nonzero_var(syy_all[:, cols] - sy ** 2 / m, syy_all[:, cols])
+        cov = sxy - sx[:, :, None] * sy[:, None, :] / m[:, :, None]
+        r = np.nan_to_num(cov / np.sqrt(var_x[:, :, None] * var_y[:, None, :]))
+        yield cols, np.clip(r, -1.0, 1.0)
+
+
+def cross_correlation_fft(x, y, max_lag=None, min_overlap=MIN_OVERLAP_FRACTION):
+    # x: (n, p), y: (n, q) -> lags, r[lag, p, q]
+    # r[k, i, j] 는 겹치는 구간에서 x_i(t) 와 y_j(t + k) 의 피어슨 상관계수 (k > 0 이면 x 가 k 기간 선행)
+    # 곱의 합은 FFT 로, 구간별 평균/분산은 누적합으로 구하며 트렌드 열을 블록으로 나눠 메모리를 제한
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    lags = _lag_range(x.shape[0], max_lag, min_overlap)
+    r = np.empty((len(lags), x.shape[1], y.shape[1]))
+    for cols, block in _cross_correlation_blocks(x, y, lags):
+        r[:, :, cols] = block
+    return lags, r
+
+
+def lead_lag_table(df_research, df_trend, freq="YS", max_lag=None, year_col="Year", min_overlap=MIN_OVERLAP_FRACTION):
+    research, trend = align_on_grid(df_research, df_trend, freq=freq, year_col=year_col)
+    columns = ["research", "trend", "best_lag", "strength", "n_periods"]
+    if len(research) < 3:
+        return pd.DataFrame(columns=columns)
+
+    x, y = research.to_numpy(dtype=float), trend.to_numpy(dtype=float)
+    lags = _lag_range(len(research), max_lag, min_overlap)
+    best_lag = np.empty((x.shape[1], y.shape[1]), dtype=lags.dtype)
+    strength = np.empty((x.shape[1], y.shape[1]))
+    # 블록마다 가장 강한 시차만 남겨 (시차 x 연구 x 트렌드) 전체를 한 번에 들고 있지 않음
+    for cols, r in _cross_correlation_blocks(x, y, lags):
+        best = np.abs(r).argmax(axis=0)
+        best_lag[:, cols] = lags[best]
+        strength[:, cols] = np.take_along_axis(r, best[None], axis=0)[0]
+
+    rows, cols = np.meshgrid(research.columns, trend.columns, indexing="ij")
+    table = pd.DataFrame({
+        "research": rows.ravel(),
+        "trend": cols.ravel(),
+        "best_lag": best_lag.ravel(),
+        "strength": strength.ravel(),
+        "n_periods": len(research),
+    }, columns=columns)
+    return table.sort_values("strength", key=np.abs, ascending=False, ignore_index=True)
+
+
+# 4. 최근 N주 요약 (모든 키워드 동시 계산)
+def recent_summary(df, window=4):
+    latest = df.iloc[-1].astype(float)
+    mean = df.iloc[-window:].mean()
+    return pd.DataFrame({"latest": latest, "mean": mean, "delta": latest - mean}, index=pd.Index(df.columns, name="keyword"))
+
+
+# 5. 키워드 상관관계 쌍
+# 상관행렬의 위쪽 삼각형을 한 번에 펼쳐 (a, b, r) 표로 만듭니다.
+def correlation_pairs(df, keywords=None):
+    keywords = list(df.columns if keywords is None else keywords)
+    corr = df[keywords].corr().to_numpy()
+    rows, cols = np.triu_indices(len(keywords), k=1)
+    names = np.asarray(keywords, dtype=object)
+    return pd.DataFrame({"a": names[rows], "b": names[cols], "r": corr[rows, cols]})
+
+
+# 절댓값 기준 상위 k 쌍만 (|r| 내림차순) — 키워드가 많을 때 k² 개짜리 쌍 표를 만들지 않도록 argpartition 으로 고름
+# 하이라이트 세 쌍(최대 양/음, 최소 |r|)도 함께 넣어 correlation_highlights 결과가 전체 표와 같게 합니다.
+def top_correlation_pairs(df, k, keywords=None):
+    keywords = list(df.columns if keywords is None else keywords)
+    n = len(keywords)
+    corr = np.array(df[keywords].corr(), dtype=float)   # 아래 삼각형을 지우므로 쓰기 가능한 사본
+    corr[np.tril_indices(n)] = np.nan
+    flat = corr.ravel()
+    missing = np.isnan(flat)
+    if missing.all():
+        return pd.DataFrame({"a": pd.Series(dtype=object), "b": pd.Series(dtype=object), "r": pd.Series(dtype=float)})
+
+    strength = np.abs(flat)
+    strength[missing] = np.inf
+    extremes = [np.nanargmax(flat), np.nanargmin(flat), np.argmin(strength)]
+    strength[missing] = -1
+    k = min(k, int((~missing).sum()))
+    picks = np.union1d(np.argpartition(strength, strength.size - k)[strength.size - k:], extremes)
+    picks = picks[np.argsort(-strength[picks], kind="stable")]
+
+    rows, cols = np.divmod(picks, n)
+    names = np.asarray(keywords, dtype=object)
+    return pd.DataFrame({"a": names[rows], "b": names[cols], "r": flat[picks]})
+
+
+# 최고 시너지 / 상반된 흐름 / 독립적 관계 쌍 (표의 행 번호)
+def correlation_highlights(pairs):
+    r = pairs["r"].to_numpy()
+    if len(r) == 0 or np.isnan(r).all():
+        return {}
+    return {
+        "max_positive": int(np.nanargmax(r)),
+        "max_negative": int(np.nanargmin(r)),
+        "independent": int(np.nanargmin(np.abs(r))),
+    }
+
+
+# 6. 계절성 (연도 x 주차 정렬)
+# 주간 시계열 전체를 ISO (연도, 주차) 위치에 한 번에 흩뿌려 (연도 x 53주 x 키워드) 배열을 만들고,
+# 연도별 평균을 뺀 편차를 연도 방향으로 평균내 모든 키워드의 계절 프로파일을 동시에 구합니다.
+SEASON_WEEKS = 53
+SEASON_MIN_WEEKS = 26   # 이만큼 이상 관측된 연도만 계절 프로파일에 사용 (앞뒤로 잘린 해 제외)
+
+def seasonal_cube(df):
+    iso = df.index.isocalendar()
+    years, year_pos = np.unique(iso["year"].to_numpy(), return_inverse=True)
+    week_pos = iso["week"].to_numpy().astype(np.intp) - 1
+    cube = np.full((len(years), SEASON_WEEKS, df.shape[1]), np.nan)
+    cube[year_pos, week_pos] = df.to_numpy(dtype=float)
+    return cube, years, week_pos
+
+
+def seasonal_profile(cube, min_weeks=SEASON_MIN_WEEKS):
+    observed = np.isfinite(cube).any(axis=2).sum(axis=1)
+    usable = cube[observed >= min_weeks] if (observed >= min_weeks).any() else cube
+    with warnings.catch_warnings():
+        # 관측이 없는 (연도, 주차) 칸은 NaN 평균 -> 경고 대신 NaN 으로 둠
+        warnings.simplefilter("ignore", RuntimeWarning)
+        deviation = usable - np.nanmean(usable, axis=1, keepdims=True)
+        profile = np.nanmean(deviation, axis=0)
+
+    # 53주차처럼 어느 해에도 없는 주는 직전 주 값으로 채우고, 주 평균이 0 이 되도록 맞춤
+    valid = np.isfinite(profile).all(axis=1)
+    fill_from = np.maximum.accumulate(np.where(valid, np.arange(len(profile)), 0))
+    profile = np.nan_to_num(profile[fill_from])
+    return profile - profile.mean(axis=0)
+
+
+# 결과: cube (연도 x 53 x 키워드), years, profile (주차 x 키워드 표), adjusted (계절 조정 시계열)
+def seasonal_decomposition(df, min_weeks=SEASON_MIN_WEEKS):
+    cube, years, week_pos = seasonal_cube(df)
+    profile = seasonal_profile(cube, min_weeks)
+    adjusted = pd.DataFrame(df.to_numpy(dtype=float) - profile[week_pos], index=df.index, columns=df.columns)
+    return {
+        "cube": cube,
+        "years": years,
+        "profile": pd.DataFrame(profile, index=pd.RangeIndex(1, SEASON_WEEKS + 1, name="week"), columns=df.columns),
+        "adjusted": adjusted,
+    }
+
+
+# 7. 상관행렬 계층적 군집
+# 상관 거리(1 - r)로 평균 연결 군집을 만들어 비슷하게 움직이는 키워드끼리 붙도록 순서를 정하고,
+# 키워드가 많을 때는 군집 단위 평균 상관으로 묶은 블록 행렬을 만듭니다.
+def correlation_distance(corr):
+    # 값이 일정해 상관을 정의할 수 없는 키워드(NaN)는 다른 모든 키워드와 무관(r=0)으로 취급
+    dist = 1 - np.nan_to_num(np.asarray(corr, dtype=float), nan=0.0)
+    dist = np.clip((dist + dist.T) / 2, 0, 2)
+    np.fill_diagonal(dist, 0)
+    return squareform(dist, checks=False)
+
+
+def correlation_linkage(corr, method="average"):
+    if len(corr) < 2:
+        return np.empty((0, 4)), np.arange(len(corr))
+    linkage_matrix = hierarchy.linkage(correlation_distance(corr), method=method)
+    return linkage_matrix, hierarchy.leaves_list(linkage_matrix)
+
+
+# 블록 행렬: (군집 x 군집) 평균 상관 + 키워드별 군집 번호
+def correlation_blocks(corr, linkage_matrix, n_blocks):
+    labels = hierarchy.fcluster(linkage_matrix, t=n_blocks, criterion="maxclust")
+    # 군집 번호를 덴드로그램 잎 순서대로 다시 매김
+    clusters = pd.unique(labels[hierarchy.leaves_list(linkage_matrix)])
+    onehot = (labels[:, None] == clusters[None, :]).astype(float)
+    sizes = onehot.sum(axis=0)
+    values = np.nan_to_num(corr.to_numpy(dtype=float))
+    blocks = onehot.T @ values @ onehot / np.outer(sizes, sizes)
+    names = np.array([f"군집 {i + 1} ({int(n)}개)" for i, n in enumerate(sizes)], dtype=object)
+    membership = pd.Series(names[onehot.argmax(axis=1)], index=corr.index, name="cluster")
+    return pd.DataFrame(blocks, index=names, columns=names), membership
+
+
+# 8. 시간 피라미드 (주 -> 월 -> 분기 -> 연 집계 단계)
+# 단계별 평균을 미리 만들어 두고, 날짜 범위의 경계는 정렬된 인덱스에서 이진 탐색으로 찾습니다.
+# 범위 안의 점 수가 PYRAMID_MAX_POINTS 이하인 가장 촘촘한 단계를 고르므로
+# 전체 기간이 얼마나 길든 그리는 점 수와 탐색 비용은 일정합니다.
+PYRAMID_LEVELS = [("W", None), ("M", "MS"), ("Q", "QS"), ("Y", "YS")]
+PYRAMID_LABELS = {"W": "주간", "M": "월간 평균", "Q": "분기 평균", "Y": "연간 평균"}
+PYRAMID_MAX_POINTS = 400
+
+def build_time_pyramid(df):
+    df = df.sort_index()
+    pyramid = {}
+    for level, freq in PYRAMID_LEVELS:
+        pyramid[level] = df if freq is None else df.resample(freq).mean()
+    return pyramid
+
+
+def _range_bounds(index, start, end, bucketed):
+    values = index.to_numpy()
+    start, end = (np.datetime64(pd.Timestamp(t)).astype(values.dtype) for t in (start, end))
+    if bucketed:
+        # 집계 단계는 시작일이 속한 구간(시작 라벨이 start 이전인 마지막 구간)부터 포함
+        lo = max(np.searchsorted(values, start, side="right") - 1, 0)
+    else:
+        lo = np.searchsorted(values, start, side="left")
+    hi = np.searchsorted(values, end, side="right")
+    return lo, hi
+
+
+# (선택된 단계, 범위 안의 행) — level 을 주면 그 단계 그대로 사용
+def pyramid_slice(pyramid, start, end, level=None, max_points=PYRAMID_MAX_POINTS):
+    candidates = [level] if level else [name for name, _ in PYRAMID_LEVELS if name in pyramid]
+    for name in candidates:
+        frame = pyramid[name]
+        lo, hi = _range_bounds(frame.index, start, end, bucketed=name != "W")
+        if hi - lo <= max_points or name == candidates[-1]:
+            return name, frame.iloc[lo:hi]
+
+
+# 9. 키워드 검색 색인 + 급상승 신호
+# 키워드가 수천 개여도 브라우저에 전체 목록을 보내지 않도록 서버에서 찾습니다.
+# 소문자로 정리한 이름마다 (글자 1~2-gram -> 키워드 번호) 역색인과 단어 시작 위치의 정렬 목록을 만들어 두고,
+# 접두어는 정렬 목록에서 이진 탐색으로, 부분 문자열은 검색어 n-gram 후보의 교집합을 실제 포함 여부로 확인해 찾습니다.
+KEYWORD_NGRAM = 2
+MOMENTUM_WINDOW = 4   # 최근 4주 평균을
+MOMENTUM_BASE = 12    # 그 직전 12주 평균과 비교
+
+def _normalize_keyword(text):
+    return " ".join(str(text).lower().split())
+
+
+def build_keyword_index(keywords, n=KEYWORD_NGRAM):
+    names = [str(keyword) for keyword in keywords]
+    normalized = [_normalize_keyword(name) for name in names]
+    grams = {}
+    starts = []
+    for i, name in enumerate(normalized):
+        for size in range(1, n + 1):
+            for j in range(len(name) - size + 1):
+                grams.setdefault(name[j:j + size], set()).add(i)
+        starts.extend((name[j:], i) for j in range(len(name)) if j == 0 or name[j - 1] == " ")
+    return {
+        "names": names,
+        "normalized": normalized,
+        "grams": {gram: np.array(sorted(ids), dtype=np.int64) for gram, ids in grams.items()},
+        "starts": sorted(starts),
+        "n": n,
+    }
+
+
+# 검색 결과 (이름 목록): 이름 일치 > 이름 접두어 > 단어 접두어 > 부분 문자열 순, 같은 순위는 모멘텀이 큰 순
+def search_keywords(index, query, limit=50, momentum=None):
+    query = _normalize_keyword(query)
+    if not query:
+        return []
+    normalized = index["normalized"]
+
+    starts = index["starts"]
+    lo = bisect.bisect_left(starts, (query,))
+    word_prefix = set()
+    while lo < len(starts) and starts[lo][0].startswith(query):
+        word_prefix.add(starts[lo][1])
+        lo += 1
+
+    size = min(len(query), index["n"])
+    postings = [index["grams"].get(query[j:j + size]) for j in range(len(query) - size + 1)]
+    substring = set()
+    if all(p is not None for p in postings):
+        candidates = reduce(np.intersect1d, sorted(postings, key=len))
+        substring = {i for i in candidates.tolist() if query in normalized[i]}
+
+    strength = np.zeros(len(normalized)) if momentum is None else np.nan_to_num(np.asarray(momentum, dtype=float), nan=-np.inf)
+
+    def rank(i):
+        name = normalized[i]
+        tier = 0 if name == query else 1 if name.startswith(query) else 2 if i in word_prefix else 3
+        return tier, -strength[i], name
+
+    return [index["names"][i] for i in heapq.nsmallest(limit, word_prefix | substring, key=rank)]
+
+
+# 키워드별 모멘텀: 최근 window 주 평균 - 직전 base 주 평균 (모든 키워드 동시 계산)
+def keyword_momentum(df, window=MOMENTUM_WINDOW, base=MOMENTUM_BASE):
+    values = df.to_numpy(dtype=float)
+    recent = values[-window:].mean(axis=0) if len(values) else np.full(values.shape[1], np.nan)
+    previous = values[-(window + base):-window]
+    previous = previous.mean(axis=0) if len(previous) else np.full(values.shape[1], np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.where(previous > 0, (recent - previous) / previous * 100, np.nan)
+    return pd.DataFrame({"recent": recent, "previous": previous, "momentum": recent - previous, "momentum_pct": pct},
+                        index=pd.Index(df.columns, name="keyword"))
+
+
+# 상위 k 개 (힙 선택, 전체 정렬 없이 O(n log k)) — largest=False 면 급하락 순
+def top_movers(momentum, k=10, column="momentum", largest=True):
+    values = momentum[column].to_numpy(dtype=float)
+    valid = np.flatnonzero(~np.isnan(values)).tolist()
+    pick = heapq.nlargest if largest else heapq.nsmallest
+    return momentum.iloc[pick(k, valid, key=values.__getitem__)]
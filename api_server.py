@@ -0,0 +1,207 @@
+# 로컬 JSON 분석 API (사이드카)
+# Streamlit 화면과 같은 분석 계층(service.AnalyticsService)의 결과를 JSON 으로 제공합니다.
+# 응답마다 데이터 버전 기반 ETag 를 붙여 If-None-Match 가 맞으면 304 로 본문을 생략하고,
+# Accept-Encoding 에 gzip 이 있으면 압축해서 보냅니다(압축본은 별도 ETag). 직렬화·압축 결과는
+# (경로, 엔드포인트가 쓰는 파라미터) 별로 데이터 버전과 함께 크기 제한 LRU 에 캐시합니다.
+#
+#   python api_server.py --port 8502
+#   curl -s localhost:8502/api/trends/summary
+import argparse
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import analytics
+import service
+
+GZIP_MIN_BYTES = 1024
+DEFAULT_TOP_PAIRS = 100     # keywords 없이 부르면 |r| 상위 이만큼만 (전체 k² 쌍을 직렬화하지 않음)
+MAX_TOP_PAIRS = 10000
+API_CACHE_SIZE = 256        # 캐시해 둘 응답 수 (쿼리 조합이 아무리 많아도 이 이상 늘지 않음)
+
+
+def _frame_json(df, orient="records"):
+    return df.to_json(orient=orient, date_format="iso", force_ascii=False)
+
+
+def _envelope(version, data_json):
+    return '{"version": %s, "data": %s}' % (json.dumps(version), data_json)
+
+
+# 엔드포인트: 경로 -> (설명, 함수(service, query) -> JSON 문자열, 쓰는 쿼리 파라미터)
+def _trends(svc, query):
+    return _frame_json(svc.trends(), orient="split")
+
+
+def _positive_int(query, name, default):
+    value = int(query.get(name, [str(default)])[0])
+    if value <= 0:
+        raise ValueError(f"{name} must be a positive integer")
+    return value
+
+
+def _trend_summary(svc, query):
+    window = _positive_int(query, "window", 4)
+    return _frame_json(svc.trend_summary(window).reset_index())
+
+
+def _correlations(svc, query):
+    keywords = [k for k in query.get("keywords", [""])[0].split(",") if k]
+    unknown = [k for k in keywords if k not in svc.trends().columns]
+    if unknown:
+        raise KeyError(f"unknown keywords: {', '.join(unknown)}")
+    if keywords and "top" not in query:
+        pairs = svc.correlation_pairs(keywords)
+    else:
+        top = _positive_int(query, "top", DEFAULT_TOP_PAIRS)
+        if top > MAX_TOP_PAIRS:
+            raise ValueError(f"top must be at most {MAX_TOP_PAIRS}")
+        pairs = svc.top_correlation_pairs(top, keywords or None)
+    highlights = {name: pairs.iloc[row].to_dict() for name, row in analytics.correlation_highlights(pairs).items()}
+    return '{"pairs": %s, "highlights": %s}' % (_frame_json(pairs), json.dumps(highlights, ensure_ascii=False, default=float))
+
+
+def _companies(svc, query):
+    df_map, details = svc.companies()
+    records = df_map.to_dict(orient="records")
+    by_rank = {detail["순위"]: detail for detail in details}
+    for record in records:
+        record.update({k: v for k, v in by_rank.get(record["순위"], {}).items() if k not in record})
+    return json.dumps(records, ensure_ascii=False, default=lambda value: value.item() if hasattr(value, "item") else str(value))
+
+
+def _scholar_metrics(svc, query):
+    return _frame_json(svc.scholar_metrics().reset_index())
+
+
+def _lead_lag(svc, query):
+    freq = query.get("freq", ["YS"])[0]
+    if freq not in ("YS", "QS", "MS"):
+        raise KeyError("freq must be one of YS, QS, MS")
+    return _frame_json(svc.lead_lag(freq))
+
+
+ENDPOINTS = {
+    "/api/trends": ("정리된 주간 트렌드 시계열", _trends, ()),
+    "/api/trends/summary": ("키워드별 최근 N주 요약 (?window=4)", _trend_summary, ("window",)),
+    "/api/correlations": ("키워드 상관관계 쌍과 하이라이트 (?keywords=A,B 또는 ?top=100, 기본은 |r| 상위 100쌍)", _correlations,
+                          ("keywords", "top")),
+    "/api/companies": ("기업 레지스트리 (좌표 + 상세 정보)", _companies, ()),
+    "/api/scholar/metrics": ("연구 키워드별 성장 지표", _scholar_metrics, ()),
+    "/api/lead-lag": ("연구-트렌드 선행/후행 분석 (?freq=YS|QS|MS)", _lead_lag, ("freq",)),
+}
+
+
+# 캐시 키용 파라미터: 엔드포인트가 쓰는 것만 (이름, 첫 번째 값) 으로 — 모르는 파라미터(?x=1)는 같은 응답을 공유
+def _normalize_query(path, query_string):
+    query = parse_qs(query_string)
+    params = ENDPOINTS[path][2] if path in ENDPOINTS else ()
+    return tuple((name, query[name][0].strip()) for name in params if name in query)
+
+
+class AnalyticsAPI:
+    def __init__(self, svc=None, cache_size=API_CACHE_SIZE):
+        self.service = svc or service.AnalyticsService()
+        self.cache_size = cache_size
+        self._bodies = OrderedDict()   # (경로, 파라미터) -> [버전, 본문, ETag, gzip 본문 또는 None]
+        self._lock = threading.Lock()
+
+    def _data(self, path, params, version):
+        if path in ("/api", "/api/"):
+            return json.dumps({p: desc for p, (desc, _, _) in ENDPOINTS.items()}, ensure_ascii=False)
+        if path == "/api/version":
+            return json.dumps(version)
+        return ENDPOINTS[path][1](self.service, {name: [value] for name, value in params})
+
+    # (상태 코드, 본문 bytes, ETag, Content-Encoding) — 같은 (버전, 경로, 파라미터) 는 다시 직렬화·압축하지 않음
+    def respond(self, path, query_string, accept_gzip=False):
+        if path not in ENDPOINTS and path not in ("/api", "/api/", "/api/version"):
+            return 404, json.dumps({"error": f"not found: {path}"}).encode(), None, None
+        version = self.service.version()
+        params = _normalize_query(path, query_string)
+        key = (path, params)
+        with self._lock:
+            cached = self._bodies.get(key)
+            if cached is not None and cached[0] == version:
+                self._bodies.move_to_end(key)
+            else:
+                cached = None
+
+        if cached is None:
+            try:
+                data = self._data(path, params, version)
+            except (KeyError, ValueError) as e:
+                return 400, json.dumps({"error": str(e).strip("'\"")}, ensure_ascii=False).encode(), None, None
+            body = _envelope(version, data).encode("utf-8")
+            etag = '"%s-%s"' % (version, hashlib.sha1(repr(key).encode()).hexdigest()[:8])
+            cached = [version, body, etag, None]
+            with self._lock:
+                # 이전 버전 응답은 버리고, 남은 것도 오래 안 쓴 순서로 상한까지만 유지
+                for old in [k for k, v in self._bodies.items() if v[0] != version]:
+                    del self._bodies[old]
+                self._bodies[key] = cached
+                while len(self._bodies) > self.cache_size:
+                    self._bodies.popitem(last=False)
+
+        version, body, etag, gzipped = cached
+        if not accept_gzip or len(body) < GZIP_MIN_BYTES:
+            return 200, body, etag, None
+        if gzipped is None:
+            # 압축본도 함께 캐시 (동시에 두 번 만들어져도 결과가 같으므로 잠금 없이 기록)
+            gzipped = cached[3] = gzip.compress(body, compresslevel=6)
+        # 내용 인코딩이 다르면 다른 표현이므로 ETag 도 구분
+        return 200, gzipped, etag[:-1] + '-gz"', "gzip"
+
+
+def make_handler(api):
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "ExplorerAnalyticsAPI/1.0"
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            status, body, etag, encoding = api.respond(url.path.rstrip("/") or "/", url.query,
+                                                       "gzip" in self.headers.get("Accept-Encoding", ""))
+
+            if etag and etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Vary", "Accept-Encoding")
+            if etag:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분석 결과를 JSON 으로 제공하는 로컬 API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(AnalyticsAPI()))
+    print(f"📡 분석 API: http://{args.host}:{args.port}/api")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# 헤드리스 배치 CLI: Streamlit 서버 없이 여러 데이터 파일의 분석 결과를 한 번에 계산해 디스크에 저장합니다.
+# 트렌드 파일(Date 열) -> 정리된 시계열, 최근 4주 요약, 상관관계 쌍/하이라이트
+# 연구 파일(Year 열)   -> 키워드별 성장 지표 (--scholar 로 지정한 연구 파일과의 선행/후행 분석도 선택 가능)
+# 파일마다 프로세스 풀 작업 하나로 병렬 처리합니다.
+#
+#   python batch_cli.py data/*.csv exports/ --out results/ --workers 8
+#   python batch_cli.py exports/ --scholar scholar_data.csv --lead-lag QS
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import analytics
+import catalog
+import datastore
+
+
+def collect_inputs(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*.csv"))))
+        else:
+            files.extend(sorted(glob.glob(path)) or [path])
+    # 같은 파일이 여러 번 지정돼도 한 번만 처리
+    return list(dict.fromkeys(os.path.normpath(f) for f in files))
+
+
+def detect_kind(columns):
+    if "Date" in columns:
+        return "trend"
+    if "Year" in columns:
+        return "scholar"
+    return None
+
+
+def _write_json(path, payload):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2, default=lambda value: value.item() if hasattr(value, "item") else str(value))
+
+
+def _output_dir(out_root, path):
+    rel = os.path.relpath(path)
+    if rel.startswith(".."):
+        rel = os.path.abspath(path).lstrip(os.sep)
+    name = os.path.splitext(rel)[0].replace(os.sep, "__")
+    target = os.path.join(out_root, name)
+    os.makedirs(target, exist_ok=True)
+    return target
+
+
+def run_trend(path, info, target, options):
+    df = datastore.ingest_csv(path, encoding=info["encoding"], sep=info["delimiter"],
+                              transform=analytics.clean_trend_frame, validate=analytics.validate_trend_frame)
+    summary = analytics.recent_summary(df, window=options["window"])
+    pairs = analytics.correlation_pairs(df)
+    highlights = {name: pairs.iloc[row].to_dict() for name, row in analytics.correlation_highlights(pairs).items()}
+
+    df.to_csv(os.path.join(target, "trends_clean.csv"))
+    summary.to_csv(os.path.join(target, "summary.csv"))
+    pairs.to_csv(os.path.join(target, "correlations.csv"), index=False)
+    outputs = ["trends_clean.csv", "summary.csv", "correlations.csv"]
+
+    if options["scholar"] and options["lead_lag"]:
+        scholar = datastore.ingest_csv(options["scholar"])
+        analytics.lead_lag_table(scholar, df, freq=options["lead_lag"]).to_csv(os.path.join(target, "lead_lag.csv"), index=False)
+        outputs.append("lead_lag.csv")
+
+    return {"rows": len(df), "keywords": df.columns.tolist(), "highlights": highlights, "outputs": outputs}
+
+
+def run_scholar(path, info, target, options):
+    df = datastore.ingest_csv(path, encoding=info["encoding"], sep=info["delimiter"])
+    metrics = analytics.scholar_growth_metrics(df)
+    metrics.to_csv(os.path.join(target, "scholar_metrics.csv"))
+    return {"rows": len(df), "keywords": metrics.index.tolist(), "outputs": ["scholar_metrics.csv"]}
+
+
+RUNNERS = {"trend": run_trend, "scholar": run_scholar}
+
+
+# 파일 하나 처리 (프로세스 풀 작업 단위) — 실패해도 예외 대신 결과 dict 로 돌려줌
+def process_file(path, out_root, options):
+    started = time.perf_counter()
+    result = {"input": path, "status": "ok"}
+    try:
+        info = catalog.sniff_file(path)
+        kind = options["kind"] if options["kind"] != "auto" else detect_kind(info["columns"])
+        if kind is None:
+            result.update(status="skipped", reason="Date/Year 열이 없어 데이터 종류를 알 수 없습니다.")
+            return result
+        target = _output_dir(out_root, path)
+        result.update(kind=kind, output_dir=target, encoding=info["encoding"])
+        result.update(RUNNERS[kind](path, info, target, options))
+        _write_json(os.path.join(target, "report.json"), result)
+    except Exception as e:
+        result.update(status="failed", error=f"{type(e).__name__}: {e}", traceback=traceback.format_exc())
+    finally:
+        result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="트렌드/연구 데이터 파일 여러 개의 분석 결과를 병렬로 계산해 저장합니다.")
+    parser.add_argument("inputs", nargs="+", help="CSV 파일, glob 패턴 또는 폴더")
+    parser.add_argument("--out", default="results", help="결과 폴더 (기본: results/)")
+    parser.add_argument("--kind", choices=["auto", "trend", "scholar"], default="auto", help="데이터 종류 (기본: 열 이름으로 판별)")
+    parser.add_argument("--window", type=int, default=4, help="최근 요약 기간 (주, 기본 4)")
+    parser.add_argument("--scholar", help="트렌드 파일과 선행/후행 분석할 연구 데이터 CSV")
+    parser.add_argument("--lead-lag", choices=["YS", "QS", "MS"], help="선행/후행 분석 시간 격자 (--scholar 와 함께 사용)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 풀 크기 (기본: CPU 수)")
+    args = parser.parse_args(argv)
+    # 둘 중 하나만 주면 선행/후행 분석 없이 조용히 끝나므로 미리 막음
+    if bool(args.scholar) != bool(args.lead_lag):
+        parser.error("--lead-lag 와 --scholar 는 함께 지정해야 합니다.")
+
+    files = collect_inputs(args.inputs)
+    if not files:
+        parser.error("처리할 CSV 파일이 없습니다.")
+    os.makedirs(args.out, exist_ok=True)
+    options = {"kind": args.kind, "window": args.window, "scholar": args.scholar, "lead_lag": args.lead_lag}
+
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(process_file, path, args.out, options): path for path in files}
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            mark = {"ok": "✅", "skipped": "⏭️", "failed": "❌"}[result["status"]]
+            print(f"{mark} {result['input']} ({result['seconds']:.2f}s) {result.get('error', result.get('reason', ''))}")
+
+    results.sort(key=lambda r: r["input"])
+    _write_json(os.path.join(args.out, "index.json"), {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seconds": round(time.perf_counter() - started, 3),
+        "results": [{k: v for k, v in r.items() if k != "traceback"} for r in results],
+    })
+    failed = [r for r in results if r["status"] == "failed"]
+    print(f"{len(results) - len(failed)}/{len(results)}개 파일 처리 완료 → {args.out}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+# 분석 코어 마이크로 벤치마크
+# synthetic.py 로 규모별 데이터를 만들고 적재·정리, 상관관계·상위 쌍(API 의 top-N 경로 포함), 이동/집계 지표, 점수 엔진, 그림 생성 시간을 잽니다.
+# 결과는 커밋 해시와 함께 benchmarks/<커밋>-<시각>.json 에 저장되어 커밋 사이에 비교할 수 있습니다.
+# 메모리가 키워드 수의 제곱으로 늘어나는 단계는 예상 메모리가 --mem-limit 을 넘으면 건너뛰고 그 사실을 기록합니다.
+#
+#   python bench.py                              # small, medium
+#   python bench.py --scale large --repeat 1
+#   python bench.py --compare benchmarks/<이전 결과>.json        # 실행 후 이전 결과와 비교
+#   python bench.py --compare benchmarks/a.json benchmarks/b.json  # 저장된 두 결과만 비교
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import plotly
+import plotly.express as px
+
+import analytics
+import datastore
+import scoring
+import synthetic
+
+OUTPUT_DIR = "benchmarks"
+DEFAULT_SCALES = "small,medium"
+FIGURE_KEYWORDS = 5      # 트렌드 그래프에 그리는 키워드 수 (앱의 기본 선택과 비슷하게)
+FIGURE_HEATMAP = 30      # 히트맵에 넣는 키워드 수
+RESULT_KEYS = ("scale", "bench")
+SETUP_STEPS = {"ingest_trends", "ingest_scholar", "time_pyramid"}   # 뒤 단계가 쓰는 결과를 만드므로 --only 와 상관없이 실행
+
+
+# 1. 예상 메모리 (바이트) — 제곱으로 커지는 단계만, 계수는 tracemalloc 으로 잰 최대 사용량 기준
+def _pairs_bytes(ctx):
+    n = ctx["trends"].shape[1]
+    # 상관행렬 + 위쪽 삼각형 인덱스 + 쌍 표(이름 2개 + r) + 정렬용 배열 ≈ 키워드 쌍당 50 바이트
+    return 50 * n * n
+
+
+def _top_pairs_bytes(ctx):
+    n = ctx["trends"].shape[1]
+    # 상관행렬 + 쓰기 가능한 사본 + |r| 배열 + 아래 삼각형 인덱스 ≈ 28 바이트 (쌍 표는 k 개뿐)
+    return 28 * n * n
+
+
+def _linkage_bytes(ctx):
+    n = ctx["trends"].shape[1]
+    # 상관행렬 + 거리행렬 + 압축 거리 벡터 ≈ 32 바이트
+    return 32 * n * n
+
+
+def _lead_lag_bytes(ctx):
+    p, q = ctx["scholar"].shape[1] - 1, ctx["trends"].shape[1]
+    # FFT 는 블록 단위(analytics.LEAD_LAG_BLOCK)라 상한이 고정, 나머지는 쌍마다 최적 시차/강도 + 결과 표
+    return analytics.LEAD_LAG_BLOCK * 16 * 3 + 56 * p * q
+
+
+# 2. 벤치마크 단계: (이름, 함수(ctx), 예상 메모리 함수 또는 None)
+def bench_ingest_trends(ctx):
+    ctx["trends"] = datastore.ingest_csv(ctx["paths"]["food_trends"], transform=analytics.clean_trend_frame,
+                                         validate=analytics.validate_trend_frame)
+
+
+def bench_ingest_scholar(ctx):
+    ctx["scholar"] = datastore.ingest_csv(ctx["paths"]["scholar_data"])
+
+
+def bench_correlation_pairs(ctx):
+    pairs = analytics.correlation_pairs(ctx["trends"])
+    analytics.correlation_highlights(pairs)
+    # 상위 쌍 (절댓값 기준 10개)
+    pairs.iloc[np.argsort(-np.abs(pairs["r"].to_numpy()))[:10]]
+
+
+# /api/correlations 기본 경로: 전체 쌍 표 없이 |r| 상위 100쌍 + 하이라이트
+def bench_top_correlation_pairs(ctx):
+    pairs = analytics.top_correlation_pairs(ctx["trends"], 100)
+    analytics.correlation_highlights(pairs)
+
+
+def bench_correlation_cluster(ctx):
+    corr = ctx["trends"].corr()
+    Z, _ = analytics.correlation_linkage(corr)
+    analytics.correlation_blocks(corr, Z, min(12, len(corr)))
+
+
+def bench_recent_summary(ctx):
+    analytics.recent_summary(ctx["trends"], window=4)
+
+
+def bench_rolling_mean(ctx):
+    ctx["trends"].rolling(4).mean()
+
+
+def bench_time_pyramid(ctx):
+    pyramid = analytics.build_time_pyramid(ctx["trends"])
+    index = ctx["trends"].index
+    analytics.pyramid_slice(pyramid, index[0], index[-1])
+    ctx["pyramid"] = pyramid
+
+
+def bench_seasonal(ctx):
+    analytics.seasonal_decomposition(ctx["trends"])
+
+
+def bench_scholar_metrics(ctx):
+    analytics.scholar_growth_metrics(ctx["scholar"])
+
+
+def bench_lead_lag(ctx):
+    analytics.lead_lag_table(ctx["scholar"], ctx["trends"], freq="YS")
+
+
+def bench_score_engine(ctx):
+    components = scoring.company_components(ctx["company_map"], ctx["company_details"], ctx["trends"])
+    engine = scoring.ScoreEngine(components)
+    for name in scoring.DEFAULT_WEIGHTS:
+        engine.set_weight(name, 0.3)
+    engine.ranking()
+
+
+def bench_figures(ctx):
+    df = ctx["trends"]
+    keywords = df.columns.tolist()[:FIGURE_KEYWORDS]
+    _, visible = analytics.pyramid_slice(ctx["pyramid"], df.index[0], df.index[-1])
+    figures = [
+        px.line(visible, y=keywords, template="plotly_dark"),
+        px.imshow(df.iloc[:, :FIGURE_HEATMAP].corr(), text_auto=".2f", color_continuous_scale="Purples", template="plotly_dark"),
+        px.bar(ctx["company_map"], x="총점", y="기업명", orientation="h", template="plotly_dark"),
+    ]
+    for fig in figures:
+        fig.to_json()
+
+
+BENCHMARKS = [
+    ("ingest_trends", bench_ingest_trends, None),
+    ("ingest_scholar", bench_ingest_scholar, None),
+    ("correlation_pairs", bench_correlation_pairs, _pairs_bytes),
+    ("top_correlation_pairs", bench_top_correlation_pairs, _top_pairs_bytes),
+    ("correlation_cluster", bench_correlation_cluster, _linkage_bytes),
+    ("recent_summary", bench_recent_summary, None),
+    ("rolling_mean", bench_rolling_mean, None),
+    ("time_pyramid", bench_time_pyramid, None),
+    ("seasonal", bench_seasonal, None),
+    ("scholar_metrics", bench_scholar_metrics, None),
+    ("lead_lag", bench_lead_lag, _lead_lag_bytes),
+    ("score_engine", bench_score_engine, None),
+    ("figures", bench_figures, None),
+]
+
+
+def _time(fn, ctx, repeat):
+    runs = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn(ctx)
+        runs.append((time.perf_counter() - started) * 1000)
+    return runs
+
+
+# 3. 규모 하나 실행
+def run_scale(name, size, repeat, mem_limit_gb, only=None, seed=0):
+    results = []
+    started = time.perf_counter()
+    data = synthetic.generate(**size, seed=seed)
+    print(f"\n🛰️ {name}: 키워드 {size['keywords']} x {size['years']}년, 주제 {size['topics']}, 기업 {size['companies']} "
+          f"(생성 {time.perf_counter() - started:.1f}s)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ctx = {"paths": synthetic.write_datasets(data, tmp), "company_map": data["company_map"],
+               "company_details": data["company_details"]}
+        for bench, fn, estimate in BENCHMARKS:
+            row = {"scale": name, "bench": bench, **size}
+            if only and bench not in only and bench not in SETUP_STEPS:
+                continue
+            need = estimate(ctx) if estimate else None
+            if need is not None and need > mem_limit_gb * 1e9:
+                row.update(status="skipped", note=f"예상 메모리 {need / 1e9:.1f} GB > {mem_limit_gb:g} GB")
+                print(f"   ⏭️ {bench:<20} 건너뜀 ({row['note']})")
+                results.append(row)
+                continue
+            try:
+                runs = _time(fn, ctx, repeat)
+            except MemoryError:
+                row.update(status="error", note="MemoryError")
+                print(f"   ❌ {bench:<20} MemoryError")
+            else:
+                row.update(status="ok", min_ms=round(min(runs), 3), median_ms=round(statistics.median(runs), 3), runs=len(runs))
+                print(f"   ⏱️ {bench:<20} {row['median_ms']:>10.1f} ms (최소 {row['min_ms']:.1f})")
+            results.append(row)
+    return results
+
+
+def git_revision():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                    capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+    return commit, dirty
+
+
+# 4. 결과 비교 (중앙값 기준, 1보다 크면 느려짐)
+def compare(base, current):
+    old = {tuple(r[k] for k in RESULT_KEYS): r for r in base["results"]}
+    print(f"\n📊 {str(base.get('commit'))[:10]} → {str(current.get('commit'))[:10]} (중앙값 비율, >1 이면 느려짐)")
+    for row in current["results"]:
+        prev = old.get(tuple(row[k] for k in RESULT_KEYS))
+        if not prev or row.get("status") != "ok" or prev.get("status") != "ok":
+            status = row.get("status") if prev else "new"
+            print(f"   {row['scale']:<7} {row['bench']:<20} {status}")
+            continue
+        ratio = row["median_ms"] / prev["median_ms"] if prev["median_ms"] else float("nan")
+        mark = "🔺" if ratio > 1.1 else ("🔻" if ratio < 0.9 else "  ")
+        print(f"   {row['scale']:<7} {row['bench']:<20} {prev['median_ms']:>10.1f} → {row['median_ms']:>10.1f} ms  x{ratio:.2f} {mark}")
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 데이터로 분석 코어의 단계별 실행 시간을 측정합니다.")
+    parser.add_argument("--scale", default=DEFAULT_SCALES, help=f"규모 단계, 쉼표로 여러 개 ({', '.join(synthetic.SCALES)})")
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 횟수 (기본 3)")
+    parser.add_argument("--only", help="실행할 벤치마크 이름, 쉼표로 구분 (적재·피라미드는 준비 단계라 항상 실행)")
+    parser.add_argument("--mem-limit", type=float, default=2.0, help="이 크기(GB)를 넘을 것으로 예상되는 단계는 건너뜀")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=OUTPUT_DIR, help="결과 폴더 (기본: benchmarks/)")
+    parser.add_argument("--compare", nargs="+", metavar="JSON", help="이전 결과와 비교 (파일 두 개를 주면 실행 없이 둘만 비교)")
+    args = parser.parse_args(argv)
+
+    if args.compare and len(args.compare) >= 2:
+        compare(_load(args.compare[0]), _load(args.compare[1]))
+        return 0
+
+    scales = [s.strip() for s in args.scale.split(",") if s.strip()]
+    unknown = [s for s in scales if s not in synthetic.SCALES]
+    if unknown:
+        parser.error(f"알 수 없는 규모: {', '.join(unknown)}")
+    only = set(args.only.split(",")) if args.only else None
+
+    results = []
+    for name in scales:
+        results.extend(run_scale(name, synthetic.SCALES[name], args.repeat, args.mem_limit, only, args.seed))
+
+    commit, dirty = git_revision()
+    report = {
+        "commit": commit,
+        "dirty": dirty,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "environment": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "plotly": plotly.__version__,
+        },
+        "results": results,
+    }
+    os.makedirs(args.out, exist_ok=True)
+    path = os.path.join(args.out, f"{(commit or 'nogit')[:10]}{'-dirty' if dirty else ''}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        compare(_load(args.compare[0]), report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
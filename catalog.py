@@ -0,0 +1,202 @@
+# 데이터 카탈로그: 루트와 data/ 폴더의 CSV 를 한 번 훑어 스키마를 파악하고 중복 파일을 걸러냅니다.
+# 파일 전체를 읽지 않고 앞부분 표본만으로 인코딩, 구분자, 열 dtype, 행 수를 추정하며,
+# 실제 데이터는 load() 를 처음 호출할 때 읽어 읽기 전용으로 보관합니다.
+import csv
+import hashlib
+import io
+import os
+import threading
+
+import pandas as pd
+
+import datastore
+
+DATA_ROOTS = (".", "data")   # 앞선 루트가 원래 이름을 가짐 (앱이 읽던 ./food_trends.csv 등이 그대로 기준)
+SAMPLE_BYTES = 64 * 1024
+SAMPLE_ROWS = 200
+HASH_CHUNK = 1024 * 1024
+
+
+def _content_hash(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# 표본 기반 스키마 추정
+def sniff_file(path):
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        sample = f.read(SAMPLE_BYTES)
+    complete = len(sample) >= size
+
+    encoding = datastore.detect_encoding(sample)
+    text = sample.decode(encoding, errors="ignore")
+    if not complete:
+        # 표본 끝의 잘린 줄은 버림
+        text = text[:text.rfind("\n") + 1]
+
+    try:
+        delimiter = csv.Sniffer().sniff(text[:8192], delimiters=",;\t|").delimiter
+    except csv.Error:
+        delimiter = ","
+
+    preview = pd.read_csv(io.StringIO(text), sep=delimiter, nrows=SAMPLE_ROWS)
+    n_lines = text.count("\n") + (0 if text.endswith("\n") or not text else 1)
+    if complete:
+        rows = max(n_lines - 1, 0)
+    else:
+        bytes_per_line = len(text.encode(encoding)) / max(n_lines, 1)
+        rows = int(size / bytes_per_line) - 1
+
+    return {
+        "path": path,
+        "size": size,
+        "encoding": encoding,
+        "delimiter": delimiter,
+        "columns": preview.columns.tolist(),
+        "dtypes": {col: str(dt) for col, dt in preview.dtypes.items()},
+        "rows": rows,
+        "rows_exact": complete,
+        "duplicates": [],
+    }
+
+
+class DatasetCatalog:
+    def __init__(self, roots=DATA_ROOTS, extension=".csv"):
+        self.roots = roots
+        self.extension = extension
+        self.entries = {}
+        self.errors = {}   # 읽을 수 없는 파일: 경로 -> 오류 메시지 (카탈로그에서 빠짐)
+        self._frames = {}
+        self._lock = threading.Lock()
+        self.scan()
+
+    def _candidate_files(self):
+        seen = set()
+        for root in self.roots:
+            if not os.path.isdir(root):
+                continue
+            for name in sorted(os.listdir(root)):
+                path = os.path.normpath(os.path.join(root, name))
+                if name.endswith(self.extension) and os.path.isfile(path) and path not in seen:
+                    seen.add(path)
+                    yield path
+
+    # 같은 크기의 파일끼리만 내용 해시를 비교해 중복을 찾습니다. (앞선 루트의 파일이 대표)
+    def scan(self):
+        fingerprint = self.fingerprint()
+        by_size = {}
+        for path in self._candidate_files():
+            by_size.setdefault(os.path.getsize(path), []).append(path)
+
+        canonical = []
+        duplicates = {}
+        for size, paths in by_size.items():
+            if len(paths) == 1:
+                canonical.append(paths[0])
+                continue
+            first_by_hash = {}
+            for path in paths:
+                digest = _content_hash(path)
+                if digest in first_by_hash:
+                    duplicates.setdefault(first_by_hash[digest], []).append(path)
+                else:
+                    first_by_hash[digest] = path
+                    canonical.append(path)
+
+        entries = {}
+        errors = {}
+        for path in sorted(canonical, key=self._root_order):
+            # 빈 파일이나 깨진 CSV 하나 때문에 전체 스캔(과 매 rerun 의 refresh)이 실패하지 않도록 파일별로 건너뜀
+            try:
+                entry = sniff_file(path)
+            except (OSError, UnicodeError, ValueError, csv.Error) as e:   # EmptyDataError, ParserError 는 ValueError
+                errors[path] = f"{type(e).__name__}: {e}"
+                continue
+            name = os.path.splitext(os.path.basename(path))[0]
+            if name in entries:
+                # 내용이 다른 동명 파일은 뒤쪽 루트의 이름을 붙여 구분 (예: 'data/x')
+                stem = name
+                name = f"{self._root_label(path)}/{stem}"
+                n = 2
+                while name in entries:
+                    name = f"{self._root_label(path)}/{stem}~{n}"
+                    n += 1
+            entry["name"] = name
+            entry["duplicates"] = duplicates.get(path, [])
+            entries[name] = entry
+
+        with self._lock:
+            self.entries = entries
+            self.errors = errors
+            self._frames = {}
+            self._fingerprint = fingerprint
+
+    def _root_label(self, path):
+        return os.path.normpath(os.path.dirname(path) or ".").replace(os.sep, "/")
+
+    def _root_order(self, path):
+        parent = os.path.normpath(os.path.dirname(path) or ".")
+        roots = [os.path.normpath(root) for root in self.roots]
+        return (roots.index(parent) if parent in roots else len(roots), path)
+
+    # 루트 폴더 데이터 파일 지문 (스캔 결과와 상관없이 매번 디스크를 확인해 추가/삭제/수정을 감지)
+    def fingerprint(self):
+        return datastore.dataset_version(*self._candidate_files())
+
+    # 데이터 파일이 추가/삭제/수정됐으면 다시 스캔 (다시 스캔했으면 True)
+    def refresh(self):
+        if self.fingerprint() == self._fingerprint:
+            return False
+        self.scan()
+        return True
+
+    def names(self):
+        return list(self.entries)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def info(self, name):
+        return self.entries[name]
+
+    def path(self, name):
+        return self.entries[name]["path"]
+
+    # 캐시 키용 데이터 버전 (카탈로그에 없는 이름은 'missing' 으로 표시)
+    def version(self, *names):
+        return datastore.dataset_version(*(self.entries[name]["path"] if name in self.entries else name for name in names))
+
+    # 카탈로그 전체 요약 표
+    def summary(self):
+        rows = [{
+            "name": entry["name"],
+            "path": entry["path"],
+            "encoding": entry["encoding"],
+            "delimiter": entry["delimiter"],
+            "rows": entry["rows"],
+            "rows_exact": entry["rows_exact"],
+            "columns": len(entry["columns"]),
+            "size_kb": entry["size"] / 1024,
+            "duplicates": ", ".join(entry["duplicates"]),
+        } for entry in self.entries.values()]
+        return pd.DataFrame(rows, columns=["name", "path", "encoding", "delimiter", "rows", "rows_exact", "columns", "size_kb", "duplicates"])
+
+    # 표본에서 알아낸 인코딩/구분자로 전체 파일을 청크 단위로 읽습니다. (캐시하지 않음)
+    def read(self, name, transform=None, validate=None):
+        entry = self.entries[name]
+        return datastore.ingest_csv(entry["path"], encoding=entry["encoding"], sep=entry["delimiter"],
+                                    transform=transform, validate=validate)
+
+    # 지연 로더: 처음 요청될 때 한 번만 읽어 압축 dtype + 읽기 전용으로 보관 (파일 버전별)
+    def load(self, name):
+        with self._lock:
+            # 파일 버전이 바뀌었으면 다시 읽음
+            version = self.version(name)
+            cached = self._frames.get(name)
+            if cached is None or cached[0] != version:
+                self._frames[name] = cached = (version, datastore.freeze_frame(self.read(name)))
+            return cached[1]
@@ -0,0 +1,190 @@
+# 데이터 저장소: 프로세스 전체가 공유하는 읽기 전용 데이터셋 도우미
+# st.cache_resource 로 한 번만 만들어 두고, 모든 세션이 복사 없이 같은 배열을 참조합니다.
+import codecs
+import os
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+
+# 앞부분 바이트 표본으로 인코딩 판별
+# UTF-8 로 깨끗하게 읽히면 UTF-8, 아니면 한국어 엑셀/구글 내보내기 기본값인 cp949(euc-kr 상위 호환)
+def detect_encoding(sample):
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # 표본 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음 (final=False)
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+# 데이터 파일 버전 (파일 크기/수정 시각이 바뀌면 캐시를 새로 계산)
+def dataset_version(*paths):
+    parts = []
+    for path in paths:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            parts.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+        else:
+            parts.append(f"{path}:missing")
+    return "|".join(parts)
+
+
+def _readonly(values):
+    values = np.array(values, copy=True)
+    values.flags.writeable = False
+    return values
+
+
+# DataFrame 을 쓰기 금지 배열로 다시 감쌉니다.
+# 캐시된 원본에 값을 쓰려 하면 "assignment destination is read-only" 오류가 나고,
+# 페이지에서 열 선택/슬라이싱으로 만든 파생 프레임은 같은 메모리를 그대로 참조합니다.
+def freeze_frame(df):
+    dtypes = set(df.dtypes)
+    # 같은 숫자형 열만 있는 프레임(트렌드 점수 등)은 2차원 배열 하나로 유지
+    if len(dtypes) == 1 and all(isinstance(dt, np.dtype) and dt.kind in "biuf" for dt in dtypes):
+        frozen = pd.DataFrame(_readonly(df.to_numpy()), index=df.index, columns=df.columns, copy=False)
+        frozen.attrs = dict(df.attrs)
+        return frozen
+
+    columns = {}
+    for col in df.columns:
+        if isinstance(df[col].dtype, np.dtype):
+            columns[col] = _readonly(df[col].to_numpy())
+        else:
+            # 범주형/문자열 확장 배열은 그 자체로 값 변경 API 를 쓰지 않으므로 그대로 공유
+            columns[col] = df[col].array
+    frozen = pd.DataFrame(columns, index=df.index, copy=False)
+    frozen.attrs = dict(df.attrs)
+    return frozen
+
+
+# dict 목록(기업 상세 정보 등)을 수정할 수 없는 튜플/매핑으로 바꿉니다.
+def freeze_records(records):
+    return tuple(MappingProxyType(dict(record)) for record in records)
+
+
+# 압축 dtype 계층
+# 값 범위를 보고 가장 작은 안전한 정수/실수형으로 줄이고, 반복되는 문자열은 범주형으로 바꿉니다.
+# (예: 0~100 트렌드 점수 -> uint8, cars.csv 의 continent -> category)
+CATEGORY_RATIO = 0.5
+
+def _downcast_integer(s):
+    return pd.to_numeric(s, downcast="unsigned" if len(s) and s.min() >= 0 else "integer")
+
+
+def _compact_series(s, category_ratio):
+    if pd.api.types.is_bool_dtype(s):
+        return s
+    if pd.api.types.is_integer_dtype(s):
+        return _downcast_integer(s)
+    if pd.api.types.is_float_dtype(s):
+        values = s.to_numpy(dtype=float)
+        finite = np.isfinite(values)
+        # 결측 없이 모두 정수값이면 정수형으로 (to_numeric(...).fillna(0) 경로로 생긴 float64 등)
+        if finite.all() and np.array_equal(values, np.round(values)) and np.abs(values).max(initial=0) < 2 ** 53:
+            return _downcast_integer(s.astype(np.int64))
+        # float32 로 바꿨다가 되돌려도 모든 값이 그대로일 때만 (조금이라도 달라지면 float64 유지)
+        as_float32 = values.astype(np.float32)
+        if np.array_equal(as_float32.astype(np.float64), values, equal_nan=True):
+            return s.astype(np.float32)
+        return s
+    if pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+        if len(s) and s.nunique(dropna=False) <= len(s) * category_ratio:
+            return s.astype("category")
+    return s
+
+
+def compact_frame(df, category_ratio=CATEGORY_RATIO):
+    compact = pd.DataFrame({col: _compact_series(df[col], category_ratio) for col in df.columns}, index=df.index)
+    compact.attrs = dict(df.attrs)
+    compact.attrs.setdefault("original_bytes", int(df.memory_usage(deep=True).sum()))
+    return compact
+
+
+# 스트리밍 CSV 적재
+# 앞부분 바이트 표본으로 인코딩을 한 번만 정하고(실패 후 전체 재파싱 없음), 정해진 행 수씩 읽어
+# 청크마다 변환(transform)·검증(validate)·dtype 압축을 거친 뒤 이어 붙입니다.
+# 읽는 동안은 '압축된 누적분 + 원본 청크 하나', 마지막에 이어 붙이는 순간에는 청크들과 결합 결과가 함께 있어
+# 최대 '압축된 크기 × 2' 정도를 씁니다. 결합 뒤에는 청크마다 dtype 이 달랐던 열만 다시 압축합니다.
+ENCODING_SAMPLE_BYTES = 64 * 1024
+INGEST_CHUNK_ROWS = 50_000
+
+def _concat_compact(chunks):
+    if len(chunks) == 1:
+        return chunks[0]
+    columns = {}
+    for col in chunks[0].columns:
+        parts = [chunk[col] for chunk in chunks]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            # 청크마다 범주 목록이 달라도 object 로 풀리지 않도록 범주 합집합으로 결합
+            columns[col] = pd.Categorical(pd.api.types.union_categoricals([part.array for part in parts]))
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True).array
+    if all(isinstance(chunk.index, pd.RangeIndex) for chunk in chunks):
+        index = pd.RangeIndex(sum(len(chunk) for chunk in chunks))
+    else:
+        index = chunks[0].index.append([chunk.index for chunk in chunks[1:]])
+    return pd.DataFrame(columns, index=index)
+
+
+def ingest_csv(path, encoding=None, sep=",", chunksize=INGEST_CHUNK_ROWS, transform=None, validate=None):
+    if encoding is None:
+        with open(path, "rb") as f:
+            encoding = detect_encoding(f.read(ENCODING_SAMPLE_BYTES))
+    try:
+        return _ingest_chunks(path, encoding, sep, chunksize, transform, validate)
+    except UnicodeDecodeError:
+        # 앞부분 표본이 ASCII 뿐이라 UTF-8 로 판별됐지만 뒤쪽에 한글이 있는 cp949 파일: 처음부터 한 번만 다시 읽음
+        if encoding != "utf-8":
+            raise
+        return _ingest_chunks(path, "cp949", sep, chunksize, transform, validate)
+
+
+def _ingest_chunks(path, encoding, sep, chunksize, transform, validate):
+    chunks = []
+    original_bytes = 0
+    # 청크 자체가 메모리 상한이므로 청크 내부를 다시 쪼개 dtype 을 추측하지 않음 (low_memory=False)
+    with pd.read_csv(path, encoding=encoding, sep=sep, chunksize=chunksize, low_memory=False) as reader:
+        for chunk in reader:
+            if transform is not None:
+                chunk = transform(chunk)
+            if validate is not None:
+                validate(chunk)
+            compact = compact_frame(chunk)
+            original_bytes += compact.attrs["original_bytes"]
+            chunks.append(compact)
+
+    if not chunks:
+        return pd.read_csv(path, encoding=encoding, sep=sep, nrows=0)
+    # 청크 경계에서 dtype 이 달라진 열(예: 앞 청크 uint8, 뒤 청크 float32)만 결합 후 다시 압축 — 전체 프레임 두 번째 패스 없음
+    mixed = [col for col in chunks[0].columns if len({chunk[col].dtype for chunk in chunks}) > 1]
+    df = _concat_compact(chunks)
+    del chunks
+    for col in mixed:
+        df[col] = _compact_series(df[col], CATEGORY_RATIO)
+    df.attrs["original_bytes"] = original_bytes
+    df.attrs["encoding"] = encoding
+    return df
+
+
+# 데이터셋별 메모리 리포트 ({이름: DataFrame} -> 표)
+def memory_report(frames):
+    rows = []
+    for name, df in frames.items():
+        current = int(df.memory_usage(deep=True).sum())
+        original = df.attrs.get("original_bytes", current)
+        dtypes = df.dtypes.astype(str).value_counts()
+        rows.append({
+            "dataset": name,
+            "rows": len(df),
+            "columns": df.shape[1],
+            "original_kb": original / 1024,
+            "memory_kb": current / 1024,
+            "saved_pct": (1 - current / original) * 100 if original else 0.0,
+            "dtypes": ", ".join(f"{dt}×{n}" for dt, n in dtypes.items()),
+        })
+    return pd.DataFrame(rows, columns=["dataset", "rows", "columns", "original_kb", "memory_kb", "saved_pct", "dtypes"])
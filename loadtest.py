@@ -0,0 +1,344 @@
+# 부하 테스트 도구: 로컬에서 띄운 streamlit_app.py 에 가상 사용자 N 명을 동시에 붙여 봅니다.
+# 가상 사용자는 브라우저 대신 Streamlit 웹소켓(/_stcore/stream)으로 BackMsg 를 보내며,
+# 사이드바 메뉴(option_menu)로 페이지를 바꾸고, 키워드 선택을 바꾸고, 연구 페이지에서 탐사선을 발사합니다.
+# 동작 사이에는 사람처럼 쉬는 시간(think time)을 두고, rerun 요청부터 script_finished 까지를 지연 시간으로 잽니다.
+# 결과: 처리량(rerun/s), 지연 시간 백분위수, 서버 프로세스 RSS 로 본 세션당 메모리 증가량
+# (첫 단계 전에 세션 하나로 모든 페이지를 열어 import·데이터 캐시를 채운 뒤의 RSS 를 기준선으로 삼고,
+#  세션당 증가량은 단계 사이의 정상 상태 RSS 차이를 늘어난 사용자 수로 나눈 값)
+#
+#   python loadtest.py --launch --users 5,10,20,40 --duration 60     # 서버를 직접 띄우고 단계별로 늘려 보기
+#   python loadtest.py --url http://127.0.0.1:8501 --server-pid 1234 --users 20
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+PAGES = ["0. 프롤로그", "1. 항해 시작 (Intro)", "2. 신호 탐지 (Trend)", "3. 행성 좌표 (Map)",
+         "4. 기업 상세 데이터 (Info)", "5. 심우주 탐사 (Research)", "6. 궤도 안착 (Conclusion)", "7. 데이터 탐색 (Explore)"]
+TREND_PAGE = "2. 신호 탐지 (Trend)"
+RESEARCH_PAGE = "5. 심우주 탐사 (Research)"
+KEYWORD_LABEL = "추적할 신호(키워드)"
+LAUNCH_LABEL = "🚀 탐사선 발사"
+
+# 동작 비중: 페이지 이동 / 키워드 변경 / 연구 분석 실행
+ACTION_WEIGHTS = {"page": 0.5, "keywords": 0.3, "scholar": 0.2}
+WIDGET_TYPES = ("multiselect", "selectbox", "button", "radio", "component_instance")
+PERCENTILES = (50, 90, 95, 99)
+
+
+# 1. 서버 프로세스 정보
+def read_rss_kb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def launch_server(port, script="streamlit_app.py"):
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    health = f"http://127.0.0.1:{port}/_stcore/health"
+    for _ in range(120):
+        try:
+            with urllib.request.urlopen(health, timeout=1) as resp:
+                if resp.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.5)
+    proc.terminate()
+    raise RuntimeError("Streamlit 서버가 60초 안에 뜨지 않았습니다.")
+
+
+# 2. 가상 사용자 (웹소켓 세션 하나)
+class SimUser:
+    def __init__(self, index, ws_url, think, rng, stats):
+        self.index = index
+        self.ws_url = ws_url
+        self.think = think
+        self.rng = rng
+        self.stats = stats
+        self.page = PAGES[0]
+        self.widgets = {}   # 라벨(또는 컴포넌트 이름) -> (종류, 위젯 id, 선택지)
+        self.values = {}    # 위젯 id -> WidgetState 값 설정 함수 (rerun 마다 모두 다시 보냄)
+
+    async def rerun(self, ws, action, trigger=None):
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        for widget_id, set_value in self.values.items():
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            set_value(state)
+        if trigger is not None:
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = trigger
+            state.trigger_value = True
+
+        started = time.perf_counter()
+        await ws.send(msg.SerializeToString())
+        self.widgets = {}
+        failed = False
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    failed = True
+                elif element_type in WIDGET_TYPES:
+                    widget = getattr(element, element_type)
+                    key = widget.component_name if element_type == "component_instance" else widget.label
+                    self.widgets[key] = (element_type, widget.id, list(getattr(widget, "options", [])))
+            elif kind == "script_finished":
+                failed = failed or fwd.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY
+                break
+        self.stats.record(action, self.page, time.perf_counter() - started, failed)
+
+    def _set_menu(self, page):
+        widget = self.widgets.get("streamlit_option_menu.option_menu")
+        if widget is None:
+            return False
+        self.page = page
+        self.values[widget[1]] = lambda state, value=json.dumps(page): setattr(state, "json_value", value)
+        return True
+
+    async def go_to(self, ws, page, action="page"):
+        if self._set_menu(page):
+            await self.rerun(ws, action)
+
+    async def change_keywords(self, ws):
+        if self.page != TREND_PAGE:
+            await self.go_to(ws, TREND_PAGE)
+            await self.pause()
+        widget = self.widgets.get(KEYWORD_LABEL)
+        if widget is None:
+            return
+        picked = self.rng.sample(widget[2], self.rng.randint(1, min(4, len(widget[2]))))
+        self.values[widget[1]] = lambda state, value=picked: state.string_array_value.data.extend(value)
+        await self.rerun(ws, "keywords")
+
+    async def launch_scholar(self, ws):
+        if self.page != RESEARCH_PAGE:
+            await self.go_to(ws, RESEARCH_PAGE)
+            await self.pause()
+        query = next((w for w in self.widgets.values() if w[0] == "selectbox" and w[2]), None)
+        button = self.widgets.get(LAUNCH_LABEL)
+        if query is None or button is None:
+            return
+        choice = self.rng.choice(query[2])
+        self.values[query[1]] = lambda state, value=choice: setattr(state, "string_value", value)
+        await self.rerun(ws, "scholar", trigger=button[1])
+
+    async def pause(self):
+        await asyncio.sleep(self.rng.uniform(*self.think))
+
+    # 모든 페이지를 한 번씩 열고 키워드 변경·탐사선 발사까지 해 보는 준비 세션
+    async def warm_up(self):
+        async with websockets.connect(self.ws_url, subprotocols=["streamlit"], max_size=None, open_timeout=30) as ws:
+            await self.rerun(ws, "connect")
+            for page in PAGES[1:]:
+                await self.go_to(ws, page)
+            await self.change_keywords(ws)
+            await self.launch_scholar(ws)
+
+    async def run(self, deadline):
+        try:
+            async with websockets.connect(self.ws_url, subprotocols=["streamlit"], max_size=None, open_timeout=30) as ws:
+                await self.rerun(ws, "connect")
+                self.stats.sessions += 1
+                while time.perf_counter() < deadline:
+                    await self.pause()
+                    if time.perf_counter() >= deadline:
+                        break
+                    action = self.rng.choices(list(ACTION_WEIGHTS), weights=list(ACTION_WEIGHTS.values()))[0]
+                    if action == "page":
+                        await self.go_to(ws, self.rng.choice([p for p in PAGES if p != self.page]))
+                    elif action == "keywords":
+                        await self.change_keywords(ws)
+                    else:
+                        await self.launch_scholar(ws)
+        except (OSError, websockets.WebSocketException) as e:
+            self.stats.errors.append(f"user {self.index}: {type(e).__name__}: {e}")
+
+
+# 3. 결과 집계
+class Stats:
+    def __init__(self):
+        self.samples = []   # (동작, 페이지, 초, 실패 여부)
+        self.errors = []
+        self.sessions = 0
+        self.rss_peak = None
+        self.rss_steady = []   # 사용자가 모두 붙은 뒤(램프 이후)의 RSS 표본
+        self.ramped = False
+
+    def record(self, action, page, seconds, failed):
+        self.samples.append((action, page, seconds, failed))
+
+    def latency_ms(self, group=None, by=0):
+        values = [s[2] for s in self.samples if group is None or s[by] == group]
+        if not values:
+            return {}
+        values = np.array(values) * 1000
+        summary = {f"p{p}": float(np.percentile(values, p)) for p in PERCENTILES}
+        summary.update(n=len(values), mean=float(values.mean()), max=float(values.max()))
+        return summary
+
+
+# 세션이 모두 붙어 있는 동안의 최대 RSS 를 보기 위해 1초마다 서버 메모리를 기록
+async def sample_rss(pid, stats, done):
+    while not done.is_set():
+        rss = read_rss_kb(pid)
+        if rss is not None:
+            stats.rss_peak = max(stats.rss_peak or 0, rss)
+            if stats.ramped:
+                stats.rss_steady.append(rss)
+        try:
+            await asyncio.wait_for(done.wait(), timeout=1.0)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_stage(ws_url, users, duration, think, ramp, seed, pid=None):
+    stats = Stats()
+    done = asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(pid, stats, done)) if pid else None
+    deadline = time.perf_counter() + duration
+    tasks = []
+    for i in range(users):
+        user = SimUser(i, ws_url, think, random.Random(seed + i), stats)
+        tasks.append(asyncio.create_task(user.run(deadline)))
+        if ramp:
+            await asyncio.sleep(ramp / users)
+    stats.ramped = True
+    await asyncio.gather(*tasks)
+    done.set()
+    if sampler is not None:
+        await sampler
+    return stats
+
+
+# 준비 세션을 돌리고 잠시 기다린 뒤의 서버 RSS (KB)
+def warm_baseline_rss(ws_url, pid, seed, settle=2.0):
+    user = SimUser(-1, ws_url, (0.0, 0.0), random.Random(seed), Stats())
+    try:
+        asyncio.run(user.warm_up())
+    except (OSError, websockets.WebSocketException) as e:
+        print(f"   ⚠️ 준비 세션 실패: {type(e).__name__}: {e}")
+    time.sleep(settle)
+    return read_rss_kb(pid)
+
+
+# 정상 상태 RSS: 램프 이후 표본의 중앙값 (표본이 없으면 최대값)
+def steady_rss(stats):
+    return float(np.median(stats.rss_steady)) if stats.rss_steady else stats.rss_peak
+
+
+def stage_report(users, stats, elapsed, baseline):
+    report = {
+        "users": users,
+        "sessions": stats.sessions,
+        "reruns": len(stats.samples),
+        "failed_reruns": sum(1 for s in stats.samples if s[3]),
+        "errors": stats.errors,
+        "seconds": elapsed,
+        "throughput_rps": len(stats.samples) / elapsed if elapsed else 0.0,
+        "latency_ms": stats.latency_ms(),
+        "by_action": {a: stats.latency_ms(a, by=0) for a in ["connect", *ACTION_WEIGHTS] if stats.latency_ms(a, by=0)},
+        "by_page": {p: stats.latency_ms(p, by=1) for p in PAGES if stats.latency_ms(p, by=1)},
+    }
+    # baseline: (이전 단계 사용자 수, 그때의 정상 상태 RSS KB) — 첫 단계는 (0, 준비 세션 후 RSS)
+    steady = steady_rss(stats)
+    if baseline is not None and baseline[1] is not None and steady is not None:
+        prev_users, prev_rss = baseline
+        report["rss_baseline_mb"] = prev_rss / 1024
+        report["rss_steady_mb"] = steady / 1024
+        report["rss_peak_mb"] = stats.rss_peak / 1024
+        if users > prev_users:
+            report["rss_per_session_mb"] = (steady - prev_rss) / 1024 / (users - prev_users)
+    return report
+
+
+def print_stage(report, slo_ms):
+    lat = report["latency_ms"]
+    print(f"\n👥 동시 사용자 {report['users']}명 — rerun {report['reruns']}회, "
+          f"{report['throughput_rps']:.2f} rerun/s, 실패 {report['failed_reruns']}회, 연결 오류 {len(report['errors'])}건")
+    if lat:
+        flag = " ⚠️ SLO 초과" if lat["p95"] > slo_ms else ""
+        print(f"   지연(ms) p50 {lat['p50']:.0f} · p90 {lat['p90']:.0f} · p95 {lat['p95']:.0f} · p99 {lat['p99']:.0f} · max {lat['max']:.0f}{flag}")
+    for name, group in {**report["by_action"], **report["by_page"]}.items():
+        print(f"   - {name:<24} n={group['n']:<4} p50 {group['p50']:>7.0f} · p95 {group['p95']:>7.0f}")
+    if "rss_steady_mb" in report:
+        per_session = f", 늘어난 세션당 {report['rss_per_session_mb']:.2f} MB" if "rss_per_session_mb" in report else ""
+        print(f"   🧠 서버 RSS 기준 {report['rss_baseline_mb']:.0f} → 정상 상태 {report['rss_steady_mb']:.0f} MB "
+              f"(최대 {report['rss_peak_mb']:.0f} MB{per_session})")
+    for error in report["errors"][:5]:
+        print(f"   ❌ {error}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 Streamlit 앱에 가상 사용자를 붙여 처리량/지연/메모리를 측정합니다.")
+    parser.add_argument("--url", default="http://127.0.0.1:8501", help="앱 주소 (기본: http://127.0.0.1:8501)")
+    parser.add_argument("--launch", action="store_true", help="--url 의 포트로 streamlit_app.py 를 직접 띄워서 측정")
+    parser.add_argument("--server-pid", type=int, help="메모리를 잴 Streamlit 서버 PID (--launch 면 자동)")
+    parser.add_argument("--users", default="10", help="동시 사용자 수, 쉼표로 여러 단계 지정 (예: 5,10,20,40)")
+    parser.add_argument("--duration", type=float, default=60, help="단계별 측정 시간 (초)")
+    parser.add_argument("--ramp", type=float, default=5, help="사용자를 나눠 붙이는 시간 (초)")
+    parser.add_argument("--think", type=float, nargs=2, default=(2.0, 8.0), metavar=("MIN", "MAX"), help="동작 사이 쉬는 시간 범위 (초)")
+    parser.add_argument("--slo", type=float, default=1000, help="p95 지연 허용치 (ms), 넘으면 표시")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args(argv)
+
+    base = args.url.rstrip("/")
+    ws_url = base.replace("http://", "ws://").replace("https://", "wss://") + "/_stcore/stream"
+    stages = [int(n) for n in args.users.split(",")]
+
+    proc = None
+    pid = args.server_pid
+    if args.launch:
+        proc = launch_server(int(base.rsplit(":", 1)[1]))
+        pid = proc.pid
+    try:
+        reports = []
+        baseline = (0, warm_baseline_rss(ws_url, pid, args.seed)) if pid else None
+        for users in stages:
+            started = time.perf_counter()
+            stats = asyncio.run(run_stage(ws_url, users, args.duration, tuple(args.think), args.ramp, args.seed, pid))
+            report = stage_report(users, stats, time.perf_counter() - started, baseline)
+            print_stage(report, args.slo)
+            reports.append(report)
+            if pid:
+                baseline = (users, steady_rss(stats))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    healthy = [r["users"] for r in reports if r["latency_ms"] and r["latency_ms"]["p95"] <= args.slo and not r["errors"]]
+    print(f"\n📈 p95 ≤ {args.slo:.0f}ms 를 지킨 최대 동시 사용자: {max(healthy) if healthy else '없음'}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"url": base, "think": args.think, "duration": args.duration, "stages": reports}, f, ensure_ascii=False, indent=2)
+    return 0 if healthy else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+# 운영 지표 (Prometheus 텍스트 형식)
+# 페이지별 rerun 수와 렌더링 지연 히스토그램, 데이터 로더 캐시 적중/미스/축출, 활성 세션 수, 프로세스 RSS 를
+# 프로세스 메모리에 모아 두었다가 ops 서버의 /metrics 로 내보냅니다. (추가 패키지 없이 직접 직렬화)
+#
+#   EXPLORER_METRICS=1 streamlit run streamlit_app.py
+#   curl -s localhost:8503/metrics
+import functools
+import os
+import platform
+import threading
+import time
+from contextlib import contextmanager
+
+METRICS_ENV = "EXPLORER_METRICS"
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def enabled():
+    return os.environ.get(METRICS_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=""):
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+# 1. 지표 종류
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help_text, labels=()):
+        self.name, self.help, self.label_names = name, help_text, tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels[name] for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(tuple(labels[name] for name in self.label_names), 0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, _labels(self.label_names, key), value) for key, value in sorted(self._values.items())]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labels=(), collect=None):
+        super().__init__(name, help_text, labels)
+        self.collect = collect   # 내보낼 때 값을 읽어 오는 함수 (선택)
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[tuple(labels[name] for name in self.label_names)] = value
+
+    def samples(self):
+        if self.collect is not None:
+            value = self.collect()
+            if value is None:
+                # 이 환경에서 잴 수 없는 값은 표본 없이 HELP/TYPE 만 남김
+                return []
+            self.set(value)
+        return super().samples()
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name, self.help, self.label_names = name, help_text, tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}   # 라벨 -> [버킷별 누적 개수..., 합계, 개수]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels[name] for name in self.label_names)
+        with self._lock:
+            series = self._series.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self):
+        rows = []
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series):
+                    rows.append((f"{self.name}_bucket", _labels(self.label_names, key, f'le="{bound:g}"'), count))
+                rows.append((f"{self.name}_bucket", _labels(self.label_names, key, 'le="+Inf"'), series[-1]))
+                rows.append((f"{self.name}_sum", _labels(self.label_names, key), series[-2]))
+                rows.append((f"{self.name}_count", _labels(self.label_names, key), series[-1]))
+        return rows
+
+
+# 2. 프로세스/세션 정보
+def process_rss_bytes():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # /proc 가 없는 OS(macOS 등)는 최대 RSS 로 대신 (macOS 는 바이트, 그 외는 KB 단위)
+    # resource 모듈은 Unix 에만 있으므로 여기서 불러오고, Windows 에서는 None (지표를 내보내지 않음)
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if platform.system() == "Darwin" else peak * 1024
+
+
+_sessions = set()
+_sessions_lock = threading.Lock()
+
+# rerun 마다 현재 세션 id 를 기록 (get_script_run_ctx)
+def touch_session():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        with _sessions_lock:
+            _sessions.add(ctx.session_id)
+
+
+# 기록된 세션 중 런타임에 아직 연결돼 있는 것만 세고, 끊긴 세션은 정리
+def active_sessions():
+    from streamlit import runtime
+
+    if not runtime.exists():
+        return len(_sessions)
+    instance = runtime.get_instance()
+    with _sessions_lock:
+        _sessions.intersection_update({sid for sid in _sessions if instance.is_active_session(sid)})
+        return len(_sessions)
+
+
+# 3. 앱 지표
+PAGE_RERUNS = Counter("explorer_page_reruns_total", "main() 에서 페이지가 실행된 횟수", ["page"])
+PAGE_ERRORS = Counter("explorer_page_errors_total", "페이지 실행 중 예외 수", ["page"])
+PAGE_LATENCY = Histogram("explorer_page_render_seconds", "페이지 함수 실행 시간 (초)", ["page"])
+CACHE_HITS = Counter("explorer_cache_hits_total", "캐시 적중 (저장된 값을 그대로 돌려준 횟수)", ["cache"])
+CACHE_MISSES = Counter("explorer_cache_misses_total", "캐시 미스 (함수 본문이 실제로 실행된 횟수)", ["cache"])
+CACHE_EVICTIONS = Counter("explorer_cache_evictions_total", "이미 계산했던 인자가 다시 계산된 횟수 (비우기/교체로 축출됨)", ["cache"])
+ACTIVE_SESSIONS = Gauge("explorer_active_sessions", "현재 연결된 세션 수", collect=active_sessions)
+PROCESS_RSS = Gauge("process_resident_memory_bytes", "프로세스 RSS (바이트)", collect=process_rss_bytes)
+
+_seen_keys = {}
+_seen_lock = threading.Lock()
+_call = threading.local()   # 캐시 본문은 호출한 스레드에서 실행되므로, 이번 호출이 미스였는지 스레드별로 표시
+
+# 캐시된 함수의 바깥쪽에 씌워 본문이 실행되지 않은 호출을 적중으로 셈 (.clear 는 그대로 노출)
+def track_cache(name):
+    def decorate(cached):
+        @functools.wraps(cached)
+        def wrapper(*args, **kwargs):
+            _call.missed = False
+            result = cached(*args, **kwargs)
+            if not _call.missed:
+                CACHE_HITS.inc(cache=name)
+            return result
+        wrapper.clear = cached.clear
+        return wrapper
+    return decorate
+
+
+# 캐시된 함수 본문 첫 줄에서 호출 — 전에 계산했던 인자가 또 들어오면 축출된 것으로 봄
+def cache_miss(name, *args):
+    _call.missed = True
+    CACHE_MISSES.inc(cache=name)
+    key = repr(args)
+    with _seen_lock:
+        seen = _seen_keys.setdefault(name, set())
+        evicted = key in seen
+        seen.add(key)
+    if evicted:
+        CACHE_EVICTIONS.inc(cache=name)
+
+
+@contextmanager
+def page_timer(page):
+    PAGE_RERUNS.inc(page=page)
+    with PAGE_LATENCY.time(page=page):
+        try:
+            yield
+        except Exception:
+            PAGE_ERRORS.inc(page=page)
+            raise
+
+
+# 4. 직렬화
+def render(metrics=None):
+    metrics = metrics or [PAGE_RERUNS, PAGE_ERRORS, PAGE_LATENCY, CACHE_HITS, CACHE_MISSES, CACHE_EVICTIONS,
+                          ACTIVE_SESSIONS, PROCESS_RSS]
+    lines = []
+    for metric in metrics:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{labels} {value:g}" if isinstance(value, float) else f"{name}{labels} {value}")
+    return ("\n".join(lines) + "\n").encode("utf-8")
@@ -0,0 +1,76 @@
+# 운영용 HTTP 엔드포인트: Streamlit 앱 프로세스 안에서 별도 포트로 상태를 알려주는 작은 서버
+# Streamlit 서버(uvicorn)에는 임의의 경로를 붙일 수 없으므로, 데몬 스레드에서 ThreadingHTTPServer 를 따로 띄웁니다.
+#
+#   EXPLORER_WARMUP=1 streamlit run streamlit_app.py
+#   curl -s localhost:8503/health
+#   EXPLORER_METRICS=1 streamlit run streamlit_app.py
+#   curl -s localhost:8503/metrics
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+DEFAULT_PORT = 8503
+
+
+def ops_port():
+    return int(os.environ.get("EXPLORER_OPS_PORT", DEFAULT_PORT))
+
+
+def json_response(payload, status=200):
+    return status, "application/json; charset=utf-8", json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+
+
+class OpsServer:
+    def __init__(self, host="127.0.0.1", port=None):
+        self.host = host
+        self.port = ops_port() if port is None else port
+        self.routes = {}   # 경로 -> 함수() -> (상태 코드, Content-Type, 본문 bytes)
+        self._server = None
+
+    def route(self, path, handler):
+        self.routes[path] = handler
+
+    def _make_handler(self):
+        ops = self
+
+        class Handler(BaseHTTPRequestHandler):
+            server_version = "ExplorerOps/1.0"
+
+            def do_GET(self):
+                path = urlsplit(self.path).path.rstrip("/") or "/"
+                if path in ops.routes:
+                    try:
+                        status, content_type, body = ops.routes[path]()
+                    except Exception as e:
+                        status, content_type, body = json_response({"error": f"{type(e).__name__}: {e}"}, 500)
+                else:
+                    status, content_type, body = json_response({"error": f"not found: {path}", "routes": sorted(ops.routes)}, 404)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # 헬스 체크 폴링이 앱 로그를 덮지 않도록 접근 로그는 남기지 않음
+                pass
+
+        return Handler
+
+    # 포트를 이미 다른 프로세스가 쓰고 있으면 False (앱은 그대로 동작)
+    def start(self):
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        except OSError:
+            return False
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="ops-server", daemon=True).start()
+        return True
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
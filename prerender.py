@@ -0,0 +1,337 @@
+# 정적 사전 렌더링: 결과가 데이터 파일만으로 정해지는 페이지를 정적 HTML 묶음으로 저장합니다.
+# 각 페이지를 Streamlit 테스트 러너(AppTest)로 한 번 실행해 요소 트리를 HTML 로 옮기며,
+# Plotly 차트는 공용 plotly.min.js 로, pydeck 지도는 deck.gl HTML(iframe) 로, 워드 클라우드 이미지는 site/assets 로 복사해 그립니다.
+# 입력(데이터 파일 + 앱 소스) 해시가 바뀐 페이지만 프로세스 풀에서 병렬로 다시 만듭니다.
+# AppTest 요소 트리(at.main)와 미디어 파일 id 계산은 Streamlit 버전에 따라 바뀔 수 있어
+# requirements.txt 에 검증한 streamlit 버전을 고정해 둡니다. (올릴 때는 사전 렌더링 결과를 다시 확인)
+#
+#   python prerender.py              # site/ 에 정적 페이지 생성 (변경 없으면 건너뜀)
+#   python prerender.py --all        # 대화형 페이지도 기본 상태로 함께 스냅샷
+#   python -m http.server -d site    # 정적 파일로 서비스
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUT_DIR = os.path.join(APP_DIR, "site")
+MANIFEST_NAME = "manifest.json"
+SOURCE_FILES = ("streamlit_app.py", "analytics.py", "datastore.py", "catalog.py", "registry.py", "scoring.py", "service.py", "textcloud.py", "prerender.py")
+
+# (파일 이름, 페이지 함수, 메뉴 이름, 데이터만으로 결과가 정해지는지)
+PAGES = [
+    ("index", "page_title_screen", "0. 프롤로그", True),
+    ("intro", "page_intro", "1. 항해 시작 (Intro)", True),
+    ("trend", "page_keyword_analysis", "2. 신호 탐지 (Trend)", False),
+    ("map", "page_map_visualization", "3. 행성 좌표 (Map)", True),
+    ("info", "page_company_info", "4. 기업 상세 데이터 (Info)", True),
+    ("research", "page_scholar_analysis", "5. 심우주 탐사 (Research)", False),
+    ("conclusion", "page_conclusion", "6. 궤도 안착 (Conclusion)", True),
+    ("explore", "page_data_explorer", "7. 데이터 탐색 (Explore)", False),
+]
+
+PAGE_CSS = """
+body { margin: 0; font-family: 'AppleGothic', 'Malgun Gothic', sans-serif; }
+.stApp { min-height: 100vh; display: flex; }
+.static-sidebar { width: 260px; padding: 20px 15px; background: #383838; flex-shrink: 0; }
+.static-sidebar a { display: block; padding: 8px 12px; margin-bottom: 4px; border-radius: 8px; text-decoration: none; color: #FFFFFF !important; font-size: 14px; }
+.static-sidebar a.active { background: #424242; color: #29B6F6 !important; border-left: 4px solid #29B6F6; }
+.static-main { flex: 1; padding: 40px 60px; min-width: 0; }
+.static-row { display: flex; gap: 16px; align-items: flex-start; }
+.static-col { min-width: 0; }
+.static-alert { padding: 16px; border-radius: 8px; margin: 8px 0; }
+.static-alert-info { background: rgba(41, 182, 246, 0.15); }
+.static-alert-warning { background: rgba(255, 193, 7, 0.15); }
+.static-alert-success { background: rgba(76, 175, 80, 0.15); }
+.static-alert-error { background: rgba(244, 67, 54, 0.15); }
+.static-tab-label { margin-top: 20px; }
+.static-note { color: #B0BEC5 !important; font-size: 13px; }
+table.dataframe { border-collapse: collapse; width: 100%; font-size: 14px; }
+table.dataframe td, table.dataframe th { border: 1px solid rgba(255,255,255,0.2); padding: 4px 8px; }
+"""
+
+
+# 입력 해시: 데이터 파일 내용 + 렌더링 결과에 영향을 주는 소스 파일
+def input_hash():
+    import catalog
+
+    digest = hashlib.sha1()
+    data_catalog = catalog.DatasetCatalog()
+    paths = [data_catalog.path(name) for name in data_catalog.names()] + list(SOURCE_FILES)
+    for path in sorted(paths):
+        digest.update(path.encode())
+        if os.path.exists(path):
+            digest.update(catalog._content_hash(path).encode())
+    return digest.hexdigest()
+
+
+_LIST_ITEM = re.compile(r"^\s*[-*]\s+")
+
+
+# st.markdown 본문 중 HTML 이 아닌 부분을 위한 최소 마크다운 변환 (제목, 굵게, 기울임, 목록, 줄바꿈)
+def markdown_to_html(text):
+    if text.lstrip().startswith("<"):
+        return text
+    lines = []
+    for line in text.strip().splitlines():
+        heading = re.match(r"^(#{1,6})\s+(.*)$", line)
+        if heading:
+            level = len(heading.group(1))
+            lines.append(f"<h{level}>{_inline_markdown(heading.group(2))}</h{level}>")
+        elif _LIST_ITEM.match(line):
+            lines.append(f"<li>{_inline_markdown(_LIST_ITEM.sub('', line))}</li>")
+        elif line.strip():
+            lines.append(f"<p>{_inline_markdown(line)}</p>")
+    return "\n".join(lines)
+
+
+def _inline_markdown(text):
+    text = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", text)
+    text = re.sub(r"(?<!\*)\*(?!\*)(.+?)\*", r"<i>\1</i>", text)
+    return text
+
+
+# AppTest 는 st.image 를 '/mock/media/<id>.png' 주소로만 남기므로, 같은 id(내용 해시)를 갖는 워드 클라우드 캐시 PNG 를 찾음
+def cached_images():
+    import textcloud
+    from streamlit.runtime.media_file_storage import MediaFileKind
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+
+    # st.image 와 같은 저장소에 올려 보면 AppTest 가 준 것과 같은 id 가 나옴
+    storage = MemoryMediaFileStorage("/mock/media")
+    images = {}
+    if os.path.isdir(textcloud.CACHE_DIR):
+        for name in os.listdir(textcloud.CACHE_DIR):
+            if name.endswith(".png"):
+                path = os.path.join(textcloud.CACHE_DIR, name)
+                images[storage.load_and_get_id(path, "image/png", MediaFileKind.MEDIA)] = path
+    return images
+
+
+class ElementRenderer:
+    def __init__(self, slug, out_dir):
+        self.slug = slug
+        self.out_dir = out_dir
+        self.chart_count = 0
+        self._images = None
+
+    def render(self, node):
+        from streamlit.testing.v1 import element_tree as et
+
+        if isinstance(node, et.Tab):
+            return f"<h3 class='static-tab-label'>{html.escape(node.label)}</h3><div class='stTabs'><div data-baseweb='tab-panel'>{self.render_children(node)}</div></div>"
+        if isinstance(node, et.Expander):
+            return f"<div data-testid='stExpander'><details open><summary><p>{html.escape(node.label)}</p></summary>{self.render_children(node)}</details></div>"
+        if isinstance(node, et.Column):
+            return f"<div class='static-col' style='flex: {node.weight};'>{self.render_children(node)}</div>"
+        if isinstance(node, et.Block):
+            if node.type == "flex_container" and any(isinstance(child, et.Column) for child in node.children.values()):
+                return f"<div class='static-row'>{self.render_children(node)}</div>"
+            return self.render_children(node)
+        return self.render_element(node)
+
+    def render_children(self, node):
+        return "\n".join(self.render(node.children[key]) for key in sorted(node.children))
+
+    def render_element(self, el):
+        from streamlit.testing.v1 import element_tree as et
+
+        if isinstance(el, et.Divider):
+            return "<hr>"
+        if isinstance(el, et.HeadingBase):
+            tag = el.proto.tag or "h2"
+            return f"<{tag}>{html.escape(el.value)}</{tag}>"
+        if isinstance(el, et.Caption):
+            return f"<div class='stCaption'><small>{markdown_to_html(el.value)}</small></div>"
+        if isinstance(el, et.Markdown):
+            return markdown_to_html(el.value)
+        if isinstance(el, et.AlertBase):
+            kind = el.type if el.type in ("info", "warning", "success", "error") else "info"
+            return f"<div class='static-alert static-alert-{kind}'>{markdown_to_html(el.value.replace(chr(10), chr(10) + chr(10)))}</div>"
+        if isinstance(el, et.Metric):
+            return (f"<div data-testid='stMetric'><small>{html.escape(el.label)}</small>"
+                    f"<div style='font-size: 32px;'>{html.escape(el.value)}</div>"
+                    f"<small>{html.escape(el.delta or '')}</small></div>")
+        if isinstance(el, (et.Dataframe, et.Table)):
+            return el.value.to_html(classes="dataframe", border=0)
+        if el.type == "plotly_chart":
+            return self.render_plotly(el.proto)
+        if el.type == "deck_gl_json_chart":
+            return self.render_deck(el.proto)
+        if el.type == "image":
+            return self.render_images(el.proto)
+        if isinstance(el, et.Widget):
+            return f"<p class='static-note'>🛰️ '{html.escape(str(getattr(el, 'label', '')))}' 입력은 실시간 앱에서 사용할 수 있습니다.</p>"
+        return ""
+
+    def render_plotly(self, proto):
+        self.chart_count += 1
+        div_id = f"{self.slug}-chart-{self.chart_count}"
+        spec = proto.spec or proto.figure.spec
+        config = proto.config or "{}"
+        return (f"<div id='{div_id}' style='width: 100%; min-height: 450px;'></div>"
+                f"<script>(function() {{ var fig = {spec}; Plotly.newPlot('{div_id}', fig.data, fig.layout, Object.assign({{responsive: true}}, {config})); }})();</script>")
+
+    def render_images(self, proto):
+        if self._images is None:
+            self._images = cached_images()
+        parts = []
+        for img in proto.imgs:
+            file_id = os.path.splitext(os.path.basename(img.url))[0]
+            source = self._images.get(file_id)
+            if source is None:
+                parts.append("<p class='static-note'>🛰️ 이 이미지는 실시간 앱에서 볼 수 있습니다.</p>")
+                continue
+            name = f"{file_id}.png"
+            target = os.path.join(self.out_dir, "assets", name)
+            if not os.path.exists(target):
+                shutil.copyfile(source, target)
+            caption = f"<div class='stCaption'><small>{html.escape(img.caption)}</small></div>" if img.caption else ""
+            parts.append(f"<div data-testid='stImage'><img src='assets/{name}' style='width: 100%;'>{caption}</div>")
+        return "\n".join(parts)
+
+    def render_deck(self, proto):
+        from pydeck.io.html import render_json_to_html
+
+        tooltip = json.loads(proto.tooltip) if proto.tooltip else True
+        deck_html = render_json_to_html(proto.json, tooltip=tooltip, css_background_color="#2b2b2b")
+        return f"<iframe srcdoc='{html.escape(deck_html, quote=True)}' style='width: 100%; height: 500px; border: 0;'></iframe>"
+
+
+def _page_document(slug, title, body, theme_css, slugs):
+    nav = "\n".join(
+        f"<a href='{page_slug}.html' class='{'active' if page_slug == slug else ''}'>{html.escape(label)}</a>"
+        for page_slug, _, label, _ in PAGES if page_slug in slugs
+    )
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<script src="assets/plotly.min.js"></script>
+<style>{PAGE_CSS}</style>
+{theme_css}
+</head>
+<body>
+<div class="stApp">
+<nav class="static-sidebar"><h2 style="font-size: 20px;">🛸 탐사선 제어 패널</h2>{nav}</nav>
+<main class="static-main">
+{body}
+</main>
+</div>
+</body>
+</html>
+"""
+
+
+# 한 페이지 렌더링 (프로세스 풀 작업 단위)
+def render_page(slug, function_name, label, out_dir, slugs):
+    from streamlit.testing.v1 import AppTest
+
+    started = time.perf_counter()
+    script = (
+        "import os, sys\n"
+        f"sys.path.insert(0, {APP_DIR!r})\n"
+        f"os.chdir({APP_DIR!r})\n"
+        "import streamlit_app\n"
+        f"streamlit_app.{function_name}()\n"
+    )
+    # AppTest 는 실행 중 __main__ 모듈을 바꿔 끼우므로, 풀 작업자가 다음 작업을 받을 수 있게 되돌려 둠
+    main_module = sys.modules["__main__"]
+    try:
+        at = AppTest.from_string(script, default_timeout=120)
+        at.run()
+        # 워드 클라우드는 백그라운드 스레드가 그리므로, 아직 그리는 중이었다면 끝난 뒤 한 번 더 실행해 이미지를 받음
+        app = sys.modules.get("streamlit_app")
+        if app is not None and app.get_cloud_renderer().wait(timeout=120):
+            at.run()
+    finally:
+        sys.modules["__main__"] = main_module
+    if at.exception:
+        raise RuntimeError(f"{function_name}: {at.exception[0].value}")
+
+    main_block = at.main
+    children = [main_block.children[key] for key in sorted(main_block.children)]
+    # 첫 번째 <style> 마크다운(앱 테마 CSS)은 <head> 로 옮김
+    theme_css = ""
+    if children and getattr(children[0], "type", None) == "markdown" and children[0].value.lstrip().startswith("<style>"):
+        theme_css = children.pop(0).value
+
+    renderer = ElementRenderer(slug, out_dir)
+    body = "\n".join(renderer.render(child) for child in children)
+    document = _page_document(slug, label, body, theme_css, slugs)
+    with open(os.path.join(out_dir, f"{slug}.html"), "w", encoding="utf-8") as f:
+        f.write(document)
+    return slug, time.perf_counter() - started
+
+
+def _write_plotly_asset(out_dir):
+    from plotly.offline import get_plotlyjs
+
+    asset_dir = os.path.join(out_dir, "assets")
+    os.makedirs(asset_dir, exist_ok=True)
+    path = os.path.join(asset_dir, "plotly.min.js")
+    if not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(get_plotlyjs())
+
+
+def build(out_dir=DEFAULT_OUT_DIR, include_interactive=False, force=False, workers=None):
+    os.chdir(APP_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+    current_hash = input_hash()
+    pages = [page for page in PAGES if page[3] or include_interactive]
+    slugs = [page[0] for page in pages]
+    stale = [
+        page for page in pages
+        if force
+        or manifest.get("pages", {}).get(page[0], {}).get("inputs") != current_hash
+        or not os.path.exists(os.path.join(out_dir, f"{page[0]}.html"))
+    ]
+    if not stale:
+        print(f"변경 없음: {len(pages)}개 페이지가 최신 상태입니다. (inputs={current_hash[:12]})")
+        return manifest
+
+    _write_plotly_asset(out_dir)
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(render_page, slug, function_name, label, out_dir, slugs) for slug, function_name, label, _ in stale]
+        for future in futures:
+            slug, elapsed = future.result()
+            results[slug] = elapsed
+            print(f"  ✅ {slug}.html ({elapsed:.1f}s)")
+
+    manifest.setdefault("pages", {})
+    for slug in results:
+        manifest["pages"][slug] = {"inputs": current_hash, "rendered_at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    manifest["inputs"] = current_hash
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    print(f"{len(results)}개 페이지를 다시 만들었습니다 → {out_dir}")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페이지를 정적 HTML 묶음으로 사전 렌더링합니다.")
+    parser.add_argument("--out", default=DEFAULT_OUT_DIR, help="출력 폴더 (기본: site/)")
+    parser.add_argument("--all", action="store_true", help="대화형 페이지도 기본 입력 상태로 스냅샷")
+    parser.add_argument("--force", action="store_true", help="입력 해시와 관계없이 모두 다시 렌더링")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 풀 크기 (기본: CPU 수)")
+    args = parser.parse_args()
+    build(os.path.abspath(args.out), include_interactive=args.all, force=args.force, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
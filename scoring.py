@@ -0,0 +1,112 @@
+# 기업 종합 점수 엔진
+# 고정된 총점 대신, 기업별 구성 지표(브랜드 지수, 트렌드 관심도, 글로벌 확장, 제품 포트폴리오)를
+# (기업 x 지표) 행렬로 한 번 만들어 두고 가중치 벡터와의 곱 하나로 종합 점수를 계산합니다.
+# 가중치 하나가 바뀌면 해당 지표 열만큼만 더하고 빼서(O(기업 수)) 점수를 갱신합니다.
+import re
+
+import numpy as np
+import pandas as pd
+
+COMPONENT_LABELS = {
+    "brand": "브랜드 지수",
+    "trend": "트렌드 관심도",
+    "global": "글로벌 확장",
+    "portfolio": "제품 포트폴리오",
+}
+DEFAULT_WEIGHTS = {"brand": 0.5, "trend": 0.2, "global": 0.2, "portfolio": 0.1}
+
+# 트렌드 키워드가 기업 소개/주력제품에 등장하는 표현
+TREND_ALIASES = {
+    "Matcha": ["말차", "녹차", "matcha"],
+    "Zero": ["제로", "zero", "슈거"],
+    "Protein": ["단백질", "프로틴", "protein", "셀렉스"],
+    "Vegan": ["비건", "식물성", "vegan"],
+    "Slow Aging": ["저속노화", "헬스케어", "건강"],
+}
+GLOBAL_TERMS = ["글로벌", "해외", "수출", "세계", "미국", "중국", "베트남", "러시아", "북미", "k-food"]
+TREND_WINDOW = 12   # 트렌드 관심도: 최근 12주 평균
+REBUILD_EVERY = 256  # 증분 갱신이 이만큼 쌓이면 부동소수 오차를 없애기 위해 전체 재계산
+
+
+# 최댓값을 100 으로 맞춤 (0 은 0 그대로)
+def _scale(values):
+    values = np.asarray(values, dtype=float)
+    top = np.nanmax(values) if len(values) else 0
+    return values / top * 100 if top > 0 else np.zeros_like(values)
+
+
+# (문장 x 표현 묶음) 등장 횟수 행렬
+def mention_matrix(texts, term_groups):
+    texts = [text.lower() for text in texts]
+    return np.array([[sum(text.count(term.lower()) for term in terms) for terms in term_groups] for text in texts], dtype=float)
+
+
+# 1. 구성 지표 (기업명 인덱스, 각 열 0~100)
+# df_map 과 상세 정보는 순위로 연결 (기업명 표기가 서로 다를 수 있음)
+def company_components(df_map, details, df_trend=None):
+    by_rank = {record["순위"]: record for record in details}
+    texts = [f"{by_rank.get(rank, {}).get('소개', '')} {by_rank.get(rank, {}).get('주력제품', '')}" for rank in df_map["순위"]]
+    products = [by_rank.get(rank, {}).get("주력제품", "") for rank in df_map["순위"]]
+
+    trend = np.zeros(len(df_map))
+    if df_trend is not None and len(df_trend):
+        keywords = [k for k in TREND_ALIASES if k in df_trend.columns]
+        exposure = mention_matrix(texts, [TREND_ALIASES[k] for k in keywords])
+        # (기업 x 키워드) 노출 행렬 @ 키워드별 최근 관심도
+        trend = exposure @ df_trend[keywords].iloc[-TREND_WINDOW:].mean().to_numpy(dtype=float)
+
+    components = pd.DataFrame({
+        "brand": _scale(df_map["총점"]),
+        "trend": _scale(trend),
+        "global": _scale(mention_matrix(texts, [GLOBAL_TERMS])[:, 0]),
+        "portfolio": _scale([len([p for p in re.split(r",(?![^(]*\))", text) if p.strip()]) for text in products]),
+    }, index=pd.Index(df_map["기업명"].astype(str), name="기업명"))
+    return components
+
+
+# 2. 점수 엔진 (세션마다 하나, 구성 지표 행렬은 공유)
+class ScoreEngine:
+    def __init__(self, components, weights=None, key=None):
+        self.key = key
+        self.components = components
+        self.names = list(components.columns)
+        self.matrix = components.to_numpy(dtype=float)
+        weights = DEFAULT_WEIGHTS if weights is None else weights
+        self.weights = np.array([float(weights.get(name, 0.0)) for name in self.names])
+        self.updates = 0
+        self.rebuild()
+
+    def rebuild(self):
+        self._raw = self.matrix @ self.weights
+        self._total = self.weights.sum()
+        self.updates = 0
+
+    # 가중치 하나 변경: raw += Δw × 해당 지표 열
+    def set_weight(self, name, value):
+        j = self.names.index(name)
+        delta = float(value) - self.weights[j]
+        if delta == 0:
+            return False
+        self.weights[j] = float(value)
+        self._raw += delta * self.matrix[:, j]
+        # 합계는 지표 수만큼의 덧셈이라 매번 정확히 다시 구함 (모두 0 일 때 오차로 0 이 아닌 값이 남지 않도록)
+        self._total = self.weights.sum()
+        self.updates += 1
+        if self.updates >= REBUILD_EVERY:
+            self.rebuild()
+        return True
+
+    def set_weights(self, weights):
+        return sum(self.set_weight(name, value) for name, value in weights.items())
+
+    def scores(self):
+        values = self._raw / self._total if self._total > 0 else np.zeros(len(self._raw))
+        return pd.Series(values, index=self.components.index, name="종합점수")
+
+    # 구성 지표 + 종합점수 + 순위 (점수 내림차순)
+    def ranking(self):
+        table = pd.DataFrame(self.matrix, index=self.components.index, columns=self.names)
+        table["종합점수"] = self.scores()
+        table = table.sort_values("종합점수", ascending=False)
+        table.insert(0, "순위", np.arange(1, len(table) + 1))
+        return table
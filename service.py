@@ -0,0 +1,118 @@
+# 헤드리스 분석 서비스: Streamlit 없이 데이터를 읽고 분석 결과를 데이터 버전별로 캐시합니다.
+# (API 사이드카, 배치 CLI 가 사용하며, Streamlit 앱의 로더도 같은 로드 함수를 씁니다)
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import analytics
+import catalog
+import datastore
+import registry
+
+TREND_DATASET = "food_trends"
+SCHOLAR_DATASET = "scholar_data"
+MEMO_SIZE = 64   # 데이터 버전 하나 안에서 기억할 (이름, 인자) 결과 수 (오래 안 쓴 것부터 버림)
+
+# CSV 가 없을 때 보여줄 예시 데이터
+FALLBACK_SCHOLAR = {
+    "Year": range(2015, 2026),
+    "Food Safety": [145, 158, 172, 189, 205, 234, 287, 312, 341, 378, 392],
+    "Alternative Meat": [42, 51, 63, 78, 92, 118, 156, 198, 245, 298, 334],
+    "Gut Microbiome": [89, 102, 124, 147, 178, 215, 268, 312, 385, 442, 480],
+    "Food Tech": [76, 85, 98, 115, 138, 167, 212, 261, 318, 385, 421],
+    "AI": [58, 67, 81, 102, 135, 178, 241, 318, 412, 521, 598]
+}
+
+
+def _fallback_trend_frame():
+    dates = pd.date_range(start="2024-01-01", periods=52, freq="W")
+    data = {
+        "Date": dates,
+        "저속노화": np.random.randint(10, 80, size=52),
+        "제로슈거": np.random.randint(30, 100, size=52),
+        "단백질": np.random.randint(50, 90, size=52),
+        "비건": np.random.randint(20, 60, size=52),
+        "대체육": np.random.randint(10, 50, size=52)
+    }
+    df = pd.DataFrame(data)
+    df.set_index("Date", inplace=True)
+    return df
+
+
+# 정리된 트렌드 데이터 (청크 단위 정리·검증 후 읽기 전용)
+def load_trend_frame(data_catalog, dataset=TREND_DATASET):
+    if dataset not in data_catalog:
+        return datastore.freeze_frame(datastore.compact_frame(_fallback_trend_frame()))
+    df = data_catalog.read(dataset, transform=analytics.clean_trend_frame, validate=analytics.validate_trend_frame)
+    return datastore.freeze_frame(df)
+
+
+def load_scholar_frame(data_catalog, dataset=SCHOLAR_DATASET):
+    if dataset not in data_catalog:
+        return datastore.freeze_frame(datastore.compact_frame(pd.DataFrame(FALLBACK_SCHOLAR)))
+    return data_catalog.load(dataset)
+
+
+class AnalyticsService:
+    def __init__(self, roots=catalog.DATA_ROOTS, trend_dataset=TREND_DATASET, scholar_dataset=SCHOLAR_DATASET, memo_size=MEMO_SIZE):
+        self.catalog = catalog.DatasetCatalog(roots)
+        self.trend_dataset = trend_dataset
+        self.scholar_dataset = scholar_dataset
+        self.memo_size = memo_size
+        self._version = None
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    # 데이터 버전: 입력 파일 크기/수정 시각에서 만든 짧은 해시
+    def version(self):
+        raw = self.catalog.version(self.trend_dataset, self.scholar_dataset)
+        return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+    # (이름, 인자, 데이터 버전) 별로 한 번만 계산. 버전이 바뀌면 이전 결과는 버리고, 같은 버전 안에서도 LRU 로 상한 유지
+    def _memo(self, key, compute):
+        version = self.version()
+        with self._lock:
+            if self._version != version:
+                self._version, self._cache = version, OrderedDict()
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        value = compute()
+        with self._lock:
+            if self._version == version:
+                self._cache[key] = value
+                while len(self._cache) > self.memo_size:
+                    self._cache.popitem(last=False)
+        return value
+
+    def trends(self):
+        return self._memo(("trends",), lambda: load_trend_frame(self.catalog, self.trend_dataset))
+
+    def scholar(self):
+        return self._memo(("scholar",), lambda: load_scholar_frame(self.catalog, self.scholar_dataset))
+
+    def companies(self):
+        return self._memo(("companies",), registry.company_frames)
+
+    def trend_summary(self, window=4):
+        return self._memo(("trend_summary", window), lambda: analytics.recent_summary(self.trends(), window))
+
+    # 키워드를 안 주면 전체 — 캐시 키에는 전체 키워드 목록 대신 None 을 넣음
+    def correlation_pairs(self, keywords=None):
+        keywords = tuple(keywords) if keywords else None
+        return self._memo(("correlation_pairs", keywords),
+                          lambda: analytics.correlation_pairs(self.trends(), None if keywords is None else list(keywords)))
+
+    def top_correlation_pairs(self, k, keywords=None):
+        keywords = tuple(keywords) if keywords else None
+        return self._memo(("top_correlation_pairs", k, keywords),
+                          lambda: analytics.top_correlation_pairs(self.trends(), k, None if keywords is None else list(keywords)))
+
+    def scholar_metrics(self):
+        return self._memo(("scholar_metrics",), lambda: analytics.scholar_growth_metrics(self.scholar()))
+
+    def lead_lag(self, freq="YS"):
+        return self._memo(("lead_lag", freq), lambda: analytics.lead_lag_table(self.scholar(), self.trends(), freq=freq))
@@ -2,13 +2,26 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
+import plotly.figure_factory as ff
 import pydeck as pdk
 import matplotlib.pyplot as plt
 import os
 from matplotlib import rc, font_manager
+from types import MappingProxyType
 import platform
 import time
+import datetime
 from streamlit_option_menu import option_menu
+import analytics
+import catalog
+import datastore
+import metrics
+import ops_server
+import registry
+import scoring
+import service
+import textcloud
+import warmup
 
 # 1. 페이지 설정
 st.set_page_config(
@@ -176,140 +189,158 @@ apply_custom_theme()
 
 SPACE_PALETTE = ['#00E5FF', '#FF4081', '#E040FB', '#C6FF00', '#FFFFFF']
 CHART_THEME = "plotly_dark"
+HEATMAP_TEXT_MAX = 12    # 이보다 많은 칸은 숫자 주석 없이 색만 표시
+HEATMAP_BLOCK_MIN = 20   # 군집 정렬에서 이보다 많은 키워드는 군집 블록으로 묶어 표시
+HEATMAP_BLOCK_MAX = 12
 
-# 4. 데이터 로드 함수
-@st.cache_data
-def load_data(file_path):
-    if not os.path.exists(file_path):
-        dates = pd.date_range(start="2024-01-01", periods=52, freq="W")
-        data = {
-            "Date": dates,
-            "저속노화": np.random.randint(10, 80, size=52),
-            "제로슈거": np.random.randint(30, 100, size=52),
-            "단백질": np.random.randint(50, 90, size=52),
-            "비건": np.random.randint(20, 60, size=52),
-            "대체육": np.random.randint(10, 50, size=52)
-        }
-        df = pd.DataFrame(data)
-        df.set_index("Date", inplace=True)
-        return df
-    try:
-        df = pd.read_csv(file_path, encoding='utf-8')
-    except UnicodeDecodeError:
-        df = pd.read_csv(file_path, encoding='euc-kr')
-    return df
+# 오프라인 지도 배경: tile_server.py 의 style.json 주소 (비워 두면 기본 CARTO 배경)
+BASEMAP_STYLE_URL = os.environ.get("EXPLORER_BASEMAP_URL")
 
-@st.cache_data
+# 4. 데이터 로드 함수
+# 정리된 데이터셋은 프로세스당 한 번만 만들고(cache_resource), 읽기 전용 배열로 모든 세션이 공유합니다.
+TREND_DATASET = service.TREND_DATASET
+SCHOLAR_DATASET = service.SCHOLAR_DATASET
+
+# data/ 폴더 카탈로그 (프로세스당 하나, 파일이 바뀌면 main() 에서 다시 스캔)
+@st.cache_resource
+def get_catalog():
+    return catalog.DatasetCatalog()
+
+# 세 로더는 호출(track_cache)과 실제 계산(cache_miss)을 세어 /metrics 에 캐시 적중/미스/축출로 내보냄
+# 파일 데이터는 데이터 버전을 캐시 키에 넣어, CSV 가 바뀌면 버전별 파생 캐시도 새 프레임으로 계산되도록 함
+@metrics.track_cache("load_data")
+@st.cache_resource(max_entries=4)
+def load_data_version(dataset, version):
+    metrics.cache_miss("load_data", dataset, version)
+    return service.load_trend_frame(get_catalog(), dataset)
+
+def load_data(dataset):
+    return load_data_version(dataset, get_catalog().version(dataset))
+
+@metrics.track_cache("get_company_data")
+@st.cache_resource
 def get_company_data():
-    data_map = {
-        "순위": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        "기업명": ["농심", "오리온", "CJ제일제당", "삼양식품", "풀무원", 
-                "빙그레", "매일유업", "하이트진로", "롯데칠성음료", "대상"],
-        "총점": [177, 163, 159, 152, 152, 149, 142, 140, 132, 126],
-        "주소": [
-            "서울 동작구 여의대방로 112", "서울 용산구 백범로 90다길 13", "서울 중구 동호로 330", 
-            "서울 종로구 종로33길 31", "충북 음성군 대소면 삼양로 730-27", "서울 종로구 새문안로 76",
-            "서울 종로구 종로1길 50", "서울 강서구 공항대로 49", "서울 강남구 테헤란로 521", "서울 종로구 창경궁로 120"
-        ],
-        "lat": [37.51008, 37.53584, 37.46575, 37.57694, 36.61402, 
-                37.56975, 37.56789, 37.56934, 37.47320, 37.57644],
-        "lon": [126.96212, 126.97442, 126.97150, 126.99550, 127.08162, 
-                126.98507, 126.97555, 126.85240, 127.06268, 127.00220]
-    }
-    df_map = pd.DataFrame(data_map)
-    company_details = [
-        {
-            "순위": 1, 
-            "기업명": "농심", 
-            "소개": "1965년 설립, '한국의 맛'을 세계로 전하는 국내 부동의 1위 식품 기업. 라면 시장 점유율 50% 이상을 차지하며, 최근 미국 제2공장 가동과 함께 북미 시장에서 폭발적인 성장을 기록 중입니다.", 
-            "주력제품": "신라면(블랙/레드), 짜파게티, 너구리, 새우깡, 먹태깡, 백산수", 
-            "비전": "Life with Good Health", 
-            "홈페이지": "https://www.nongshim.com", 
-            "유튜브": "https://www.youtube.com/@nongshim"
-        },
-        {
-            "순위": 2, 
-            "기업명": "오리온", 
-            "소개": "제과를 넘어 닥터유(건강), 바이오로 확장 중인 글로벌 식품 헬스케어 기업. 중국, 베트남, 러시아 법인의 고성장으로 해외 매출 비중이 국내를 넘어선 진정한 글로벌 기업입니다.", 
-            "주력제품": "초코파이 情, 포카칩, 꼬북칩, 닥터유(단백질바), 마켓오", 
-            "비전": "Global Food & Healthcare Company", 
-            "홈페이지": "https://www.orionworld.com", 
-            "유튜브": "https://www.youtube.com/@ORIONworld"
-        },
-        {
-            "순위": 3, 
-            "기업명": "CJ제일제당", 
-            "소개": "국내 식품 산업을 이끄는 최대 규모의 기업이자 글로벌 바이오 강자. '비비고' 브랜드로 K-Food의 세계화를 주도하고 있으며, 그린 바이오(사료용 아미노산) 분야 세계 1위 경쟁력을 보유했습니다.", 
-            "주력제품": "비비고(만두/김치), 햇반, 고메, 백설, 다시다, 바이오(라이신)", 
-            "비전": "World Best Food & Bio Company", 
-            "홈페이지": "https://www.cj.net", 
-            "유튜브": "https://www.youtube.com/@CJCheilJedangOfficial"
-        },
-        {
-            "순위": 4, 
-            "기업명": "삼양식품", 
-            "소개": "1963년 국내 최초의 라면을 출시한 원조 기업. '불닭볶음면'이 유튜브를 통해 글로벌 챌린지 열풍을 일으키며, 해외 매출 비중이 70%에 달하는 '수출 역군'으로 재탄생했습니다.", 
-            "주력제품": "불닭볶음면 시리즈, 삼양라면, 맵탱, 쿠티크", 
-            "비전": "Global Comprehensive Food & Solution Company)", 
-            "홈페이지": "https://www.samyangfoods.com", 
-            "유튜브": "https://www.youtube.com/@samyangfoods"
-        },
-        {
-            "순위": 5, 
-            "기업명": "풀무원", 
-            "소개": "국내 최초로 포장 두부와 콩나물을 출시하며 '바른 먹거리' 개념을 정립한 ESG 경영 선도 기업. 최근 식물성 지향 식품(지구식단)과 미국 두부 시장 1위를 기반으로 글로벌 확장을 가속화하고 있습니다.", 
-            "주력제품": "국산콩 두부, 식물성 지구식단, 얇은피 만두, 아임리얼", 
-            "비전": "Global No.1 LOHAS Company", 
-            "홈페이지": "https://www.pulmuone.co.kr", 
-            "유튜브": "https://www.youtube.com/@pulmuone.official"
-        },
-        {
-            "순위": 6, 
-            "기업명": "빙그레", 
-            "소개": "가공유 1위 '바나나맛우유'와 아이스크림 명가. 해태아이스크림 인수로 빙과 시장 점유율을 획기적으로 높였으며, '메로나'는 미국 코스트코 등 해외 시장에서 K-아이스크림의 대명사가 되었습니다.", 
-            "주력제품": "바나나맛우유, 요플레, 투게더, 메로나, 붕어싸만코, 슈퍼콘", 
-            "비전": "Creator of Bright Smiles", 
-            "홈페이지": "https://www.bing.co.kr", 
-            "유튜브": "https://www.youtube.com/@official.binggrae"
-        },
-        {
-            "순위": 7, 
-            "기업명": "매일유업", 
-            "소개": "낙농업 기반의 종합 식품 기업. 저출산 위기를 극복하기 위해 성인 영양식 '셀렉스'와 식물성 음료 '어메이징 오트'로 사업 포트폴리오를 성공적으로 다각화했습니다.", 
-            "주력제품": "매일우유, 상하목장, 앱솔루트(분유), 셀렉스(단백질), 어메이징 오트", 
-            "비전": "More than Food, Beyond Korea", 
-            "홈페이지": "https://www.maeil.com", 
-            "유튜브": "https://www.youtube.com/@maeili2mo"
-        },
-        {
-            "순위": 8, 
-            "기업명": "하이트진로", 
-            "소개": "1924년 설립된 대한민국 주류 역사의 산증인. 국민 소주 '참이슬'과 청정 라거 '테라', 그리고 '켈리'의 연타석 홈런으로 소주-맥주 시장을 동시에 석권하고 있습니다.", 
-            "주력제품": "참이슬, 진로(이즈백), 테라, 켈리, 일품진로", 
-            "비전": "Global Public Brewer", 
-            "홈페이지": "https://www.hitejinro.com", 
-            "유튜브": "https://www.youtube.com/watch?v=CjYD_J_2tt0"
-        },
-        {
-            "순위": 9, 
-            "기업명": "롯데칠성", 
-            "소개": "음료와 주류를 아우르는 종합 음료 기업. '칠성사이다'의 헤리티지에 '제로 슈거' 트렌드를 완벽히 결합(펩시 제로, 새로 소주)하며 제2의 전성기를 맞이했습니다.", 
-            "주력제품": "칠성사이다(제로), 펩시(제로), 처음처럼, 새로, 밀키스", 
-            "비전": "Healthy Reverence", 
-            "홈페이지": "https://company.lottechilsung.co.kr", 
-            "유튜브": "https://www.youtube.com/@Lotte7star"
-        },
-        {
-            "순위": 10, 
-            "기업명": "대상", 
-            "소개": "국내 최초의 발효 조미료 '미원'으로 시작한 종합 식품 기업. 김치 브랜드 '종가(Jongga)'를 앞세워 글로벌 김치 시장을 장악하고 있으며, 소재(전분당, 라이신) 사업에서도 강력한 입지를 보유 중입니다.", 
-            "주력제품": "청정원, 미원, 종가(김치), O'Food(글로벌), 안주야", 
-            "비전": "Creating a healthy future for people and nature)", 
-            "홈페이지": "https://www.daesang.com", 
-            "유튜브": "https://www.youtube.com/@DAESANG"
-        }
-    ]
-    return df_map, company_details
+    metrics.cache_miss("get_company_data")
+    return registry.company_frames()
+
+@metrics.track_cache("load_scholar_data")
+@st.cache_resource(max_entries=4)
+def load_scholar_version(version):
+    metrics.cache_miss("load_scholar_data", version)
+    return service.load_scholar_frame(get_catalog(), SCHOLAR_DATASET)
+
+def load_scholar_data():
+    return load_scholar_version(get_catalog().version(SCHOLAR_DATASET))
+
+# 전체 키워드 성장 지표 (실행마다 재계산하지 않도록 데이터 버전별 캐시)
+@st.cache_resource(max_entries=4)
+def get_scholar_metrics(version):
+    return datastore.freeze_frame(analytics.scholar_growth_metrics(load_scholar_data()))
+
+# 논문 수(선행) vs 소비자 관심도(후행) 교차상관 (데이터 버전별 캐시)
+@st.cache_resource(max_entries=8)
+def get_lead_lag(version, freq):
+    return datastore.freeze_frame(analytics.lead_lag_table(load_scholar_data(), load_data(TREND_DATASET), freq=freq))
+
+# 키워드 검색 색인 + 모멘텀 (데이터 버전별로 한 번만 만듦)
+# 사이드바 선택 목록에는 검색 결과나 급상승 상위 후보만 넣어 키워드가 수천 개여도 가볍게 유지
+KEYWORD_OPTIONS_MAX = 50
+KEYWORD_MOVERS = 10
+
+@st.cache_resource(max_entries=4)
+def get_keyword_picker(version):
+    df = load_data(TREND_DATASET)
+    return analytics.build_keyword_index(df.columns), analytics.keyword_momentum(df)
+
+# 처음 선택해 둘 신호: 키워드가 적으면 기존처럼 앞의 두 개, 많으면 최근 급상승 상위 두 개
+def default_trend_keywords(keywords, momentum):
+    return keywords[:2] if len(keywords) <= KEYWORD_OPTIONS_MAX else analytics.top_movers(momentum, 2).index.tolist()
+
+# 주/월/분기/연 시간 피라미드 (데이터 버전별로 한 번만 집계)
+@st.cache_resource(max_entries=4)
+def get_time_pyramid(version):
+    pyramid = analytics.build_time_pyramid(load_data(TREND_DATASET))
+    return MappingProxyType({level: datastore.freeze_frame(frame) for level, frame in pyramid.items()})
+
+# 연도 x 주차 계절성 (데이터 버전별 캐시, 배열은 읽기 전용)
+@st.cache_resource(max_entries=4)
+def get_seasonal(version):
+    seasonal = analytics.seasonal_decomposition(load_data(TREND_DATASET))
+    seasonal["cube"].flags.writeable = False
+    seasonal["profile"] = datastore.freeze_frame(seasonal["profile"])
+    seasonal["adjusted"] = datastore.freeze_frame(seasonal["adjusted"])
+    return MappingProxyType(seasonal)
+
+# 선택한 키워드의 상관행렬 + 계층적 군집 (데이터 버전과 키워드 조합별 캐시)
+@st.cache_resource(max_entries=16)
+def get_correlation_clusters(version, keywords):
+    corr = load_data(TREND_DATASET)[list(keywords)].corr()
+    linkage_matrix, order = analytics.correlation_linkage(corr)
+    linkage_matrix.flags.writeable = False
+    order.flags.writeable = False
+    return datastore.freeze_frame(corr), linkage_matrix, order
+
+# 기업 종합 점수 구성 지표 (레지스트리/트렌드 버전별 캐시)
+@st.cache_resource(max_entries=4)
+def get_score_components(registry_version, trend_version):
+    df_map, company_details = get_company_data()
+    return datastore.freeze_frame(scoring.company_components(df_map, company_details, load_data(TREND_DATASET)))
+
+# 지도 레이어 데이터: 레이어가 실제로 쓰는 열(좌표, 툴팁)만 열 단위 배열로 추려 레지스트리 버전별로 한 번만 만듦
+# pydeck 은 data 를 행 단위 JSON 으로 직렬화하므로 주소·순위 같은 안 쓰는 열을 빼고,
+# 좌표는 소수 5자리(약 1m)로 맞춰 JSON 표기를 짧게 유지
+MAP_LAYER_COLUMNS = ["lon", "lat", "기업명", "총점"]
+
+@st.cache_resource(max_entries=4)
+def get_map_layer_data(registry_version):
+    df_map, _ = get_company_data()
+    layer_data = pd.DataFrame({
+        "lon": df_map["lon"].to_numpy(dtype=np.float64).round(5),
+        "lat": df_map["lat"].to_numpy(dtype=np.float64).round(5),
+        "기업명": df_map["기업명"].astype(str).to_numpy(),
+        "총점": df_map["총점"].to_numpy(),
+    }, columns=MAP_LAYER_COLUMNS)
+    return datastore.freeze_frame(layer_data)
+
+# 세션별 점수 엔진 (구성 지표 행렬은 공유하고 가중치만 세션마다 보관)
+def get_score_engine():
+    key = (registry.version(), get_catalog().version(TREND_DATASET))
+    engine = st.session_state.get("score_engine")
+    if engine is None or engine.key != key:
+        engine = scoring.ScoreEngine(get_score_components(*key), key=key)
+        st.session_state["score_engine"] = engine
+    return engine
+
+# 워드 클라우드 단어 빈도 (레지스트리/트렌드 버전별로 한 번만 계산)
+@st.cache_resource(max_entries=6)
+def get_word_frequencies(registry_version, trend_version, source):
+    _, company_details = get_company_data()
+    details = company_details if source != "trend" else ()
+    keyword_scores = load_data(TREND_DATASET).mean().to_dict() if source != "company" else None
+    return MappingProxyType(textcloud.term_frequencies(details, keyword_scores))
+
+# 구름 재료 (첫 항목이 페이지 기본값). 기업 정보만 쓰는 구름은 트렌드 버전과 무관하므로 키에서 뺌
+WORD_CLOUD_SOURCES = {"기업 소개 + 주력제품": "company", "트렌드 키워드": "trend", "모두 합치기": "all"}
+
+def word_frequencies_for(source):
+    trend_version = get_catalog().version(TREND_DATASET) if source != "company" else ""
+    return get_word_frequencies(registry.version(), trend_version, source)
+
+# 워드 클라우드 렌더러 (프로세스당 하나, 이미지는 .cache/wordcloud/ 에 내용 해시로 저장)
+@st.cache_resource
+def get_cloud_renderer():
+    return textcloud.CloudRenderer()
+
+# 렌더링이 끝날 때까지 이 조각만 주기적으로 다시 실행하고, 끝나면 페이지 전체를 다시 그림
+@st.fragment(run_every=1.5)
+def wait_for_word_cloud(key):
+    status = get_cloud_renderer().status(key)
+    if status == "ready":
+        st.rerun()
+    elif status == "failed":
+        st.error(f"워드 클라우드를 그리지 못했습니다: {get_cloud_renderer().error(key)}")
+    else:
+        st.info("☁️ 신호 구름을 그리는 중입니다... (백그라운드 렌더링, 잠시 후 자동으로 표시됩니다)")
 
 # 5. 페이지 구성 함수들
 # [0] 프롤로그
@@ -586,19 +617,8 @@ def page_keyword_analysis():
     st.title("📡 신호 탐지: 2025 식품 트렌드 분석")
     st.markdown("Google Trend 데이터를 레이더로 활용하여 **소비자 관심도 신호**를 포착합니다. 좌측의 **탐지기 설정**을 클릭하여 추적할 신호들을 정하세요.")
 
-    df = load_data('./food_trends.csv')
     try:
-        if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'])
-            df.set_index('Date', inplace=True)
-        else:
-            df.index = pd.to_datetime(df.index)
-        
-        df.columns = [col.replace(' (South Korea)', '') for col in df.columns]
-
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                df[col] = pd.to_numeric(df[col].astype(str).str.replace('<1', '0').str.replace(',', ''), errors='coerce').fillna(0)
+        df = load_data(TREND_DATASET)
     except Exception as e:
         st.error(f"데이터 처리 오류: {e}")
         return
@@ -614,16 +634,53 @@ def page_keyword_analysis():
     with st.sidebar:
         st.markdown("### 🛠️ 탐지기 설정")
         keywords = df.columns.tolist()
-        selected_keywords = st.multiselect("추적할 신호(키워드)", keywords, default=keywords[:2] if len(keywords) > 1 else keywords)
+        keyword_index, momentum = get_keyword_picker(get_catalog().version(TREND_DATASET))
+        st.session_state.setdefault("trend_keywords", default_trend_keywords(keywords, momentum))
+        chosen = [k for k in st.session_state["trend_keywords"] if k in df.columns]
+
+        mode = st.radio("신호 찾기", ["🔎 이름 검색", "🚀 급상승 신호"], horizontal=True)
+        if mode == "🔎 이름 검색":
+            query = st.text_input("신호 이름 검색", placeholder="예: 말차, 제로")
+            if query:
+                candidates = analytics.search_keywords(keyword_index, query, KEYWORD_OPTIONS_MAX, momentum["momentum"].to_numpy())
+                if not candidates:
+                    st.caption("일치하는 신호가 없습니다.")
+            else:
+                candidates = keywords[:KEYWORD_OPTIONS_MAX]
+        else:
+            movers = analytics.top_movers(momentum, KEYWORD_MOVERS)
+            candidates = movers.index.tolist()
+            st.dataframe(
+                movers[["recent", "momentum"]],
+                use_container_width=True,
+                column_config={
+                    "keyword": "신호",
+                    "recent": st.column_config.NumberColumn(f"최근 {analytics.MOMENTUM_WINDOW}주", format="%.1f"),
+                    "momentum": st.column_config.NumberColumn(f"직전 {analytics.MOMENTUM_BASE}주 대비", format="%+.1f"),
+                }
+            )
+
+        # 브라우저에는 후보와 이미 고른 신호만 보냄 (key 로 묶어 후보가 바뀌어도 선택은 유지)
+        options = list(dict.fromkeys(candidates + chosen))
+        st.session_state["trend_keywords"] = chosen
+        selected_keywords = st.multiselect("추적할 신호(키워드)", options, key="trend_keywords")
+        if len(keywords) > len(options):
+            st.caption(f"전체 {len(keywords):,}개 신호 중 {len(options)}개 후보 표시")
 
     if not selected_keywords:
         st.warning("추적할 신호를 선택하세요.")
         return
 
     st.subheader("📊 최근 5개년 키워드 신호 강도 변화")
+    pyramid = get_time_pyramid(get_catalog().version(TREND_DATASET))
+    first_day, last_day = df.index.min().date(), df.index.max().date()
+    date_range = st.slider("관측 기간", min_value=first_day, max_value=last_day, value=(first_day, last_day), format="YYYY-MM-DD")
+    # 기간 길이에 맞춰 주간/월간/분기/연간 중 점 수가 적당한 단계를 자동 선택
+    level, view = analytics.pyramid_slice(pyramid, *date_range)
+    st.caption(f"표시 단위: {analytics.PYRAMID_LABELS[level]} · {len(view)}개 구간")
     fig = px.line(
-        df, y=selected_keywords,
-        labels={"value": "관심도 지수", "index": "날짜", "variable": "신호명"},
+        view, y=selected_keywords,
+        labels={"value": "관심도 지수", "index": "날짜", "Date": "날짜", "variable": "신호명"},
         template=CHART_THEME,
         color_discrete_sequence=SPACE_PALETTE
     )
@@ -641,13 +698,55 @@ def page_keyword_analysis():
     st.caption("※ 데이터 출처: Google Trends (2025년 핵심 키워드 5개 분석 - 대한민국 기준)")
     st.divider()
 
+    st.subheader("🗓️ 계절 신호: 연도별 주차 겹쳐보기")
+    seasonal = get_seasonal(get_catalog().version(TREND_DATASET))
+    season_key = st.selectbox("계절성을 볼 신호", selected_keywords)
+    k = df.columns.get_loc(season_key)
+    profile = seasonal["profile"]
+
+    peak_week, low_week = int(profile[season_key].idxmax()), int(profile[season_key].idxmin())
+    # ISO 53주가 있는 해(2020)를 기준으로 주차 -> 월 환산
+    peak_month, low_month = (datetime.date.fromisocalendar(2020, w, 4).month for w in (peak_week, low_week))
+    st.caption(f"🔺 성수기: {peak_week}주차 (약 {peak_month}월, +{profile[season_key].max():.1f}) · "
+               f"🔻 비수기: {low_week}주차 (약 {low_month}월, {profile[season_key].min():.1f}) — 연평균 대비 편차")
+
+    tab_overlay, tab_profile, tab_adjusted = st.tabs(["📅 연도별 겹쳐보기", "🌗 계절 프로파일", "🧹 계절 조정 시계열"])
+    with tab_overlay:
+        years = [str(year) for year in seasonal["years"]]
+        overlay = pd.DataFrame(seasonal["cube"][:, :, k].T, index=profile.index, columns=years)
+        fig_overlay = px.line(
+            overlay, labels={"value": "관심도 지수", "week": "주차", "variable": "연도"},
+            template=CHART_THEME,
+            color_discrete_sequence=px.colors.sample_colorscale("ice", np.linspace(0.35, 1, len(years)))
+        )
+        fig_overlay.update_layout(hovermode="x unified", plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)", font=dict(color="white"))
+        st.plotly_chart(fig_overlay, use_container_width=True)
+    with tab_profile:
+        fig_profile = px.line(
+            profile[selected_keywords], labels={"value": "연평균 대비 편차", "week": "주차", "variable": "신호명"},
+            template=CHART_THEME, color_discrete_sequence=SPACE_PALETTE
+        )
+        fig_profile.add_hline(y=0, line_dash="dot", line_color="#B0BEC5")
+        fig_profile.update_layout(hovermode="x unified", plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)", font=dict(color="white"))
+        st.plotly_chart(fig_profile, use_container_width=True)
+    with tab_adjusted:
+        adjusted = pd.DataFrame({"원본": df[season_key], "계절 조정": seasonal["adjusted"][season_key]})
+        fig_adjusted = px.line(
+            adjusted, labels={"value": "관심도 지수", "Date": "날짜", "variable": "시계열"},
+            template=CHART_THEME, color_discrete_sequence=["#546E7A", "#00E5FF"]
+        )
+        fig_adjusted.update_layout(hovermode="x unified", plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)", font=dict(color="white"))
+        st.plotly_chart(fig_adjusted, use_container_width=True)
+        st.caption("※ 계절 조정: 원본에서 같은 주차의 계절 편차를 빼 추세만 남긴 값")
+
+    st.divider()
+
     st.subheader("📊 최근 4주 트렌드 요약")
+    summary = analytics.recent_summary(df[selected_keywords])
     cols = st.columns(4)
     for i, key in enumerate(selected_keywords):
-        curr = df[key].iloc[-1]
-        diff = curr - df[key].iloc[-4:].mean()
         with cols[i % 4]:
-            st.metric(label=f"{key}", value=f"{curr:.0f}", delta=f"{diff:.1f} (vs 4주평균)")
+            st.metric(label=f"{key}", value=f"{summary.at[key, 'latest']:.0f}", delta=f"{summary.at[key, 'delta']:.1f} (vs 4주평균)")
 
     st.divider()
     
@@ -656,10 +755,33 @@ def page_keyword_analysis():
     with col_h1:
         st.subheader("🔗 신호 상관관계 매트릭스")
         if len(selected_keywords) >= 2:
-            corr = df[selected_keywords].corr()
-            fig_corr = px.imshow(corr, text_auto=".2f", color_continuous_scale="Purples", aspect="auto", template=CHART_THEME)
+            corr, linkage_matrix, order = get_correlation_clusters(get_catalog().version(TREND_DATASET), tuple(sorted(selected_keywords)))
+            layout = st.radio("배열 방식", ["선택 순서", "군집 정렬"], horizontal=True)
+            clustered = layout == "군집 정렬"
+
+            if clustered and len(selected_keywords) > HEATMAP_BLOCK_MIN:
+                # 키워드가 많으면 칸 하나하나 대신 군집끼리의 평균 상관만 표시
+                n_blocks = st.slider("군집 수", 2, min(HEATMAP_BLOCK_MAX, len(selected_keywords)), min(6, len(selected_keywords)))
+                matrix, membership = analytics.correlation_blocks(corr, linkage_matrix, n_blocks)
+            elif clustered:
+                matrix = corr.iloc[order, order]
+            else:
+                matrix = corr.loc[selected_keywords, selected_keywords]
+
+            fig_corr = px.imshow(matrix, text_auto=".2f" if len(matrix) <= HEATMAP_TEXT_MAX else False,
+                                 color_continuous_scale="Purples", aspect="auto", template=CHART_THEME)
             fig_corr.update_layout(plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)", font=dict(color="white"))
             st.plotly_chart(fig_corr, use_container_width=True)
+
+            if clustered and len(selected_keywords) > HEATMAP_BLOCK_MIN:
+                with st.expander("🧩 군집별 키워드"):
+                    st.dataframe(membership.rename("군집").rename_axis("키워드").reset_index(), hide_index=True, use_container_width=True)
+            if clustered and st.checkbox("🌳 덴드로그램 표시"):
+                fig_tree = ff.create_dendrogram(corr.to_numpy(), labels=corr.index.tolist(),
+                                                distfun=analytics.correlation_distance, linkagefun=lambda _: linkage_matrix)
+                fig_tree.update_layout(template=CHART_THEME, plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
+                                       font=dict(color="white"), yaxis_title="상관 거리 (1 - r)", height=320)
+                st.plotly_chart(fig_tree, use_container_width=True)
         else:
             st.warning("상관관계를 분석하려면 2개 이상의 신호를 선택하세요.")
 
@@ -669,20 +791,11 @@ def page_keyword_analysis():
         if len(selected_keywords) < 2:
             st.write("신호가 충분하지 않아 분석할 수 없습니다.")
         else:
-            corr_matrix = df[selected_keywords].corr()
-            pairs = []
-            columns = corr_matrix.columns
-            for i in range(len(columns)):
-                for j in range(i + 1, len(columns)):
-                    col1 = columns[i]
-                    col2 = columns[j]
-                    val = corr_matrix.loc[col1, col2]
-                    pairs.append({'pair': (col1, col2), 'value': val})
+            pairs = analytics.correlation_pairs(df, selected_keywords)
             
             if len(pairs) == 1:
-                p = pairs[0]
-                val = p['value']
-                n1, n2 = p['pair']
+                val = pairs['r'].iloc[0]
+                n1, n2 = pairs['a'].iloc[0], pairs['b'].iloc[0]
                 st.markdown(f"""
                 <div style='background:rgba(255,255,255,0.05); padding:15px; border-radius:10px; margin-bottom:10px;'>
                     <strong style='color:#00E5FF'>🔍 단일 관계 분석</strong><br>
@@ -696,9 +809,7 @@ def page_keyword_analysis():
                 """, unsafe_allow_html=True)
                 
             else:
-                max_pos = max(pairs, key=lambda x: x['value'])
-                max_neg = min(pairs, key=lambda x: x['value'])
-                closest_zero = min(pairs, key=lambda x: abs(x['value']))
+                highlights = analytics.correlation_highlights(pairs)
                 
                 def display_card(title, pair, val, color, desc):
                     st.markdown(f"""
@@ -709,19 +820,25 @@ def page_keyword_analysis():
                     </div>
                     """, unsafe_allow_html=True)
 
-                desc_pos = "두 관심사는 강력한 동반 상승 패턴을 보입니다." if max_pos['value'] > 0.5 else "가장 비슷한 흐름을 보이지만, 연관성은 약합니다."
-                display_card("🔥 최고 시너지 (Max Positive)", max_pos['pair'], max_pos['value'], "#FF4081", desc_pos)
+                if not highlights:
+                    st.write("상관계수를 계산할 수 없는 신호입니다.")
+                    return
+
+                max_pos = pairs.iloc[highlights['max_positive']]
+                max_neg = pairs.iloc[highlights['max_negative']]
+                closest_zero = pairs.iloc[highlights['independent']]
+
+                desc_pos = "두 관심사는 강력한 동반 상승 패턴을 보입니다." if max_pos['r'] > 0.5 else "가장 비슷한 흐름을 보이지만, 연관성은 약합니다."
+                display_card("🔥 최고 시너지 (Max Positive)", (max_pos['a'], max_pos['b']), max_pos['r'], "#FF4081", desc_pos)
 
-                desc_neg = "한쪽이 뜨면 한쪽이 지는 역의 관계입니다." if max_neg['value'] < -0.3 else "서로 가장 관련성이 적거나 상반된 흐름입니다."
-                display_card("🧊 상반된 흐름 (Max Negative)", max_neg['pair'], max_neg['value'], "#00E5FF", desc_neg)
+                desc_neg = "한쪽이 뜨면 한쪽이 지는 역의 관계입니다." if max_neg['r'] < -0.3 else "서로 가장 관련성이 적거나 상반된 흐름입니다."
+                display_card("🧊 상반된 흐름 (Max Negative)", (max_neg['a'], max_neg['b']), max_neg['r'], "#00E5FF", desc_neg)
 
-                if closest_zero != max_pos and closest_zero != max_neg:
-                    display_card("⚖️ 독립적 관계 (Independent)", closest_zero['pair'], closest_zero['value'], "#C6FF00", "서로 영향을 주지 않고 독자적으로 움직입니다.")
+                if highlights['independent'] not in (highlights['max_positive'], highlights['max_negative']):
+                    display_card("⚖️ 독립적 관계 (Independent)", (closest_zero['a'], closest_zero['b']), closest_zero['r'], "#C6FF00", "서로 영향을 주지 않고 독자적으로 움직입니다.")
 
 # [3] 행성 좌표
 def page_map_visualization():
-    df_map, _ = get_company_data()
-
     st.title("🪐 행성 좌표: 식품 기업 10대 거점")
     
     st.markdown("""
@@ -736,21 +853,45 @@ def page_map_visualization():
 
     col_map, col_bar = st.columns([1.6, 1])
 
+    engine = get_score_engine()
+
     with col_bar:
         st.subheader("🏆 기업 행성 영향력")
-        st.caption("※ 총점: 빅데이터 인덱스 수치 합산")
+        with st.expander("⚖️ 종합 점수 가중치 조절"):
+            weights = {
+                name: st.slider(label, 0.0, 1.0, scoring.DEFAULT_WEIGHTS[name], 0.05, key=f"score_weight_{name}")
+                for name, label in scoring.COMPONENT_LABELS.items()
+            }
+        # 바뀐 가중치만 증분 반영
+        engine.set_weights(weights)
+        ranking = engine.ranking()
+
+        st.caption("※ 종합점수: 브랜드 지수(K-Brand Index 총점)·트렌드 관심도·글로벌 확장·제품 포트폴리오의 가중 평균 (0~100)")
+        if not any(weights.values()):
+            st.warning("가중치를 하나 이상 0보다 크게 설정하세요.")
         fig = px.bar(
-            df_map, x="총점", y="기업명", orientation='h', text="총점",
-            color="총점", color_continuous_scale=["#29B6F6", "#0288D1"], template=CHART_THEME
+            ranking.reset_index(), x="종합점수", y="기업명", orientation='h', text="종합점수",
+            color="종합점수", color_continuous_scale=["#29B6F6", "#0288D1"], template=CHART_THEME
         )
+        fig.update_traces(texttemplate="%{x:.1f}")
         fig.update_layout(yaxis={'categoryorder':'total ascending'}, plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)", font=dict(color="white"))
         st.plotly_chart(fig, use_container_width=True)
 
+        with st.expander("🧮 구성 지표 보기"):
+            st.dataframe(
+                ranking,
+                use_container_width=True,
+                column_config={
+                    **{name: st.column_config.NumberColumn(label, format="%.0f") for name, label in scoring.COMPONENT_LABELS.items()},
+                    "종합점수": st.column_config.ProgressColumn("종합점수", format="%.1f", min_value=0, max_value=100),
+                }
+            )
+
     with col_map:
         st.subheader("📍 거점 좌표 확인")
         layer = pdk.Layer(
             "ScatterplotLayer",
-            data=df_map,
+            data=get_map_layer_data(registry.version()).assign(종합점수=engine.scores().round(1).to_numpy()),
             get_position='[lon, lat]',
             get_radius=2000,
             get_fill_color='[224, 64, 251, 150]', 
@@ -761,12 +902,14 @@ def page_map_visualization():
             get_line_width=150
         )
         view_state = pdk.ViewState(latitude=36.5, longitude=127.5, zoom=6, pitch=30)
-        tooltip = {"html": "<div style='color:black;'><b>{기업명}</b><br>총점: {총점}</div>"}
+        tooltip = {"html": "<div style='color:black;'><b>{기업명}</b><br>종합점수: {종합점수}<br>브랜드 총점: {총점}</div>"}
 
+        basemap = {"map_style": BASEMAP_STYLE_URL} if BASEMAP_STYLE_URL else {}
         st.pydeck_chart(pdk.Deck(
             layers=[layer],
             initial_view_state=view_state,
-            tooltip=tooltip
+            tooltip=tooltip,
+            **basemap
         ))
 
     st.divider()
@@ -881,6 +1024,30 @@ def page_company_info():
                         with b2: 
                             st.markdown(f'<a href="{c["유튜브"]}" target="_blank" style="{btn_style}">📺 유튜브</a>', unsafe_allow_html=True)
 
+    # 워드 클라우드: 기업 소개/주력제품 + 트렌드 키워드
+    st.markdown("---")
+    st.subheader("☁️ 행성 신호 구름 (Word Cloud)")
+    source = WORD_CLOUD_SOURCES[st.radio("구름 재료", list(WORD_CLOUD_SOURCES), horizontal=True)]
+
+    try:
+        frequencies = word_frequencies_for(source)
+    except Exception as e:
+        st.error(f"단어 빈도를 계산하지 못했습니다: {e}")
+        return
+
+    cloud_font = textcloud.find_korean_font(font_path)
+    if cloud_font is None:
+        st.caption("⚠️ 한글 글꼴을 찾지 못해 일부 글자가 네모로 보일 수 있습니다. (Linux: fonts-nanum 설치)")
+
+    key, path = get_cloud_renderer().request(frequencies, font_path=cloud_font)
+    if path is not None:
+        st.image(path, width="stretch")
+    else:
+        wait_for_word_cloud(key)
+
+    top_terms = list(frequencies.items())[:10]
+    st.caption("가장 강한 신호: " + ", ".join(f"{term}({count:.0f})" for term, count in top_terms))
+
 # [5] 심우주 탐사 (정렬 및 디자인 최적화 적용됨)
 def page_scholar_analysis():
     st.title("🔭 심우주 탐사: 학술 연구 데이터")
@@ -907,23 +1074,9 @@ def page_scholar_analysis():
 
     st.markdown("<br>", unsafe_allow_html=True)
 
-    @st.cache_data
-    def load_scholar_data():
-        file_name = 'scholar_data.csv'
-        if not os.path.exists(file_name):
-            data = {
-                "Year": range(2015, 2026),
-                "Food Safety": [145, 158, 172, 189, 205, 234, 287, 312, 341, 378, 392],
-                "Alternative Meat": [42, 51, 63, 78, 92, 118, 156, 198, 245, 298, 334],
-                "Gut Microbiome": [89, 102, 124, 147, 178, 215, 268, 312, 385, 442, 480],
-                "Food Tech": [76, 85, 98, 115, 138, 167, 212, 261, 318, 385, 421],
-                "AI": [58, 67, 81, 102, 135, 178, 241, 318, 412, 521, 598]
-            }
-            return pd.DataFrame(data)
-        return pd.read_csv(file_name)
-
     df_research = load_scholar_data()
-    keywords_available = [col for col in df_research.columns if col != 'Year']
+    scholar_metrics = get_scholar_metrics(get_catalog().version(SCHOLAR_DATASET))
+    keywords_available = scholar_metrics.index.tolist()
 
     with st.container():
         # 입력창 높이 확대 및 버튼 정렬을 위한 CSS
@@ -1014,20 +1167,16 @@ def page_scholar_analysis():
         st.subheader("📈 탐사 데이터 분석 리포트")
         
         m1, m2, m3, m4 = st.columns(4)
-        
-        current_val = dftrend['Count'].iloc[-1]
-        start_val = dftrend['Count'].iloc[0]
-        growth_rate = ((current_val - start_val) / start_val) * 100
-        
+        m = scholar_metrics.loc[query]
+
         with m1:
-            st.metric("2025년 출판 수", f"{current_val:,}편", delta=f"{dftrend['Count'].iloc[-1] - dftrend['Count'].iloc[-2]} (YoY)")
+            st.metric("2025년 출판 수", f"{m['latest']:,.0f}편", delta=f"{m['yoy']:.0f} (YoY)")
         with m2:
-            st.metric("10년 총 성장률", f"{growth_rate:.1f}%", delta="2015 대비")
+            st.metric("10년 총 성장률", f"{m['growth_pct']:.1f}%", delta="2015 대비")
         with m3:
-            st.metric("연평균 출판 수", f"{dftrend['Count'].mean():.0f}편")
+            st.metric("연평균 출판 수", f"{m['mean']:.0f}편")
         with m4:
-            max_year = dftrend.loc[dftrend['Count'].idxmax(), 'Year']
-            st.metric("Peak 연도", f"{max_year}년")
+            st.metric("Peak 연도", f"{int(m['peak_year'])}년")
 
         st.markdown("<br>", unsafe_allow_html=True)
         with st.expander("📋 연도별 상세 데이터 로그 확인 (Data Log)"):
@@ -1037,6 +1186,79 @@ def page_scholar_analysis():
                 column_config={"Year": st.column_config.NumberColumn(format="%d")}
             )
 
+    st.divider()
+    st.subheader("🛰️ 전체 신호 비교 (Comparison Mode)")
+    st.caption("모든 키워드의 성장 지표를 한 번에 계산했습니다. 열 제목을 클릭하면 정렬됩니다.")
+
+    st.dataframe(
+        scholar_metrics,
+        use_container_width=True,
+        column_config={
+            "keyword": "키워드",
+            "latest": st.column_config.NumberColumn("최근 출판 수", format="%d"),
+            "yoy": st.column_config.NumberColumn("YoY 증감", format="%+d"),
+            "yoy_pct": st.column_config.NumberColumn("YoY (%)", format="%.1f"),
+            "acceleration": st.column_config.NumberColumn("가속도", format="%+d"),
+            "growth_pct": st.column_config.NumberColumn("총 성장률 (%)", format="%.1f"),
+            "cagr_pct": st.column_config.NumberColumn("CAGR (%)", format="%.1f"),
+            "mean": st.column_config.NumberColumn("연평균", format="%.0f"),
+            "peak_year": st.column_config.NumberColumn("Peak 연도", format="%d"),
+            "share_pct": st.column_config.NumberColumn("점유율 (%)", format="%.1f"),
+        }
+    )
+
+    top_keywords = scholar_metrics.sort_values("cagr_pct", ascending=False).index.tolist()
+    compare_keywords = st.multiselect("겹쳐 볼 신호(키워드)", keywords_available, default=top_keywords[:3])
+    if compare_keywords:
+        fig_cmp = px.line(
+            df_research, x='Year', y=compare_keywords, markers=True,
+            labels={"value": "논문 출판 수 (건)", "Year": "연도", "variable": "신호명"},
+            template=CHART_THEME,
+            color_discrete_sequence=SPACE_PALETTE
+        )
+        fig_cmp.update_layout(hovermode="x unified", plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
+                              font=dict(color="white"), xaxis=dict(tickmode='linear'))
+        st.plotly_chart(fig_cmp, use_container_width=True)
+
+    st.divider()
+    st.subheader("🔗 선행 지표 검증: 논문 수 → 소비자 관심도 (Lead-Lag)")
+    st.caption("논문 수와 구글 트렌드를 같은 시간 격자로 맞춘 뒤, 모든 (연구 주제, 트렌드 키워드) 쌍의 시차별 상관계수를 계산합니다. 시차 > 0 이면 연구가 소비자 관심보다 먼저 움직였다는 뜻입니다.")
+
+    grid_label = st.radio("시간 격자", ["연 단위", "분기 단위"], horizontal=True)
+    freq = "YS" if grid_label == "연 단위" else "QS"
+    lead_lag = get_lead_lag(get_catalog().version(TREND_DATASET, SCHOLAR_DATASET), freq)
+
+    if lead_lag.empty:
+        st.warning("두 데이터의 겹치는 기간이 짧아 선행-후행 관계를 분석할 수 없습니다.")
+    else:
+        unit = "년" if freq == "YS" else "분기"
+        col_ll1, col_ll2 = st.columns([1.3, 1])
+        with col_ll1:
+            strength = lead_lag.pivot(index="research", columns="trend", values="strength")
+            best_lag = lead_lag.pivot(index="research", columns="trend", values="best_lag").loc[strength.index, strength.columns]
+            fig_ll = px.imshow(strength, zmin=-1, zmax=1, color_continuous_scale="RdBu_r", aspect="auto", template=CHART_THEME,
+                               labels={"x": "트렌드 키워드", "y": "연구 주제", "color": "상관계수"})
+            fig_ll.update_traces(text=best_lag.to_numpy(), texttemplate="r=%{z:.2f}<br>lag %{text}",
+                                 hovertemplate="%{y} → %{x}<br>r = %{z:.2f}<br>시차: %{text}" + unit + "<extra></extra>")
+            fig_ll.update_layout(plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)", font=dict(color="white"))
+            st.plotly_chart(fig_ll, use_container_width=True)
+        with col_ll2:
+            st.dataframe(
+                lead_lag,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "research": "연구 주제",
+                    "trend": "트렌드 키워드",
+                    "best_lag": st.column_config.NumberColumn(f"최적 시차 ({unit})", format="%+d"),
+                    "strength": st.column_config.NumberColumn("상관계수", format="%.2f"),
+                    "n_periods": st.column_config.NumberColumn("비교 구간 수", format="%d"),
+                }
+            )
+        n_periods = int(lead_lag['n_periods'].iloc[0])
+        if n_periods < 10:
+            st.caption(f"※ 겹치는 기간이 {n_periods}개 구간뿐이라 결과는 참고용입니다.")
+
 # [6] 궤도 안착
 def page_conclusion():
     st.title("🚩 궤도 안착: 결론 및 제언")
@@ -1134,8 +1356,176 @@ def page_conclusion():
     </div>
     """, unsafe_allow_html=True)
 
-# 6. 메인 실행 블록
+# [7] 데이터 탐색
+def page_data_explorer():
+    data_catalog = get_catalog()
+
+    st.title("🗂️ 데이터 탐색: 데이터셋 카탈로그")
+    st.write("루트와 data/ 폴더의 CSV 파일을 한 번 훑어, 앞부분 표본만으로 인코딩·구분자·행 수를 파악한 목록입니다. 내용이 같은 파일은 하나로 합쳐 한 번만 읽습니다.")
+
+    st.dataframe(
+        data_catalog.summary(),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "name": "데이터셋",
+            "path": "경로",
+            "encoding": "인코딩",
+            "delimiter": "구분자",
+            "rows": st.column_config.NumberColumn("행 수", format="%d"),
+            "rows_exact": st.column_config.CheckboxColumn("정확한 행 수"),
+            "columns": st.column_config.NumberColumn("열 수", format="%d"),
+            "size_kb": st.column_config.NumberColumn("크기 (KB)", format="%.1f"),
+            "duplicates": "중복 파일",
+        }
+    )
+    for path, error in data_catalog.errors.items():
+        st.warning(f"⚠️ 읽을 수 없어 건너뛴 파일: {path} ({error})")
+
+    # 앱이 쓰는 데이터셋의 압축 전후 메모리 (검증에 실패한 데이터가 있어도 이 페이지는 계속 그림)
+    with st.expander("🧮 데이터 메모리 리포트"):
+        try:
+            df_map, _ = get_company_data()
+            report = datastore.memory_report({
+                "food_trends": load_data(TREND_DATASET),
+                "scholar_data": load_scholar_data(),
+                "company_map": df_map,
+            })
+        except (OSError, UnicodeError, ValueError) as e:
+            st.warning(f"메모리 리포트를 만들지 못했습니다: {e}")
+        else:
+            st.dataframe(
+                report,
+                hide_index=True,
+                column_config={
+                    "dataset": "데이터셋",
+                    "rows": st.column_config.NumberColumn("행", format="%d"),
+                    "columns": st.column_config.NumberColumn("열", format="%d"),
+                    "original_kb": st.column_config.NumberColumn("원본 (KB)", format="%.1f"),
+                    "memory_kb": st.column_config.NumberColumn("압축 후 (KB)", format="%.1f"),
+                    "saved_pct": st.column_config.NumberColumn("절감 (%)", format="%.0f"),
+                    "dtypes": "dtype 구성",
+                }
+            )
+
+    if not data_catalog.names():
+        st.warning("탐색할 데이터셋이 없습니다.")
+        return
+
+    st.divider()
+    name = st.selectbox("탐색할 데이터셋", data_catalog.names())
+    try:
+        df = data_catalog.load(name)
+    except (OSError, UnicodeError, ValueError) as e:
+        st.error(f"'{name}' 데이터셋을 읽지 못했습니다: {e}")
+        return
+
+    st.dataframe(datastore.memory_report({name: df}), use_container_width=True, hide_index=True)
+
+    tab_preview, tab_stats, tab_chart = st.tabs(["📋 미리보기", "📊 요약 통계", "🛰️ 분포 시각화"])
+    with tab_preview:
+        st.dataframe(df.head(100), use_container_width=True)
+    with tab_stats:
+        st.dataframe(df.describe(include="all").transpose(), use_container_width=True)
+    with tab_chart:
+        numeric_cols = df.select_dtypes("number").columns.tolist()
+        if not numeric_cols:
+            st.info("숫자형 열이 없어 시각화할 수 없습니다.")
+        else:
+            c1, c2, c3 = st.columns(3)
+            x_col = c1.selectbox("X 축", numeric_cols)
+            y_col = c2.selectbox("Y 축", ["(히스토그램)"] + numeric_cols)
+            color_options = ["(없음)"] + [col for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)]
+            color_col = c3.selectbox("색상 구분", color_options)
+            color = None if color_col == "(없음)" else color_col
+            if y_col == "(히스토그램)":
+                fig = px.histogram(df, x=x_col, color=color, template=CHART_THEME, color_discrete_sequence=SPACE_PALETTE)
+            else:
+                fig = px.scatter(df, x=x_col, y=y_col, color=color, template=CHART_THEME, color_discrete_sequence=SPACE_PALETTE)
+            fig.update_layout(plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)", font=dict(color="white"))
+            st.plotly_chart(fig, use_container_width=True)
+
+# 6. 시작 시 예열 + 운영 엔드포인트 (EXPLORER_WARMUP=1 또는 EXPLORER_METRICS=1 일 때만, 프로세스당 한 번)
+# 첫 Plotly 그림은 plotly 내부 검증기를 처음 불러오느라 느리므로 대표 그림을 미리 한 번 직렬화해 둡니다.
+def warm_figures():
+    df = load_data(TREND_DATASET)
+    df_map, _ = get_company_data()
+    keywords = df.columns.tolist()[:2]
+    figures = [
+        px.line(df, y=keywords, template=CHART_THEME, color_discrete_sequence=SPACE_PALETTE),
+        px.imshow(df[keywords].corr(), text_auto=".2f", color_continuous_scale="Purples", template=CHART_THEME),
+        px.bar(df_map, x="기업명", y="총점", template=CHART_THEME),
+    ]
+    for fig in figures:
+        fig.to_json()
+
+# 트렌드 페이지가 처음 그리는 기본 신호 조합의 상관행렬 + 군집
+def warm_default_clusters():
+    version = get_catalog().version(TREND_DATASET)
+    _, momentum = get_keyword_picker(version)
+    selected = default_trend_keywords(load_data(TREND_DATASET).columns.tolist(), momentum)
+    if len(selected) >= 2:
+        get_correlation_clusters(version, tuple(sorted(selected)))
+
+# 기업 상세 페이지의 기본 구름(첫 번째 재료)을 백그라운드 렌더러에 미리 예약
+def warm_word_cloud():
+    frequencies = word_frequencies_for(next(iter(WORD_CLOUD_SOURCES.values())))
+    get_cloud_renderer().request(frequencies, font_path=textcloud.find_korean_font(font_path))
+
+# 버전별 캐시는 모두 여기와 invalidate_data_caches() 에 함께 등록
+def warmup_steps():
+    return [
+        ("catalog", get_catalog),
+        ("trends", lambda: load_data(TREND_DATASET)),
+        ("companies", get_company_data),
+        ("scholar", load_scholar_data),
+        ("scholar_metrics", lambda: get_scholar_metrics(get_catalog().version(SCHOLAR_DATASET))),
+        ("lead_lag", lambda: [get_lead_lag(get_catalog().version(TREND_DATASET, SCHOLAR_DATASET), freq) for freq in ("YS", "QS")]),
+        ("keyword_picker", lambda: get_keyword_picker(get_catalog().version(TREND_DATASET))),
+        ("time_pyramid", lambda: get_time_pyramid(get_catalog().version(TREND_DATASET))),
+        ("seasonal", lambda: get_seasonal(get_catalog().version(TREND_DATASET))),
+        ("correlation_clusters", warm_default_clusters),
+        ("score_components", lambda: get_score_components(registry.version(), get_catalog().version(TREND_DATASET))),
+        ("map_layer", lambda: get_map_layer_data(registry.version())),
+        ("word_cloud", warm_word_cloud),
+        ("figures", warm_figures),
+    ]
+
+# 데이터 파일이 바뀌면 카탈로그부터 다시 스캔하도록 데이터 캐시를 모두 비움
+# (렌더러도 새로 만들어, 이전 데이터에서 실패한 구름 이미지를 다시 시도할 수 있게 함)
+def invalidate_data_caches():
+    for cached in (get_catalog, load_data_version, load_scholar_version, get_scholar_metrics, get_lead_lag,
+                   get_keyword_picker, get_time_pyramid, get_seasonal, get_correlation_clusters, get_score_components,
+                   get_map_layer_data, get_word_frequencies, get_cloud_renderer):
+        cached.clear()
+
+@st.cache_resource
+def start_background_services():
+    if not (warmup.enabled() or metrics.enabled()):
+        return None
+    ops = ops_server.OpsServer()
+    job = None
+    if warmup.enabled():
+        job = warmup.Warmup(warmup_steps(), fingerprint=lambda: get_catalog().fingerprint(),
+                            invalidate=invalidate_data_caches).start()
+
+        def health():
+            status, payload = job.health()
+            return ops_server.json_response(payload, status)
+
+        ops.route("/health", health)
+    if metrics.enabled():
+        ops.route("/metrics", lambda: (200, metrics.CONTENT_TYPE, metrics.render()))
+    ops.start()
+    return job, ops
+
+# 7. 메인 실행 블록
 def main():
+    start_background_services()
+    # 데이터 파일이 추가/삭제/수정됐으면 카탈로그를 다시 스캔 (버전별 캐시는 새 버전으로 다시 계산됨)
+    get_catalog().refresh()
+    metrics.touch_session()
+
     with st.sidebar:
         st.markdown("""
         <div style='background-color: #383838; padding: 15px; border-radius: 15px; margin-bottom: 15px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.3);'>
@@ -1147,8 +1537,8 @@ def main():
         
         selected = option_menu(
             menu_title=None,
-            options=["0. 프롤로그", "1. 항해 시작 (Intro)", "2. 신호 탐지 (Trend)", "3. 행성 좌표 (Map)", "4. 기업 상세 데이터 (Info)", "5. 심우주 탐사 (Research)", "6. 궤도 안착 (Conclusion)"],
-            icons=["star", "rocket-takeoff", "radar", "globe", "cpu", "binoculars", "flag"],
+            options=["0. 프롤로그", "1. 항해 시작 (Intro)", "2. 신호 탐지 (Trend)", "3. 행성 좌표 (Map)", "4. 기업 상세 데이터 (Info)", "5. 심우주 탐사 (Research)", "6. 궤도 안착 (Conclusion)", "7. 데이터 탐색 (Explore)"],
+            icons=["star", "rocket-takeoff", "radar", "globe", "cpu", "binoculars", "flag", "database"],
             menu_icon="cast",
             default_index=0,
             styles={
@@ -1161,13 +1551,16 @@ def main():
         
         st.markdown("<p style='color: #1E88E5 !important; font-size: 14px;'>🪐 Designed by Jung Jiho</p>", unsafe_allow_html=True)
 
-    if selected == "0. 프롤로그": page_title_screen()
-    elif selected == "1. 항해 시작 (Intro)": page_intro()
-    elif selected == "2. 신호 탐지 (Trend)": page_keyword_analysis()
-    elif selected == "3. 행성 좌표 (Map)": page_map_visualization()
-    elif selected == "4. 기업 상세 데이터 (Info)": page_company_info()
-    elif selected == "5. 심우주 탐사 (Research)": page_scholar_analysis()
-    elif selected == "6. 궤도 안착 (Conclusion)": page_conclusion()
+    # 페이지별 rerun 수 + 렌더링 시간 (/metrics)
+    with metrics.page_timer(selected):
+        if selected == "0. 프롤로그": page_title_screen()
+        elif selected == "1. 항해 시작 (Intro)": page_intro()
+        elif selected == "2. 신호 탐지 (Trend)": page_keyword_analysis()
+        elif selected == "3. 행성 좌표 (Map)": page_map_visualization()
+        elif selected == "4. 기업 상세 데이터 (Info)": page_company_info()
+        elif selected == "5. 심우주 탐사 (Research)": page_scholar_analysis()
+        elif selected == "6. 궤도 안착 (Conclusion)": page_conclusion()
+        elif selected == "7. 데이터 탐색 (Explore)": page_data_explorer()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,182 @@
+# 합성 데이터 생성기: 데이터가 커졌을 때 어떤 경로가 먼저 느려지는지 보기 위한 대규모 예시 데이터
+# 같은 시드면 항상 같은 데이터가 나오며, 트렌드 / 학술 / 기업 데이터셋을 실제 파일과 같은 형식으로 만듭니다.
+#   - 트렌드: 주 단위 구글 트렌드 형식 (키워드별 최댓값 100, '<1' 표기, ' (South Korea)' 접미사)
+#   - 학술: 연도별 논문 수 (주제마다 다른 성장률 + 포아송 잡음)
+#   - 기업: 순위/기업명/총점/주소/좌표 (+ 점수 엔진용 소개·주력제품)
+#
+#   python synthetic.py --scale medium --out synthetic/
+#   python synthetic.py --keywords 10000 --years 20 --companies 5000 --out synthetic/
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 규모 단계 (bench.py 와 같은 이름을 씀)
+SCALES = {
+    "small": {"keywords": 50, "years": 5, "topics": 20, "companies": 100},
+    "medium": {"keywords": 1000, "years": 10, "topics": 200, "companies": 1000},
+    "large": {"keywords": 10000, "years": 20, "topics": 1000, "companies": 5000},
+}
+END_YEAR = 2025
+REGION = "South Korea"
+
+FOOD_WORDS = ["말차", "제로", "단백질", "비건", "저속노화", "대체육", "콤부차", "그릭요거트", "두바이", "탕후루",
+              "오트밀", "귀리", "흑임자", "약과", "곤약", "마라", "로제", "치아씨드", "알룰로스", "김부각"]
+FORMS = ["", "음료", "라떼", "과자", "바", "아이스크림", "라면", "빵", "젤리", "소스", "쉐이크", "도시락"]
+TOPIC_WORDS = ["Food Safety", "Alternative Meat", "Gut Microbiome", "Food Tech", "AI", "Fermentation",
+               "Packaging", "Nutrition", "Cold Chain", "Plant Protein", "Allergen", "Food Waste"]
+COMPANY_STEMS = ["한빛", "누리", "다온", "해솔", "가람", "새봄", "온담", "미소", "푸른", "든든"]
+COMPANY_FORMS = ["식품", "푸드", "제과", "유업", "음료", "F&B", "바이오", "팜"]
+# 본사 좌표를 모을 도시 (위도, 경도, 비중)
+CITIES = {
+    "서울": (37.55, 126.98, 0.55), "경기": (37.35, 127.10, 0.15), "부산": (35.15, 129.05, 0.08),
+    "대구": (35.87, 128.60, 0.05), "충북": (36.63, 127.49, 0.07), "전북": (35.82, 127.15, 0.05),
+    "제주": (33.50, 126.53, 0.05),
+}
+PRODUCT_TERMS = ["라면", "과자", "단백질 음료", "제로 음료", "비건 간편식", "말차 디저트", "요거트", "냉동만두", "소스", "건강기능식품"]
+GLOBAL_HINTS = ["글로벌", "해외 수출", "미국 법인", "베트남 공장", "중국 시장"]
+
+
+# 중복 없는 이름 n 개 (조합이 모자라면 번호를 붙임)
+def _names(n, parts, sep=" "):
+    combos = [sep.join(p for p in combo if p) for combo in parts]
+    return [combos[i % len(combos)] + ("" if i < len(combos) else f" {i // len(combos) + 1}") for i in range(n)]
+
+
+def keyword_names(n):
+    return _names(n, [(food, form) for form in FORMS for food in FOOD_WORDS])
+
+
+# 1. 트렌드 (주 x 키워드)
+# 키워드마다 기본 수준, 0 이 아닌 장기 추세, 연 주기 계절성, AR(1) 잡음, 가끔 튀는 화제성을 더한 뒤
+# 구글 트렌드처럼 각 열의 최댓값을 100 으로 맞춰 정수로 반올림합니다.
+def trend_frame(n_keywords, years, seed=0, end_year=END_YEAR):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end=f"{end_year}-12-31", periods=years * 52, freq="W")
+    n = len(dates)
+    t = np.arange(n)[:, None] / 52.0
+
+    level = rng.lognormal(2.5, 0.6, n_keywords)
+    # 연간 추세: 키워드마다 시드로 정한 부호와 0 이 아닌 크기 (수준의 2~15%/년)
+    slope = rng.choice([-1.0, 1.0], n_keywords) * rng.uniform(0.02, 0.15, n_keywords) * level
+    amplitude = rng.uniform(0.0, 0.35, n_keywords) * level
+    phase = rng.uniform(0, 2 * np.pi, n_keywords)
+
+    noise = rng.normal(0.0, 1.0, (n, n_keywords)) * (0.15 * level)
+    phi = rng.uniform(0.3, 0.9, n_keywords)
+    for i in range(1, n):
+        noise[i] += phi * noise[i - 1]
+
+    spikes = (rng.random((n, n_keywords)) < 0.004) * rng.exponential(3.0, (n, n_keywords)) * level
+    values = level + slope * t + amplitude * np.sin(2 * np.pi * t + phase) + noise + spikes
+    values = np.clip(values, 0, None)
+
+    top = values.max(axis=0)
+    top[top == 0] = 1
+    scaled = values / top * 100
+    return pd.DataFrame(np.rint(scaled).astype(np.int16), index=pd.Index(dates, name="Date"),
+                        columns=keyword_names(n_keywords)), scaled
+
+
+# 원본 내보내기 형식: 0 으로 반올림된 작은 값은 '<1', 열 이름에는 지역 접미사
+def trend_export_frame(df, scaled):
+    values = df.to_numpy().astype(object)
+    values[(scaled > 0) & (scaled < 0.5)] = "<1"
+    raw = pd.DataFrame(values, index=df.index, columns=[f"{col} ({REGION})" for col in df.columns])
+    return raw.reset_index()
+
+
+# 2. 학술 (연도 x 주제)
+def scholar_frame(n_topics, years, seed=0, end_year=END_YEAR):
+    rng = np.random.default_rng(seed + 1)
+    year_values = np.arange(end_year - years + 1, end_year + 1)
+    t = np.arange(years)[:, None]
+    base = rng.lognormal(4.0, 0.8, n_topics)
+    growth = rng.normal(0.08, 0.07, n_topics)
+    expected = base * np.exp(growth * t)
+    counts = rng.poisson(expected)
+    df = pd.DataFrame(counts, columns=_names(n_topics, [(word,) for word in TOPIC_WORDS]))
+    df.insert(0, "Year", year_values)
+    return df
+
+
+# 3. 기업 (순위순) + 상세 정보
+def company_datasets(n_companies, seed=0):
+    rng = np.random.default_rng(seed + 2)
+    names = _names(n_companies, [(stem, form) for stem in COMPANY_STEMS for form in COMPANY_FORMS], sep="")
+    scores = np.sort(rng.integers(40, 200, n_companies))[::-1]
+
+    city_names = list(CITIES)
+    weights = np.array([CITIES[c][2] for c in city_names])
+    city = rng.choice(len(city_names), n_companies, p=weights / weights.sum())
+    centers = np.array([CITIES[c][:2] for c in city_names])[city]
+    lat, lon = (centers + rng.normal(0, 0.08, (n_companies, 2))).T
+
+    df_map = pd.DataFrame({
+        "순위": np.arange(1, n_companies + 1),
+        "기업명": names,
+        "총점": scores,
+        "주소": [f"{city_names[c]} 가상로 {rng.integers(1, 500)}" for c in city],
+        "lat": lat.round(5),
+        "lon": lon.round(5),
+    })
+    details = []
+    for rank, name in zip(df_map["순위"], names):
+        products = rng.choice(PRODUCT_TERMS, rng.integers(1, 6), replace=False)
+        intro = f"{name}은(는) {rng.integers(1950, 2021)}년 설립된 식품 기업입니다."
+        if rng.random() < 0.4:
+            intro += f" {rng.choice(GLOBAL_HINTS)} 확대 중."
+        details.append({"순위": int(rank), "기업명": name, "소개": intro, "주력제품": ", ".join(products),
+                        "비전": "", "홈페이지": "", "유튜브": ""})
+    return df_map, details
+
+
+# 4. 한 번에 생성 (bench.py 에서 사용)
+def generate(keywords, years, topics, companies, seed=0):
+    trends, scaled = trend_frame(keywords, years, seed)
+    df_map, details = company_datasets(companies, seed)
+    return {
+        "trends": trends,
+        "trends_raw": trend_export_frame(trends, scaled),
+        "scholar": scholar_frame(topics, years, seed),
+        "company_map": df_map,
+        "company_details": details,
+    }
+
+
+def write_datasets(data, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {
+        "food_trends": os.path.join(out_dir, "food_trends.csv"),
+        "scholar_data": os.path.join(out_dir, "scholar_data.csv"),
+        "companies": os.path.join(out_dir, "companies.csv"),
+    }
+    data["trends_raw"].to_csv(paths["food_trends"], index=False, date_format="%Y-%m-%d")
+    data["scholar"].to_csv(paths["scholar_data"], index=False)
+    pd.DataFrame(data["company_details"]).merge(data["company_map"], on=["순위", "기업명"]).to_csv(paths["companies"], index=False)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시드 고정 합성 트렌드/학술/기업 데이터를 CSV 로 생성합니다.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="규모 단계 (개별 옵션이 우선)")
+    parser.add_argument("--keywords", type=int, help="트렌드 키워드 수")
+    parser.add_argument("--years", type=int, help="기간 (년)")
+    parser.add_argument("--topics", type=int, help="연구 주제 수")
+    parser.add_argument("--companies", type=int, help="기업 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="synthetic", help="출력 폴더 (기본: synthetic/)")
+    args = parser.parse_args(argv)
+
+    size = {key: getattr(args, key) or value for key, value in SCALES[args.scale].items()}
+    data = generate(**size, seed=args.seed)
+    for name, path in write_datasets(data, args.out).items():
+        print(f"🛰️ {name}: {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+    print(f"   키워드 {size['keywords']} x {size['years']}년, 주제 {size['topics']}, 기업 {size['companies']} (seed={args.seed})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
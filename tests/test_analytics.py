@@ -0,0 +1,175 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analytics
+
+
+# 시차별로 겹치는 구간만 잘라 np.corrcoef 로 직접 구한 값
+def brute_force(x, y, lags):
+    n = len(x)
+    r = np.zeros((len(lags), x.shape[1], y.shape[1]))
+    for li, k in enumerate(lags):
+        xs = x[max(-k, 0):n - max(k, 0)]
+        ys = y[max(k, 0):n + min(k, 0)]
+        for i in range(x.shape[1]):
+            for j in range(y.shape[1]):
+                if xs[:, i].std() > 0 and ys[:, j].std() > 0:
+                    r[li, i, j] = np.corrcoef(xs[:, i], ys[:, j])[0, 1]
+    return r
+
+
+def test_cross_correlation_matches_lagged_corrcoef():
+    rng = np.random.default_rng(0)
+    n = 20
+    x = rng.normal(size=(n, 3)).cumsum(axis=0) + 50
+    y = np.column_stack([np.roll(x[:, 0], 3) + rng.normal(0, 0.1, n), rng.normal(size=n), np.full(n, 7.0)])
+    lags, r = analytics.cross_correlation_fft(x, y)
+    assert np.allclose(r, brute_force(x, y, lags), atol=1e-9)
+    assert np.abs(r).max() <= 1.0
+    # 절반 이상 겹치는 시차까지만
+    assert lags.max() == n - int(np.ceil(analytics.MIN_OVERLAP_FRACTION * n))
+
+
+def test_cross_correlation_blocks_match_single_pass(monkeypatch):
+    rng = np.random.default_rng(1)
+    x, y = rng.normal(size=(12, 4)), rng.normal(size=(12, 9))
+    lags, full = analytics.cross_correlation_fft(x, y)
+    monkeypatch.setattr(analytics, "LEAD_LAG_BLOCK", 1)
+    _, blocked = analytics.cross_correlation_fft(x, y)
+    assert np.allclose(full, blocked)
+
+
+def test_lead_lag_table_finds_shift():
+    years = np.arange(2000, 2020)
+    rng = np.random.default_rng(2)
+    papers = rng.normal(size=len(years)).cumsum() + 100
+    dates = pd.date_range("2000-01-02", "2019-12-29", freq="W")
+    yearly = pd.Series(np.roll(papers, 2), index=years)
+    trend = pd.DataFrame({"kw": yearly.reindex(dates.year).to_numpy()}, index=dates)
+    table = analytics.lead_lag_table(pd.DataFrame({"Year": years, "topic": papers}), trend)
+    assert table.loc[0, "best_lag"] == 2
+    assert -1 <= table.loc[0, "strength"] <= 1
+
+
+def test_top_correlation_pairs_matches_full_table():
+    rng = np.random.default_rng(1)
+    base = rng.normal(size=(60, 1))
+    df = pd.DataFrame(np.hstack([base + rng.normal(0, s, (60, 1)) for s in np.linspace(0.1, 3, 12)]),
+                      columns=[f"k{i}" for i in range(12)])
+    df["flat"] = 1.0
+    full = analytics.correlation_pairs(df)
+    top = analytics.top_correlation_pairs(df, 5)
+
+    expected = full.dropna().iloc[np.argsort(-np.abs(full["r"].dropna().to_numpy()), kind="stable")[:5]]
+    assert list(zip(top["a"], top["b"]))[:5] == list(zip(expected["a"], expected["b"]))
+    np.testing.assert_allclose(top["r"].to_numpy()[:5], expected["r"].to_numpy())
+    # 하이라이트는 전체 표에서 고른 것과 같은 쌍
+    for name, row in analytics.correlation_highlights(full).items():
+        pick = analytics.correlation_highlights(top)[name]
+        assert (top["a"].iloc[pick], top["b"].iloc[pick]) == (full["a"].iloc[row], full["b"].iloc[row])
+
+
+# 계절성: ISO 주차 기준 정렬 — 2021-01-03 은 2020년 53주차, 그다음 주는 2021년 1주차
+def test_seasonal_cube_aligns_iso_week_53():
+    dates = pd.date_range("2019-01-06", "2022-12-25", freq="W")
+    iso = dates.isocalendar()
+    df = pd.DataFrame({"k": iso["week"].to_numpy(dtype=float)}, index=dates)
+
+    cube, years, week_pos = analytics.seasonal_cube(df)
+    assert years.tolist() == [2019, 2020, 2021, 2022]
+    row = dates.get_loc(pd.Timestamp("2021-01-03"))
+    assert week_pos[row] == 52 and week_pos[row + 1] == 0
+    assert cube[1, 52, 0] == 53 and cube[2, 0, 0] == 1
+    # 53주차가 없는 해는 그 칸이 비어 있음
+    assert np.isnan(cube[[0, 2, 3], 52, 0]).all()
+
+
+# 해마다 같은 계절 모양 + 연도별 수준 차이: 프로파일은 그 모양을 찾고 조정 시계열에서는 계절성이 빠짐
+def test_seasonal_decomposition_recovers_shape():
+    dates = pd.date_range("2018-01-07", "2022-12-25", freq="W")
+    week = dates.isocalendar()["week"].to_numpy()
+    shape = 10 * np.sin(2 * np.pi * (week - 1) / 52)
+    df = pd.DataFrame({"k": shape + 5 * (dates.year - 2018)}, index=dates)
+
+    result = analytics.seasonal_decomposition(df)
+    profile = result["profile"]["k"]
+    assert abs(profile.mean()) < 1e-9
+    assert profile.idxmax() == 14 and profile.idxmin() == 40
+    adjusted = result["adjusted"]["k"]
+    assert adjusted.groupby(dates.isocalendar()["year"].to_numpy()).std().max() < 1.0
+
+
+def _weekly(start="2022-01-02", periods=156):
+    dates = pd.date_range(start, periods=periods, freq="W")
+    return pd.DataFrame({"k": np.arange(periods, dtype=float)}, index=dates)
+
+
+# 피라미드 구간: 주 단위는 범위 안의 주만, 집계 단계는 시작일·끝일이 속한 구간까지 포함
+def test_pyramid_slice_edges_between_buckets():
+    df = _weekly()
+    pyramid = analytics.build_time_pyramid(df)
+
+    level, weekly = analytics.pyramid_slice(pyramid, "2023-02-15", "2023-05-20", level="W")
+    assert level == "W"
+    assert weekly.index[0] == pd.Timestamp("2023-02-19") and weekly.index[-1] == pd.Timestamp("2023-05-14")
+
+    _, monthly = analytics.pyramid_slice(pyramid, "2023-02-15", "2023-05-20", level="M")
+    assert monthly.index.tolist() == [pd.Timestamp(f"2023-{m:02d}-01") for m in range(2, 6)]
+
+    _, quarterly = analytics.pyramid_slice(pyramid, "2023-02-15", "2023-05-20", level="Q")
+    assert quarterly.index.tolist() == [pd.Timestamp("2023-01-01"), pd.Timestamp("2023-04-01")]
+
+    # 데이터보다 앞에서 시작하는 범위는 첫 구간부터
+    _, yearly = analytics.pyramid_slice(pyramid, "2020-06-01", "2022-03-01", level="Y")
+    assert yearly.index.tolist() == [pd.Timestamp("2022-01-01")]
+    assert yearly["k"].iloc[0] == df.loc["2022", "k"].mean()
+
+
+def test_pyramid_slice_picks_finest_level_within_budget():
+    pyramid = analytics.build_time_pyramid(_weekly())
+    assert analytics.pyramid_slice(pyramid, "2022-01-01", "2024-12-31", max_points=200)[0] == "W"
+    assert analytics.pyramid_slice(pyramid, "2022-01-01", "2024-12-31", max_points=100)[0] == "M"
+    assert analytics.pyramid_slice(pyramid, "2022-01-01", "2024-12-31", max_points=20)[0] == "Q"
+    assert analytics.pyramid_slice(pyramid, "2022-01-01", "2024-12-31", max_points=2)[0] == "Y"
+
+
+KEYWORDS = ["Matcha", "Zero Sugar", "말차 라떼", "제로 음료", "Protein Bar", "단백질 바", "Sugar Free", "말차"]
+
+
+# 검색: 이름 일치 > 이름 접두어 > 단어 접두어 > 부분 문자열, 대소문자 무시
+def test_search_keywords_korean_english_and_partial():
+    index = analytics.build_keyword_index(KEYWORDS)
+    assert analytics.search_keywords(index, "말차") == ["말차", "말차 라떼"]
+    assert analytics.search_keywords(index, "  SUGAR ") == ["Sugar Free", "Zero Sugar"]
+    assert analytics.search_keywords(index, "matcha") == ["Matcha"]
+    assert analytics.search_keywords(index, "백질") == ["단백질 바"]
+    assert analytics.search_keywords(index, "라떼") == ["말차 라떼"]
+    assert analytics.search_keywords(index, "ro") == ["Protein Bar", "Zero Sugar"]
+    assert analytics.search_keywords(index, "없는말") == []
+    assert analytics.search_keywords(index, "") == []
+
+
+# 같은 순위 안에서는 모멘텀이 큰 순, limit 개만
+def test_search_keywords_orders_ties_by_momentum():
+    index = analytics.build_keyword_index(KEYWORDS)
+    momentum = np.array([0, 1, 0, 0, 9, 0, 5, np.nan])
+    assert analytics.search_keywords(index, "r", momentum=momentum) == ["Protein Bar", "Sugar Free", "Zero Sugar"]
+    assert analytics.search_keywords(index, "r", limit=2, momentum=momentum) == ["Protein Bar", "Sugar Free"]
+
+
+def test_keyword_momentum_and_top_movers():
+    values = np.zeros((16, 4))
+    values[-4:] = [10, -5, 3, 0]
+    values[:, 3] = np.nan
+    momentum = analytics.keyword_momentum(pd.DataFrame(values + 20, columns=["a", "b", "c", "d"]))
+    np.testing.assert_allclose(momentum["momentum"].to_numpy()[:3], [10, -5, 3])
+    np.testing.assert_allclose(momentum.loc["a", "momentum_pct"], 50)
+
+    assert analytics.top_movers(momentum, 2).index.tolist() == ["a", "c"]
+    assert analytics.top_movers(momentum, 10).index.tolist() == ["a", "c", "b"]
+    assert analytics.top_movers(momentum, 1, largest=False).index.tolist() == ["b"]
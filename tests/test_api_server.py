@@ -0,0 +1,44 @@
+import gzip
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api_server
+import service
+
+
+def _api(tmp_path, monkeypatch, cache_size=4):
+    rows = "".join(f"2024-{m:02d}-07,{m * 3},{90 - m},{m % 5}\n" for m in range(1, 13))
+    (tmp_path / "food_trends.csv").write_text("Date,A (South Korea),B (South Korea),C (South Korea)\n" + rows, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    return api_server.AnalyticsAPI(service.AnalyticsService(), cache_size=cache_size)
+
+
+# 엔드포인트가 쓰지 않는 파라미터는 캐시 키를 늘리지 않고, 캐시는 상한을 넘지 않음
+def test_response_cache_is_normalized_and_bounded(tmp_path, monkeypatch):
+    api = _api(tmp_path, monkeypatch)
+    first = api.respond("/api/trends", "")
+    for i in range(20):
+        assert api.respond("/api/trends", f"x={i}")[1] is first[1]
+    for window in range(1, 10):
+        assert api.respond("/api/trends/summary", f"window={window}")[0] == 200
+    assert len(api._bodies) == 4
+    assert api.respond("/api/trends/summary", "window=0")[0] == 400
+
+
+# gzip 본문은 캐시되고, 평문과 다른 ETag 를 가짐
+def test_gzip_body_is_cached_with_its_own_etag(tmp_path, monkeypatch):
+    api = _api(tmp_path, monkeypatch)
+    api_server.GZIP_MIN_BYTES, saved = 0, api_server.GZIP_MIN_BYTES
+    try:
+        status, plain, etag, encoding = api.respond("/api/trends", "")
+        _, zipped, gz_etag, gz_encoding = api.respond("/api/trends", "", accept_gzip=True)
+        again = api.respond("/api/trends", "", accept_gzip=True)[1]
+    finally:
+        api_server.GZIP_MIN_BYTES = saved
+    assert (status, encoding, gz_encoding) == (200, None, "gzip")
+    assert gzip.decompress(zipped) == plain and again is zipped
+    assert gz_etag != etag and gz_etag.endswith('-gz"')
+    assert json.loads(plain)["data"]["columns"] == ["A", "B", "C"]
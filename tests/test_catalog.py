@@ -0,0 +1,57 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import catalog
+import service
+
+
+def _write_trends(path, values):
+    rows = "".join(f"2024-01-{7 * (i + 1):02d},{v}\n" for i, v in enumerate(values))
+    path.write_text("Date,말차 (South Korea)\n" + rows, encoding="utf-8")
+
+
+# 루트 폴더와 data/ 에 내용이 다른 동명 파일: 둘 다 남고 앞선 루트(.)가 원래 이름을 가짐
+def test_same_name_in_root_and_data(tmp_path, monkeypatch):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "x.csv").write_text("a,b\n1,2\n")
+    (tmp_path / "x.csv").write_text("a,b\n3,4\n5,6\n")
+    monkeypatch.chdir(tmp_path)
+
+    data_catalog = catalog.DatasetCatalog()
+    assert sorted(data_catalog.names()) == ["data/x", "x"]
+    assert data_catalog.path("x") == "x.csv"
+    assert data_catalog.path("data/x") == os.path.join("data", "x.csv")
+
+
+# data/ 에 같은 사본이 있어도 루트 파일을 고치면 앱 데이터가 바뀜
+def test_root_edit_reaches_app_data(tmp_path, monkeypatch):
+    (tmp_path / "data").mkdir()
+    _write_trends(tmp_path / "food_trends.csv", [10, 20, 30])
+    _write_trends(tmp_path / "data" / "food_trends.csv", [10, 20, 30])
+    monkeypatch.chdir(tmp_path)
+
+    svc = service.AnalyticsService()
+    assert svc.trends()["말차"].tolist() == [10, 20, 30]
+    assert svc.catalog.info(service.TREND_DATASET)["duplicates"] == [os.path.join("data", "food_trends.csv")]
+
+    _write_trends(tmp_path / "food_trends.csv", [10, 20, 30, 100])
+    svc.catalog.refresh()
+    assert svc.trends()["말차"].tolist() == [10, 20, 30, 100]
+    assert svc.catalog.path(service.TREND_DATASET) == "food_trends.csv"
+
+
+# 빈 파일 / 깨진 CSV 는 오류로 기록하고 건너뛰며 나머지 데이터셋은 그대로 읽힘
+def test_unreadable_files_are_skipped(tmp_path, monkeypatch):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "empty.csv").write_bytes(b"")
+    (tmp_path / "data" / "broken.csv").write_text('a,b\n1,2\n3,4,5,6\n"7,8\n')
+    (tmp_path / "data" / "ok.csv").write_text("a,b\n1,2\n")
+    monkeypatch.chdir(tmp_path)
+
+    data_catalog = catalog.DatasetCatalog()
+    assert data_catalog.names() == ["ok"]
+    assert sorted(data_catalog.errors) == [os.path.join("data", "broken.csv"), os.path.join("data", "empty.csv")]
+    assert "EmptyDataError" in data_catalog.errors[os.path.join("data", "empty.csv")]
+    assert data_catalog.load("ok")["a"].tolist() == [1]
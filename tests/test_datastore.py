@@ -0,0 +1,50 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import datastore
+
+
+# 앞부분 64KB 가 ASCII 뿐인 cp949 파일: UTF-8 로 판별돼도 뒤쪽 한글에서 실패하지 않고 cp949 로 다시 읽어야 함
+def test_ingest_cp949_with_ascii_head(tmp_path):
+    path = tmp_path / "late_korean.csv"
+    lines = ["name,value"] + [f"row{i},{i}" for i in range(20000)] + ["한국,1"]
+    path.write_bytes(("\n".join(lines) + "\n").encode("cp949"))
+
+    with open(path, "rb") as f:
+        assert datastore.detect_encoding(f.read(datastore.ENCODING_SAMPLE_BYTES)) == "utf-8"
+
+    df = datastore.ingest_csv(path, chunksize=5000)
+    assert len(df) == 20001
+    assert df["name"].iloc[-1] == "한국"
+    assert df.attrs["encoding"] == "cp949"
+
+
+# float32 로 정확히 되돌아오지 않는 값은 float64 그대로 (좌표, 금액 등이 조용히 바뀌지 않도록)
+def test_compact_keeps_float64_unless_exact():
+    import pandas as pd
+
+    df = datastore.compact_frame(pd.DataFrame({
+        "price": [1234567.89, 1.5],
+        "lat": [37.51008, 37.53584],
+        "half": [0.5, 0.25],
+        "missing": [0.5, float("nan")],
+    }))
+    assert df["price"].dtype == "float64" and df["price"].iloc[0] == 1234567.89
+    assert df["lat"].dtype == "float64" and df["lat"].iloc[0] == 37.51008
+    assert df["half"].dtype == "float32"
+    assert df["missing"].dtype == "float32"
+
+
+# 청크마다 dtype 이 달랐던 열만 결합 후 다시 압축되고, 나머지는 청크 dtype 그대로
+def test_ingest_recompacts_only_mixed_columns(tmp_path):
+    path = tmp_path / "mixed.csv"
+    rows = [f"{i % 100},{i % 7},{i % 3}" for i in range(10)] + [f"{i % 100},{i % 7}.5,{i % 3}" for i in range(10, 20)]
+    path.write_text("score,amount,group\n" + "\n".join(rows) + "\n")
+
+    df = datastore.ingest_csv(path, chunksize=10)
+    assert df["score"].dtype == "uint8" and df["group"].dtype == "uint8"
+    assert df["amount"].dtype == "float32"
+    assert df["amount"].iloc[-1] == 19 % 7 + 0.5 and df["amount"].iloc[0] == 0
+    assert len(df) == 20 and df.attrs["encoding"] == "utf-8"
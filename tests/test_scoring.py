@@ -0,0 +1,43 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scoring
+
+
+def _components(n=50, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(rng.uniform(0, 100, (n, 4)), columns=list(scoring.DEFAULT_WEIGHTS),
+                        index=pd.Index([f"기업{i}" for i in range(n)], name="기업명"))
+
+
+def full_scores(components, weights):
+    w = np.array([weights[name] for name in components.columns])
+    return components.to_numpy() @ w / w.sum()
+
+
+# 가중치를 여러 번 바꾼 뒤의 증분 점수가 처음부터 계산한 가중합과 같음 (중간 재계산 포함)
+def test_incremental_weights_match_full_recomputation():
+    components = _components()
+    engine = scoring.ScoreEngine(components)
+    weights = dict(scoring.DEFAULT_WEIGHTS)
+    rng = np.random.default_rng(1)
+    for step in range(scoring.REBUILD_EVERY + 40):
+        name = components.columns[step % 4]
+        weights[name] = round(float(rng.uniform(0, 1)), 3)
+        engine.set_weight(name, weights[name])
+        if step % 37 == 0:
+            np.testing.assert_allclose(engine.scores().to_numpy(), full_scores(components, weights), rtol=1e-12)
+    np.testing.assert_allclose(engine.scores().to_numpy(), full_scores(components, weights), rtol=1e-12)
+    assert engine.ranking()["종합점수"].is_monotonic_decreasing
+
+
+def test_set_weights_counts_changes_and_zero_total():
+    engine = scoring.ScoreEngine(_components(5))
+    assert engine.set_weights(dict(scoring.DEFAULT_WEIGHTS)) == 0
+    assert engine.set_weights({name: 0.0 for name in scoring.DEFAULT_WEIGHTS}) == 4
+    assert (engine.scores() == 0).all()
@@ -0,0 +1,139 @@
+# 워드 클라우드: 기업 소개/주력제품 문장과 트렌드 키워드로 단어 빈도를 만들고 이미지를 그립니다.
+# 빈도 계산은 가볍지만 WordCloud 렌더링은 이미지 한 장에 수 초가 걸리므로,
+# 결과 PNG 를 (빈도 + 옵션 + 폰트) 내용 해시 이름으로 디스크에 저장하고 렌더링은 백그라운드 스레드에서만 합니다.
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+
+from matplotlib import font_manager
+
+CACHE_DIR = os.path.join(".cache", "wordcloud")
+KOREAN_FONT_NAMES = ("NanumGothic", "Nanum Gothic", "Noto Sans CJK KR", "Noto Sans KR", "Malgun Gothic", "AppleGothic", "UnDotum")
+
+# 조사/어미 (긴 것부터 떼어냄) 와 빈도에서 뺄 흔한 단어
+PARTICLES = sorted(["으로", "에서", "에게", "까지", "부터", "처럼", "보다", "이며", "으며", "하며", "하고", "하는", "했습니다", "입니다",
+                    "을", "를", "이", "가", "은", "는", "의", "에", "와", "과", "도", "로", "만"], key=len, reverse=True)
+STOPWORDS = {"국내", "최근", "통해", "함께", "중인", "기업", "진정한", "넘어", "있으며", "중입니다", "시리즈", "대한"}
+TOKEN_PATTERN = re.compile(r"[가-힣A-Za-z][가-힣A-Za-z0-9]*")
+
+PRODUCT_WEIGHT = 2.0   # 주력제품은 소개 문장보다 비중을 크게
+KEYWORD_WEIGHT = 3.0   # 트렌드 키워드는 평균 점수에 비례 (최대 KEYWORD_WEIGHT × 최고 빈도)
+
+
+def find_korean_font(font_path=None):
+    if font_path and os.path.exists(font_path):
+        return font_path
+    for font in font_manager.fontManager.ttflist:
+        if any(name in font.name for name in KOREAN_FONT_NAMES):
+            return font.fname
+    return None
+
+
+def _strip_particle(token):
+    for particle in PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= 2:
+            return token[:-len(particle)]
+    return token
+
+
+def tokenize(text):
+    tokens = (_strip_particle(token) for token in TOKEN_PATTERN.findall(text))
+    return [token for token in tokens if len(token) >= 2 and token not in STOPWORDS]
+
+
+# 1. 단어 빈도
+# details: 기업 상세 레코드 목록, keyword_scores: {트렌드 키워드: 평균 점수} (선택)
+def term_frequencies(details, keyword_scores=None):
+    counts = Counter()
+    for record in details:
+        counts.update(tokenize(record.get("소개", "")))
+        # 제품명은 '신라면(블랙/레드)' 처럼 붙어 있어야 의미가 있으므로 쉼표 단위 그대로 사용
+        for product in record.get("주력제품", "").split(","):
+            product = re.sub(r"\(.*?\)", "", product).strip()
+            if product:
+                counts[product] += PRODUCT_WEIGHT
+
+    if keyword_scores:
+        top = max(counts.values(), default=1)
+        best = max(keyword_scores.values()) or 1
+        for keyword, score in keyword_scores.items():
+            counts[keyword] += KEYWORD_WEIGHT * top * score / best
+    return {term: float(count) for term, count in counts.most_common()}
+
+
+# 2. 디스크 캐시 (내용 해시)
+def image_key(frequencies, font_path, **options):
+    payload = json.dumps([sorted(frequencies.items()), font_path, sorted(options.items())], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:20]
+
+
+def image_path(key, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, f"{key}.png")
+
+
+def render_image(frequencies, path, font_path=None, width=900, height=450, colormap="cool", max_words=120):
+    from wordcloud import WordCloud
+
+    cloud = WordCloud(font_path=font_path, width=width, height=height, mode="RGBA", background_color=None,
+                      colormap=colormap, max_words=max_words, prefer_horizontal=0.95, random_state=42)
+    cloud.generate_from_frequencies(frequencies)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    cloud.to_image().save(tmp, format="PNG", optimize=True)
+    os.replace(tmp, path)
+    return path
+
+
+# 3. 백그라운드 렌더러 (프로세스당 하나, 같은 이미지는 한 번만 그림)
+class CloudRenderer:
+    def __init__(self, cache_dir=CACHE_DIR, workers=1):
+        self.cache_dir = cache_dir
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wordcloud")
+        self._pending = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+
+    # 캐시에 있으면 (key, 경로), 없으면 렌더링을 예약하고 (key, None) — 요청 경로는 절대 기다리지 않음
+    def request(self, frequencies, font_path=None, **options):
+        key = image_key(frequencies, font_path, **options)
+        path = image_path(key, self.cache_dir)
+        if os.path.exists(path):
+            return key, path
+        with self._lock:
+            # 실패한 이미지는 프로세스가 살아 있는 동안 다시 시도하지 않음 (폴링마다 재시도 방지)
+            if key in self._pending or key in self._errors:
+                return key, None
+            future = self._pool.submit(render_image, dict(frequencies), path, font_path, **options)
+            self._pending[key] = future
+        future.add_done_callback(lambda _, key=key: self._forget(key))
+        return key, None
+
+    def _forget(self, key):
+        with self._lock:
+            future = self._pending.pop(key, None)
+            # 완료 콜백이라 exception() 은 기다리지 않음 — 대기 목록에서 빼는 것과 실패 기록을 한 번에 해서
+            # request() 가 그 사이에 같은 이미지를 다시 예약하지 않게 함
+            if future is not None and future.exception() is not None:
+                self._errors[key] = future.exception()
+
+    # 예약된 렌더링이 끝날 때까지 기다림 (정적 빌드처럼 결과가 꼭 있어야 하는 일괄 작업용). 기다린 작업이 있었으면 True
+    def wait(self, timeout=None):
+        with self._lock:
+            futures = list(self._pending.values())
+        wait_futures(futures, timeout=timeout)
+        return bool(futures)
+
+    def status(self, key):
+        if os.path.exists(image_path(key, self.cache_dir)):
+            return "ready"
+        if key in self._errors:
+            return "failed"
+        return "rendering" if key in self._pending else "missing"
+
+    def error(self, key):
+        return self._errors.get(key)
@@ -0,0 +1,237 @@
+# 오프라인 지도 타일 서버: 행성 좌표(Map) 페이지의 pydeck 지도 배경을 외부 타일 서비스 없이 그립니다.
+# tiles/{z}/{x}/{y}.png 에 미리 받아 둔 래스터 타일을 캐시 헤더(Cache-Control, ETag)와 함께 제공하고,
+# 같은 서버의 /style.json (MapLibre 스타일) 을 Deck 의 map_style 로 지정해 사용합니다.
+#
+#   python tile_server.py seed --zoom 5-10                 # 한반도 영역 타일 미리 받기 (인터넷 되는 곳에서 한 번)
+#   python tile_server.py serve --port 8504                # 오프라인 환경에서 타일 제공
+#   EXPLORER_BASEMAP_URL=http://127.0.0.1:8504/style.json streamlit run streamlit_app.py
+#
+# ※ 타일 제공처의 이용 정책(대량 다운로드 제한, 저작권 표시)을 확인하고 --upstream 을 지정하세요.
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+TILE_DIR = "tiles"
+KOREA_BBOX = (124.5, 33.0, 131.0, 38.7)   # (서경, 남위, 동경, 북위)
+DEFAULT_ZOOMS = "5-10"
+DEFAULT_UPSTREAM = "https://basemaps.cartocdn.com/dark_all/{z}/{x}/{y}.png"
+ATTRIBUTION = "© OpenStreetMap contributors © CARTO"
+TILE_MAX_AGE = 7 * 24 * 3600
+USER_AGENT = "ExplorerTileSeeder/1.0"
+
+
+# 1. 타일 좌표 (웹 메르카토르 XYZ)
+def tile_xy(lon, lat, zoom):
+    n = 2 ** zoom
+    lat = max(min(lat, 85.0511), -85.0511)
+    x = int((lon + 180) / 360 * n)
+    y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def iter_tiles(bbox, zooms):
+    west, south, east, north = bbox
+    for zoom in zooms:
+        x0, y0 = tile_xy(west, north, zoom)
+        x1, y1 = tile_xy(east, south, zoom)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                yield zoom, x, y
+
+
+def parse_zooms(text):
+    zooms = set()
+    for part in text.split(","):
+        if "-" in part:
+            lo, hi = part.split("-")
+            zooms.update(range(int(lo), int(hi) + 1))
+        elif part.strip():
+            zooms.add(int(part))
+    return sorted(zooms)
+
+
+# 2. 디스크 타일 저장소
+class TileStore:
+    def __init__(self, root=TILE_DIR, upstream=DEFAULT_UPSTREAM):
+        self.root = root
+        self.upstream = upstream
+
+    def path(self, z, x, y):
+        return os.path.join(self.root, str(z), str(x), f"{y}.png")
+
+    def zoom_levels(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(int(name) for name in os.listdir(self.root) if name.isdigit())
+
+    def fetch(self, z, x, y):
+        request = urllib.request.Request(self.upstream.format(z=z, x=x, y=y), headers={"User-Agent": USER_AGENT})
+        with urllib.request.urlopen(request, timeout=20) as resp:
+            body = resp.read()
+        path = self.path(z, x, y)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 받다 만 파일이 서빙되지 않도록 임시 파일에 쓴 뒤 교체
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(body)
+        os.replace(tmp, path)
+        return path
+
+
+# 3. 미리 받기 (이미 있는 타일은 건너뜀)
+def seed(store, bbox=KOREA_BBOX, zooms=None, workers=4, force=False):
+    tiles = list(iter_tiles(bbox, zooms or parse_zooms(DEFAULT_ZOOMS)))
+    todo = [tile for tile in tiles if force or not os.path.exists(store.path(*tile))]
+    counts = {"total": len(tiles), "cached": len(tiles) - len(todo), "downloaded": 0, "failed": 0}
+
+    def download(tile):
+        try:
+            store.fetch(*tile)
+            return True
+        except OSError as e:
+            print(f"❌ {tile}: {e}", file=sys.stderr)
+            return False
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for i, ok in enumerate(pool.map(download, todo), 1):
+            counts["downloaded" if ok else "failed"] += 1
+            if i % 100 == 0 or i == len(todo):
+                print(f"   {i}/{len(todo)} 타일 처리")
+    return counts
+
+
+# 4. 스타일 + 타일 HTTP 서버
+def style_json(base_url, zooms, bbox=KOREA_BBOX, background="#2b2b2b"):
+    return {
+        "version": 8,
+        "name": "explorer-offline",
+        "sources": {
+            "offline": {
+                "type": "raster",
+                "tiles": [f"{base_url}/tiles/{{z}}/{{x}}/{{y}}.png"],
+                "tileSize": 256,
+                "minzoom": min(zooms, default=0),
+                "maxzoom": max(zooms, default=0),
+                "bounds": list(bbox),
+                "attribution": ATTRIBUTION,
+            }
+        },
+        "layers": [
+            {"id": "background", "type": "background", "paint": {"background-color": background}},
+            {"id": "offline", "type": "raster", "source": "offline"},
+        ],
+    }
+
+
+def make_handler(store, fill=False):
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "ExplorerTiles/1.0"
+
+        def _send(self, status, body=b"", content_type="application/json; charset=utf-8", headers=None):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            # 지도는 Streamlit 과 다른 출처(포트)에서 불러오므로 CORS 허용
+            self.send_header("Access-Control-Allow-Origin", "*")
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            if body and self.command != "HEAD":
+                self.wfile.write(body)
+
+        def do_GET(self):
+            path = urlsplit(self.path).path
+            if path == "/style.json":
+                base_url = f"http://{self.headers.get('Host', f'127.0.0.1:{self.server.server_port}')}"
+                body = json.dumps(style_json(base_url, store.zoom_levels())).encode("utf-8")
+                self._send(200, body, headers={"Cache-Control": "no-cache"})
+                return
+
+            parts = path.strip("/").split("/")
+            if len(parts) != 4 or parts[0] != "tiles" or not parts[3].endswith(".png"):
+                self._send(404, b'{"error": "not found"}')
+                return
+            try:
+                z, x, y = int(parts[1]), int(parts[2]), int(parts[3][:-4])
+            except ValueError:
+                self._send(400, b'{"error": "bad tile coordinates"}')
+                return
+
+            tile_path = store.path(z, x, y)
+            if not os.path.exists(tile_path) and fill:
+                try:
+                    store.fetch(z, x, y)
+                except OSError:
+                    pass
+            if not os.path.exists(tile_path):
+                # 없는 타일도 잠시 캐시해 같은 요청이 반복되지 않도록
+                self._send(404, b"", "image/png", {"Cache-Control": "public, max-age=300"})
+                return
+
+            stat = os.stat(tile_path)
+            etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+            headers = {
+                "Cache-Control": f"public, max-age={TILE_MAX_AGE}",
+                "ETag": etag,
+                "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+            }
+            if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+                self._send(304, headers=headers)
+                return
+            with open(tile_path, "rb") as f:
+                self._send(200, f.read(), "image/png", headers)
+
+        do_HEAD = do_GET
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="오프라인 지도 타일 미리 받기 / 제공")
+    parser.add_argument("--tiles", default=TILE_DIR, help="타일 폴더 (기본: tiles/)")
+    parser.add_argument("--upstream", default=DEFAULT_UPSTREAM, help="원본 타일 URL 템플릿 ({z}/{x}/{y})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_cmd = commands.add_parser("seed", help="지정한 영역/줌 레벨의 타일을 미리 받기")
+    seed_cmd.add_argument("--zoom", default=DEFAULT_ZOOMS, help="줌 레벨 (예: 5-10 또는 5,7,9)")
+    seed_cmd.add_argument("--bbox", type=float, nargs=4, default=KOREA_BBOX, metavar=("WEST", "SOUTH", "EAST", "NORTH"))
+    seed_cmd.add_argument("--workers", type=int, default=4)
+    seed_cmd.add_argument("--force", action="store_true", help="이미 받은 타일도 다시 받기")
+
+    serve_cmd = commands.add_parser("serve", help="타일과 style.json 제공")
+    serve_cmd.add_argument("--host", default="127.0.0.1")
+    serve_cmd.add_argument("--port", type=int, default=8504)
+    serve_cmd.add_argument("--fill", action="store_true", help="없는 타일은 원본에서 받아 저장 (온라인일 때)")
+    args = parser.parse_args(argv)
+
+    store = TileStore(args.tiles, args.upstream)
+    if args.command == "seed":
+        zooms = parse_zooms(args.zoom)
+        counts = seed(store, tuple(args.bbox), zooms, args.workers, args.force)
+        print(f"🗺️ 줌 {zooms[0]}~{zooms[-1]}: 전체 {counts['total']}장 (기존 {counts['cached']}, 새로 받음 {counts['downloaded']}, 실패 {counts['failed']})")
+        return 1 if counts["failed"] else 0
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(store, args.fill))
+    print(f"🗺️ 타일 서버: http://{args.host}:{args.port}/style.json (줌 {store.zoom_levels() or '없음'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+# 시작 시 캐시 예열 (opt-in)
+# 첫 방문자가 페이지마다 데이터 적재·정리, 파생 지표 계산, 첫 Plotly 그림 생성 비용을 떠안지 않도록
+# 서버가 뜨자마자 백그라운드 스레드에서 미리 한 번 실행해 둡니다.
+# 데이터 파일이 바뀌면(추가/삭제/수정) 캐시를 비우고 다시 예열하며, 진행 상태는 ops 서버의 /health 로 알려줍니다.
+#
+#   python warmup.py                      # streamlit_app.py 를 예열 모드로 띄우고 준비될 때까지 기다림
+#   python warmup.py --port 8501 -- --server.address 0.0.0.0
+#   EXPLORER_WARMUP=1 streamlit run streamlit_app.py   # 첫 세션이 열릴 때 예열 시작 (런처 없이)
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import urllib.request
+
+WARMUP_ENV = "EXPLORER_WARMUP"
+WATCH_INTERVAL = 5.0
+
+
+def enabled():
+    return os.environ.get(WARMUP_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+class Warmup:
+    # steps: [(이름, 함수)], fingerprint: 데이터 파일 지문 함수, invalidate: 데이터가 바뀌었을 때 캐시를 비우는 함수
+    def __init__(self, steps, fingerprint, invalidate=None, interval=WATCH_INTERVAL):
+        self.steps = steps
+        self.fingerprint = fingerprint
+        self.invalidate = invalidate
+        self.interval = interval
+        self.state = "idle"
+        self.runs = 0
+        self.timings = {}
+        self.errors = {}
+        self.started_at = time.time()
+        self.finished_at = None
+        self.data_changed_at = None
+        self._fingerprint = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="warmup", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def run_once(self):
+        with self._lock:
+            self.state = "warming"
+            self.timings, self.errors = {}, {}
+        self._fingerprint = self.fingerprint()
+        for name, step in self.steps:
+            started = time.perf_counter()
+            try:
+                step()
+            except Exception as e:
+                self.errors[name] = f"{type(e).__name__}: {e}"
+                traceback.print_exc()
+            self.timings[name] = round(time.perf_counter() - started, 3)
+        with self._lock:
+            self.runs += 1
+            self.finished_at = time.time()
+            self.state = "degraded" if self.errors else "ready"
+
+    def _loop(self):
+        self.run_once()
+        while not self._stop.wait(self.interval):
+            try:
+                current = self.fingerprint()
+            except OSError:
+                continue
+            if current != self._fingerprint:
+                self.data_changed_at = time.time()
+                if self.invalidate is not None:
+                    self.invalidate()
+                self.run_once()
+
+    # /health 응답: 예열이 끝났으면 200, 진행 중이거나 단계가 실패했으면 503
+    def health(self):
+        with self._lock:
+            payload = {
+                "status": self.state,
+                "ready": self.state == "ready",
+                "runs": self.runs,
+                "uptime_s": round(time.time() - self.started_at, 1),
+                "last_warmup_at": self.finished_at,
+                "data_changed_at": self.data_changed_at,
+                "step_seconds": dict(self.timings),
+                "errors": dict(self.errors),
+            }
+        return (200 if payload["ready"] else 503), payload
+
+
+# 런처: 예열 모드로 서버를 띄우고, 세션 하나를 잠깐 열어 앱 모듈을 로드(= 예열 시작)시킨 뒤 준비될 때까지 기다림
+def _open_session(port):
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from websockets.sync.client import connect
+
+    msg = BackMsg()
+    msg.rerun_script.query_string = ""
+    msg.rerun_script.page_script_hash = ""
+    with connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None) as ws:
+        ws.send(msg.SerializeToString())
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(ws.recv(timeout=120))
+            if fwd.WhichOneof("type") == "script_finished":
+                return
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url, timeout=2) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+    except OSError:
+        return None, b""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="streamlit_app.py 를 캐시 예열 모드로 실행합니다.")
+    parser.add_argument("--port", type=int, default=8501, help="Streamlit 포트 (기본 8501)")
+    parser.add_argument("--ops-port", type=int, default=8503, help="/health 엔드포인트 포트 (기본 8503)")
+    parser.add_argument("streamlit_args", nargs="*", help="streamlit run 에 그대로 넘길 인자 (-- 뒤에)")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ, **{WARMUP_ENV: "1", "EXPLORER_OPS_PORT": str(args.ops_port)})
+    proc = subprocess.Popen([sys.executable, "-m", "streamlit", "run", "streamlit_app.py", "--server.headless", "true",
+                             "--server.port", str(args.port), *args.streamlit_args], env=env)
+    try:
+        for _ in range(120):
+            if _get(f"http://127.0.0.1:{args.port}/_stcore/health")[0] == 200:
+                break
+            time.sleep(0.5)
+        _open_session(args.port)
+
+        started = time.perf_counter()
+        while proc.poll() is None:
+            status, body = _get(f"http://127.0.0.1:{args.ops_port}/health")
+            health = json.loads(body) if status else None
+            if health and health["status"] in ("ready", "degraded"):
+                steps = ", ".join(f"{name} {sec:.2f}s" for name, sec in health["step_seconds"].items())
+                print(f"🔥 예열 완료 ({health['status']}, {time.perf_counter() - started:.1f}s): {steps}")
+                for name, error in health["errors"].items():
+                    print(f"   ❌ {name}: {error}")
+                break
+            time.sleep(0.5)
+        return proc.wait()
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    sys.exit(main())